@@ -4,6 +4,8 @@ from fastapi import HTTPException
 from ulid import ULID
 
 from application.base_service import BaseService
+from application.request_access_service import RequestAccessService
+from application.user_loader import UserLoader
 from domain.repository.approval_line_repo import IApprovalLineRepository
 from domain.repository.approval_request_repo import IApprovalRequestRepository
 from domain.repository.user_repo import IUserRepository
@@ -18,8 +20,11 @@ class ApprovalLineService(BaseService[ApprovalLine]):
         line_repo: IApprovalLineRepository,
         approval_repo: IApprovalRequestRepository,
         user_repo: IUserRepository,
+        access_service: RequestAccessService,
+        user_loader: UserLoader,
     ):
-        super().__init__(user_repo)
+        super().__init__(user_repo, user_loader)
+        self.access_service = access_service
         self.line_repo = line_repo
         self.approval_repo = approval_repo
         self.ulid = ULID()
@@ -75,6 +80,7 @@ class ApprovalLineService(BaseService[ApprovalLine]):
         
         # 한 번에 저장
         await self.line_repo.bulk_save(approval_lines)
+        await self.access_service.invalidate(request_id)
 
         return approval_lines
 
@@ -119,6 +125,7 @@ class ApprovalLineService(BaseService[ApprovalLine]):
         )
 
         await self.line_repo.save(line)
+        await self.access_service.invalidate(request_id)
         return line
     
     async def bulk_add_approval_lines(
@@ -164,6 +171,7 @@ class ApprovalLineService(BaseService[ApprovalLine]):
         
         # 한 번에 저장
         await self.line_repo.bulk_save(lines_to_create)
+        await self.access_service.invalidate(request_id)
         return lines_to_create
 
     async def remove_approval_line(
@@ -188,6 +196,7 @@ class ApprovalLineService(BaseService[ApprovalLine]):
             raise HTTPException(status_code=400, detail="Cannot modify approval lines after approval process started")
 
         await self.line_repo.delete_by_request_id(line_id)
+        await self.access_service.invalidate(line.request_id)
 
     async def get_my_pending_approvals(self, approver_id: str) -> List[ApprovalLine]:
         return await self.line_repo.find_pending_by_approver(approver_id)
@@ -196,22 +205,4 @@ class ApprovalLineService(BaseService[ApprovalLine]):
         return await self.line_repo.find_by_approver_id(approver_id)
 
     async def _validate_request_access(self, request_id: str, user_id: str) -> None:
-        request = await self.approval_repo.find_by_id(request_id)
-        if not request:
-            raise HTTPException(status_code=404, detail="Approval request not found")
-        
-        # 기안자인지 확인
-        if request.requester_id == user_id:
-            return
-        
-        # 결재자인지 확인
-        approval_lines = await self.line_repo.find_by_request_id(request_id)
-        is_approver = any(line.approver_id == user_id for line in approval_lines)
-        
-        if not is_approver:
-            # 관리자인지 확인
-            user = await self.validate_user_exists(user_id)
-            is_admin = any(role.value == "ADMIN" for role in user.roles)
-            
-            if not is_admin:
-                raise HTTPException(status_code=403, detail="No permission to view this request")
\ No newline at end of file
+        await self.access_service.ensure_access(request_id, user_id, "No permission to view this request")
\ No newline at end of file
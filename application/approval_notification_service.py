@@ -1,6 +1,7 @@
 from typing import Dict, List, Optional
 from utils.time import get_kst_now
-from application.websocket_manager import WebSocketManager
+from application.notification_aggregator import NotificationAggregator
+from application.notification_bus import UserNotificationBus
 from domain.repository.approval_line_repo import IApprovalLineRepository
 from domain.repository.approval_request_repo import IApprovalRequestRepository
 from infra.db_models.approval_request import ApprovalRequest
@@ -10,11 +11,15 @@ from infra.db_models.payment_task import PaymentTask
 class ApprovalNotificationService:
     def __init__(
         self,
-        websocket_manager: WebSocketManager,
+        notification_bus: UserNotificationBus,
+        notification_aggregator: NotificationAggregator,
         approval_line_repo: IApprovalLineRepository,
         approval_request_repo: IApprovalRequestRepository
     ):
-        self.websocket_manager = websocket_manager
+        # 사용자가 어느 프로세스에 연결돼 있든 전달되도록 Redis 알림 버스로 보낸다
+        self.notification_bus = notification_bus
+        # 결재 이벤트 알림은 짧게 모아서 사용자당 한 번, 대기 건수는 한 번에 계산해서 보낸다
+        self.notification_aggregator = notification_aggregator
         self.approval_line_repo = approval_line_repo
         self.approval_request_repo = approval_request_repo
 
@@ -23,7 +28,7 @@ class ApprovalNotificationService:
         return await self.approval_line_repo.find_pending_count_by_approver(user_id)
 
     async def notify_pending_count(self, user_id: str):
-        """특정 사용자에게 대기 결재 건수 알림"""
+        """특정 사용자에게 대기 결재 건수 바로 알림 (웹소켓 연결/새로고침 요청용)"""
         count = await self.get_pending_count(user_id)
         message = {
             "type": "approval_pending_count",
@@ -33,10 +38,10 @@ class ApprovalNotificationService:
                 "timestamp": get_kst_now().isoformat()
             }
         }
-        success = await self.websocket_manager.send_to_user(user_id, message)
-        if not success:
-            # 로그는 websocket_manager에서 이미 기록됨
-            pass
+        # 대기 건수는 다시 계산할 수 있으므로 inbox에 남기지 않고, 못 보낸 이전 건수는 덮어쓴다
+        await self.notification_bus.publish(
+            user_id, message, persist=False, coalesce_key="approval_pending_count"
+        )
 
     async def notify_new_approval_request(self, request: ApprovalRequest, approvers: List[str]):
         """새로운 결재 요청을 결재자들에게 알림"""
@@ -54,10 +59,9 @@ class ApprovalNotificationService:
             }
         }
 
-        # 각 결재자에게 개별 알림
+        # 각 결재자에게 알림 (대기 건수도 업데이트)
         for approver_id in approvers:
-            await self.websocket_manager.send_to_user(approver_id, message)
-            await self.notify_pending_count(approver_id)  # 대기 건수도 업데이트
+            self.notification_aggregator.add(approver_id, message, refresh_pending_count=True)
 
     async def notify_approval_status_changed(self, request_id: str, status: str, approver_id: str):
         """결재 상태 변경을 관련자들에게 알림"""
@@ -78,10 +82,10 @@ class ApprovalNotificationService:
             }
         }
         
-        await self.websocket_manager.send_to_user(request.requester_id, message)
+        self.notification_aggregator.add(request.requester_id, message)
 
         # 결재자의 대기 건수 업데이트
-        await self.notify_pending_count(approver_id)
+        self.notification_aggregator.add(approver_id, refresh_pending_count=True)
 
         # 다음 결재자가 있다면 알림
         if status == "APPROVED":
@@ -110,10 +114,9 @@ class ApprovalNotificationService:
             }
         }
 
-        # 모든 관련자에게 알림
+        # 모든 관련자에게 알림 (대기 건수 업데이트)
         for user_id in all_users:
-            await self.websocket_manager.send_to_user(user_id, message)
-            await self.notify_pending_count(user_id)  # 대기 건수 업데이트
+            self.notification_aggregator.add(user_id, message, refresh_pending_count=True)
 
     async def notify_payment_task_assigned(self, task: PaymentTask):
         """납부 업무를 담당자에게 전달한다."""
@@ -127,7 +130,7 @@ class ApprovalNotificationService:
                 "timestamp": get_kst_now().isoformat(),
             },
         }
-        await self.websocket_manager.send_to_user(task.assignee_id, message)
+        await self.notification_bus.publish(task.assignee_id, message)
 
     async def get_next_approvers(self, request: ApprovalRequest) -> List[str]:
         """다음 결재자 목록 조회"""
@@ -161,5 +164,4 @@ class ApprovalNotificationService:
         }
 
         for user_id in all_users:
-            await self.websocket_manager.send_to_user(user_id, message)
-            await self.notify_pending_count(user_id)  # 대기 건수 업데이트
+            self.notification_aggregator.add(user_id, message, refresh_pending_count=True)
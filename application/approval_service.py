@@ -11,6 +11,14 @@ from application.approval_notification_service import ApprovalNotificationServic
 from application.file_attachment_service import FileAttachmentService
 from application.integrity_service import IntegrityService
 from application.legal_archive_service import LegalArchiveService
+from application.request_access_service import RequestAccessService
+from application.user_loader import UserLoader
+from application.job_queue_service import (
+    JobQueueService,
+    DOCUMENT_INTEGRITY_JOB,
+    LEGAL_ARCHIVE_JOB,
+    job_key,
+)
 from common.db import client
 from domain.repository.approval_request_repo import IApprovalRequestRepository
 from domain.repository.approval_line_repo import IApprovalLineRepository
@@ -20,7 +28,8 @@ from domain.repository.user_repo import IUserRepository
 from domain.approval_request import ApprovalRequest
 from domain.approval_line import ApprovalLine
 from domain.approval_history import ApprovalHistory
-from common.auth import DocumentStatus, ApprovalStatus, ApprovalAction
+from common.auth import DocumentStatus, ApprovalStatus, ApprovalAction, SYSTEM_USER_ID
+from utils.logger import logger
 from utils.time import get_utc_now_naive
 
 
@@ -37,8 +46,11 @@ class ApprovalService(BaseService[ApprovalRequest]):
         file_service: FileAttachmentService,
         integrity_service: IntegrityService,
         legal_archive_service: LegalArchiveService,
+        job_queue_service: JobQueueService,
+        access_service: RequestAccessService,
+        user_loader: UserLoader,
     ):
-        super().__init__(user_repo)
+        super().__init__(user_repo, user_loader)
         self.approval_repo = approval_repo
         self.line_repo = line_repo
         self.history_repo = history_repo
@@ -47,6 +59,8 @@ class ApprovalService(BaseService[ApprovalRequest]):
         self.file_service = file_service
         self.integrity_service = integrity_service
         self.legal_archive_service = legal_archive_service
+        self.job_queue_service = job_queue_service
+        self.access_service = access_service
         self.ulid = ULID()
 
     async def create_approval_request(
@@ -212,7 +226,7 @@ class ApprovalService(BaseService[ApprovalRequest]):
         result = await self.approval_repo.update(request)
 
         # 웹소켓 알림 전송
-        await self.notification_service.notify_approval_cancelled(request_id)
+        await self.notification_service.notify_approval_cancelled(result)
 
         return result
 
@@ -263,10 +277,10 @@ class ApprovalService(BaseService[ApprovalRequest]):
 
                     await self.approval_repo.update(request)
 
-                    # 기존 결재선 삭제 및 재생성
-                    from infra.db_models.approval_line import ApprovalLine as ApprovalLineDoc
-                    await ApprovalLineDoc.find({"request_id": request_id}).delete()
+                    # 기존 결재선 삭제 및 재생성 (결재선/대기 건수 캐시도 같이 무효화)
+                    await self.line_repo.delete_by_request_id(request_id)
                     await self._create_approval_lines_from_data(request_id, approval_lines_data)
+                    await self.access_service.invalidate(request_id)
                     
                     # 파일 삭제
                     for file_id in deleted_file_ids:
@@ -304,8 +318,7 @@ class ApprovalService(BaseService[ApprovalRequest]):
                         await self.file_service.delete_file(file.id, requester_id)
 
                     # 결재선 삭제
-                    from infra.db_models.approval_line import ApprovalLine as ApprovalLineDoc
-                    await ApprovalLineDoc.find({"request_id": request_id}).delete()
+                    await self.line_repo.delete_by_request_id(request_id)
 
                     # 결재 내역 삭제
                     from infra.db_models.approval_history import ApprovalHistory as ApprovalHistoryDoc
@@ -314,6 +327,7 @@ class ApprovalService(BaseService[ApprovalRequest]):
                     # 원본 요청서 삭제
                     from infra.db_models.approval_request import ApprovalRequest as ApprovalRequestDoc
                     await ApprovalRequestDoc.find(ApprovalRequestDoc.id == request_id).delete()
+                    await self.access_service.invalidate(request_id)
 
                 except Exception as e:
                     raise HTTPException(status_code=500, detail=f"Failed to delete approval request: {str(e)}")
@@ -590,17 +604,7 @@ class ApprovalService(BaseService[ApprovalRequest]):
             raise HTTPException(status_code=404, detail="Approval request not found")
         
         # 권한 확인 (기안자, 결재자, 관리자만 조회 가능)
-        user = await self.validate_user_exists(user_id)
-        if request.requester_id != user_id:
-            # 결재자인지 확인
-            approval_lines = await self.line_repo.find_by_request_id(request_id)
-            is_approver = any(line.approver_id == user_id for line in approval_lines)
-            
-            # 관리자인지 확인
-            is_admin = any(role.value == "ADMIN" for role in user.roles)
-            
-            if not is_approver and not is_admin:
-                raise HTTPException(status_code=403, detail="No permission to view this request")
+        await self.access_service.ensure_access(request_id, user_id, "No permission to view this request")
         
         # 히스토리 정보 추가
         histories = await self.history_repo.find_by_request_id(request_id)
@@ -736,7 +740,7 @@ class ApprovalService(BaseService[ApprovalRequest]):
         ip_address: Optional[str] = None,
     ) -> None:
         # approver 이름 조회
-        approver = await self.user_repo.find_by_user_id(approver_id)
+        approver = await self.validate_user_exists(approver_id)
         approver_name = approver.name
         
         history = ApprovalHistory(
@@ -779,26 +783,22 @@ class ApprovalService(BaseService[ApprovalRequest]):
         if old_status != request.status and request.status in [DocumentStatus.APPROVED, DocumentStatus.REJECTED]:
             await self.notification_service.notify_approval_completed(request, request.status)
             
-            # 승인 완료된 경우에만 법적 효력 처리
+            # 승인 완료된 경우에만 법적 효력 처리 (워커가 비동기로 처리, 결재 응답은 바로 반환)
             if request.status == DocumentStatus.APPROVED:
-                try:
-                    # 문서 무결성 기록 생성
-                    await self.integrity_service.create_document_integrity(
-                        request_id=request_id,
-                        created_by="system"  # 시스템 자동 생성
-                    )
-                    
-                    # 법적 문서 생성 및 보관
-                    await self.legal_archive_service.create_legal_document(
-                        request_id=request_id,
-                        created_by="system"
-                    )
-                    
-                except Exception as e:
-                    # 법적 효력 처리 실패 시 로그 기록 (결재 자체는 완료 상태 유지)
-                    print(f"Failed to create legal archive for request {request_id}: {str(e)}")
-                    # TODO: 적절한 로깅 시스템으로 교체
-    
+                await self._enqueue_legal_archive_jobs(request_id)
+
+    async def _enqueue_legal_archive_jobs(self, request_id: str) -> None:
+        """무결성 기록과 법적 문서 생성을 작업 큐에 등록 (request_id별 한 번만 등록)"""
+        payload = {"request_id": request_id, "created_by": SYSTEM_USER_ID}
+        for job_type in (DOCUMENT_INTEGRITY_JOB, LEGAL_ARCHIVE_JOB):
+            try:
+                await self.job_queue_service.enqueue(
+                    job_type, payload, idempotency_key=job_key(job_type, request_id)
+                )
+            except Exception as e:
+                # 작업 등록 실패 시에도 결재 자체는 완료 상태 유지 (수동 생성 API로 복구 가능)
+                logger.error(f"Failed to enqueue {job_type} job for request {request_id}: {e}")
+
     def _group_lines_by_request(self, all_lines: List) -> Dict[str, List]:
         """결재선들을 request_id별로 그룹화"""
         from collections import defaultdict
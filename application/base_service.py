@@ -2,6 +2,9 @@ from abc import ABC
 from typing import TypeVar, Generic, Optional, List, Dict
 from fastapi import HTTPException
 
+from application.user_loader import UserLoader
+from common.auth import Role, SYSTEM_USER_ID
+from common.exceptions import NotFoundError, PermissionError, ValidationError
 from domain.user import User
 from domain.repository.user_repo import IUserRepository
 
@@ -11,8 +14,10 @@ T = TypeVar('T')
 class BaseService(ABC, Generic[T]):
     """Base service class providing common functionality for all services."""
     
-    def __init__(self, user_repo: IUserRepository):
+    def __init__(self, user_repo: IUserRepository, user_loader: Optional[UserLoader] = None):
         self.user_repo = user_repo
+        # 읽기 전용 사용자 조회를 모아서 처리 (없으면 user_repo로 바로 조회)
+        self.user_loader = user_loader
     
     async def validate_user_exists(self, user_id: str) -> User:
         """Validate that a user exists and return the user object.
@@ -26,11 +31,33 @@ class BaseService(ABC, Generic[T]):
         Raises:
             HTTPException: 404 if user is not found
         """
-        user = await self.user_repo.find_by_user_id(user_id)
+        if self.user_loader:
+            user = await self.user_loader.load(user_id)
+        else:
+            user = await self.user_repo.find_by_user_id(user_id)
         if not user:
             raise NotFoundError(f"User not found: {user_id}")
         return user
     
+    async def validate_principal(self, user_id: str) -> Optional[User]:
+        """Validate the actor of a write operation.
+        
+        The system principal (background jobs, scheduler) is not a stored user,
+        so it passes without a DB lookup and None is returned.
+        
+        Args:
+            user_id: The user_id field of the actor, or SYSTEM_USER_ID
+            
+        Returns:
+            Optional[User]: The user object, or None for the system principal
+            
+        Raises:
+            HTTPException: 404 if a non-system user is not found
+        """
+        if user_id == SYSTEM_USER_ID:
+            return None
+        return await self.validate_user_exists(user_id)
+    
     async def validate_user_is_admin(self, user_id: str) -> User:
         """Validate that a user exists and is an admin.
         
@@ -44,7 +71,7 @@ class BaseService(ABC, Generic[T]):
             HTTPException: 404 if user is not found, 403 if not admin
         """
         user = await self.validate_user_exists(user_id)
-        if not user.is_admin:
+        if Role.ADMIN not in user.roles:
             raise PermissionError("Admin privileges required")
         return user
     
@@ -84,10 +111,12 @@ class BaseService(ABC, Generic[T]):
         unique_user_ids = list(set(user_ids))
         
         # 한 번에 모든 사용자 조회
-        users = await self.user_repo.find_by_user_ids(unique_user_ids)
-        
-        # 딕셔너리로 변환
-        users_dict = {user.user_id: user for user in users}
+        if self.user_loader:
+            users_dict = await self.user_loader.load_many(unique_user_ids)
+        else:
+            users = await self.user_repo.find_by_user_ids(unique_user_ids)
+            # 딕셔너리로 변환
+            users_dict = {user.user_id: user for user in users}
         
         # 누락된 사용자 체크
         missing_users = [user_id for user_id in unique_user_ids if user_id not in users_dict]
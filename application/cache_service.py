@@ -1,89 +1,198 @@
 """
 Redis 캐싱 서비스
 자주 조회되는 데이터의 캐싱을 담당합니다.
+
+enabled=False(settings.cache_enabled)이면 조회/저장은 건너뛰고 무효화만 수행한다.
+꺼져 있는 동안의 쓰기가 다시 켰을 때 오래된 캐시로 남지 않게 하기 위해서다.
+
+자주 읽고 거의 바뀌지 않는 데이터(사용자, 양식, 폴더 권한)는 프로세스 메모리(LocalCache)를
+먼저 보고 Redis, DB 순서로 내려간다. 무효화는 Redis pub/sub(CACHE_INVALIDATION_CHANNEL)으로
+다른 프로세스에도 전달하며, 메시지를 놓쳐도 메모리 캐시는 짧은 TTL 뒤에 사라진다.
 """
+import asyncio
 import json
 import logging
+import time
+import uuid
+from collections import defaultdict
 from typing import Optional, Any, Dict, List
-from datetime import timedelta
+from datetime import datetime, timedelta
 
 from redis.asyncio import Redis
 from pydantic import BaseModel
 
+from common.auth import ApprovalStatus, Role
+from domain.user import User
+from utils.local_cache import LocalCache
+from utils.settings import settings
+
 
 logger = logging.getLogger(__name__)
 
+CACHE_INVALIDATION_CHANNEL = "cache_invalidation_channel"
+USER_CACHE = "user"
+
 
 class CacheService:
-    def __init__(self, redis: Redis):
+    def __init__(
+        self,
+        redis: Redis,
+        enabled: bool = True,
+        local_max_entries: int = settings.local_cache_max_entries,
+        local_ttl_seconds: float = settings.local_cache_ttl_seconds,
+    ):
         self.redis = redis
+        self.enabled = enabled
+        self.local = LocalCache(local_max_entries, local_ttl_seconds)
+        # 내가 보낸 무효화 메시지는 이미 적용했으므로 구독에서 건너뛴다
+        self.instance_id = uuid.uuid4().hex
+        # 캐시 종류별, 계층(local/redis)별 hit/miss/error 횟수 (프로세스 단위)
+        self._metrics: Dict[str, Dict[str, Dict[str, int]]] = defaultdict(
+            lambda: defaultdict(lambda: {"hits": 0, "misses": 0, "errors": 0})
+        )
+    
+    def _record(self, namespace: str, hits: int = 0, misses: int = 0, errors: int = 0, tier: str = "redis") -> None:
+        counters = self._metrics[namespace][tier]
+        counters["hits"] += hits
+        counters["misses"] += misses
+        counters["errors"] += errors
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """캐시 종류별, 계층별 hit/miss/error 횟수와 적중률
+        
+        redis 계층은 local에서 miss난 조회만 센다.
+        """
+        namespaces = {}
+        for namespace, tiers in self._metrics.items():
+            namespaces[namespace] = {}
+            for tier, counters in tiers.items():
+                lookups = counters["hits"] + counters["misses"]
+                namespaces[namespace][tier] = {
+                    **counters,
+                    "hit_rate": round(counters["hits"] / lookups, 4) if lookups else None,
+                }
+        return {
+            "enabled": self.enabled,
+            "local": {"entries": len(self.local), "max_entries": self.local.max_entries},
+            "namespaces": namespaces,
+        }
+    
+    @staticmethod
+    def serialize_user(user_doc) -> Dict[str, Any]:
+        """사용자 캐시 데이터 (비밀번호 해시는 캐시하지 않는다)"""
+        return {
+            "id": user_doc.id,
+            "user_id": user_doc.user_id,
+            "name": user_doc.name,
+            "roles": [str(role) for role in user_doc.roles],
+            "approval_status": user_doc.approval_status,
+            "created_at": user_doc.created_at.isoformat(),
+            "updated_at": user_doc.updated_at.isoformat(),
+        }
+
+    @staticmethod
+    def deserialize_user(data: Dict[str, Any]) -> User:
+        """캐시 데이터 -> 읽기 전용 domain User (비밀번호가 없으므로 password는 빈 문자열)"""
+        return User(
+            id=data["id"],
+            user_id=data["user_id"],
+            password="",
+            created_at=datetime.fromisoformat(data["created_at"]),
+            updated_at=datetime.fromisoformat(data["updated_at"]),
+            roles=[Role(role) for role in data["roles"]],
+            name=data.get("name"),
+            approval_status=ApprovalStatus(data["approval_status"]) if data.get("approval_status") else None,
+        )
     
     # 사용자 정보 캐싱
     async def get_user_by_id(self, user_id: str) -> Optional[Dict[str, Any]]:
         """캐시된 사용자 정보 조회"""
+        if not self.enabled:
+            return None
+        hit, user_data = self.local.get(USER_CACHE, user_id)
+        if hit:
+            self._record(USER_CACHE, hits=1, tier="local")
+            return user_data
+        self._record(USER_CACHE, misses=1, tier="local")
+        
         cache_key = f"user:{user_id}"
         try:
             cached_data = await self.redis.get(cache_key)
             if cached_data:
-                return json.loads(cached_data)
+                self._record(USER_CACHE, hits=1)
+                user_data = json.loads(cached_data)
+                self.local.set(USER_CACHE, user_id, user_data)
+                return user_data
         except Exception as e:
+            self._record(USER_CACHE, errors=1)
             logger.error(f"캐시 조회 실패 (user_id={user_id}): {e}")
+        self._record(USER_CACHE, misses=1)
         return None
     
     async def set_user_cache(self, user_id: str, user_data: Dict[str, Any], ttl: int = 1800) -> None:
         """사용자 정보 캐시 저장 (기본 30분 TTL)"""
+        if not self.enabled:
+            return
         cache_key = f"user:{user_id}"
         try:
-            await self.redis.setex(
-                cache_key, 
-                ttl, 
-                json.dumps(user_data, default=str)  # datetime 등 처리
-            )
+            payload = json.dumps(user_data, default=str)  # datetime 등 처리
+            self.local.set(USER_CACHE, user_id, json.loads(payload), ttl)
+            await self.redis.setex(cache_key, ttl, payload)
         except Exception as e:
             logger.error(f"캐시 저장 실패 (user_id={user_id}): {e}")
     
     async def invalidate_user_cache(self, user_id: str) -> None:
-        """사용자 캐시 무효화"""
+        """사용자 캐시 무효화 (다른 프로세스의 메모리 캐시 포함)"""
+        self.local.delete(USER_CACHE, user_id)
         cache_key = f"user:{user_id}"
         try:
             await self.redis.delete(cache_key)
         except Exception as e:
             logger.error(f"캐시 무효화 실패 (user_id={user_id}): {e}")
+        await self._publish_invalidation(USER_CACHE, user_id)
     
     # 여러 사용자 정보 일괄 캐싱
     async def get_users_by_user_ids(self, user_ids: List[str]) -> Dict[str, Dict[str, Any]]:
         """여러 사용자 정보 일괄 조회"""
-        if not user_ids:
+        if not user_ids or not self.enabled:
             return {}
         
-        cache_keys = [f"user:{user_id}" for user_id in user_ids]
         result = {}
+        for user_id in user_ids:
+            hit, user_data = self.local.get(USER_CACHE, user_id)
+            if hit:
+                result[user_id] = user_data
+        missing = [user_id for user_id in user_ids if user_id not in result]
+        self._record(USER_CACHE, hits=len(result), misses=len(missing), tier="local")
+        if not missing:
+            return result
         
+        found = 0
         try:
-            cached_values = await self.redis.mget(cache_keys)
-            for i, cached_data in enumerate(cached_values):
+            cached_values = await self.redis.mget([f"user:{user_id}" for user_id in missing])
+            for user_id, cached_data in zip(missing, cached_values):
                 if cached_data:
-                    user_id = user_ids[i]
                     result[user_id] = json.loads(cached_data)
+                    self.local.set(USER_CACHE, user_id, result[user_id])
+                    found += 1
         except Exception as e:
+            self._record(USER_CACHE, errors=1)
             logger.error(f"일괄 캐시 조회 실패: {e}")
         
+        self._record(USER_CACHE, hits=found, misses=len(missing) - found)
         return result
     
     async def set_users_by_user_ids_cache(self, users_data: Dict[str, Dict[str, Any]], ttl: int = 1800) -> None:
         """여러 사용자 정보 일괄 캐시 저장"""
-        if not users_data:
+        if not users_data or not self.enabled:
             return
         
         try:
             pipeline = self.redis.pipeline()
             for user_id, user_data in users_data.items():
-                cache_key = f"user:{user_id}"
-                pipeline.setex(
-                    cache_key, 
-                    ttl, 
-                    json.dumps(user_data, default=str)
-                )
+                payload = json.dumps(user_data, default=str)
+                self.local.set(USER_CACHE, user_id, json.loads(payload), ttl)
+                pipeline.setex(f"user:{user_id}", ttl, payload)
             await pipeline.execute()
         except Exception as e:
             logger.error(f"일괄 캐시 저장 실패: {e}")
@@ -91,17 +200,24 @@ class CacheService:
     # 결재선 정보 캐싱
     async def get_approval_line_cache(self, request_id: str) -> Optional[List[Dict[str, Any]]]:
         """결재선 정보 캐시 조회"""
+        if not self.enabled:
+            return None
         cache_key = f"approval_line:{request_id}"
         try:
             cached_data = await self.redis.get(cache_key)
             if cached_data:
+                self._record("approval_line", hits=1)
                 return json.loads(cached_data)
         except Exception as e:
+            self._record("approval_line", errors=1)
             logger.error(f"결재선 캐시 조회 실패 (request_id={request_id}): {e}")
+        self._record("approval_line", misses=1)
         return None
     
     async def set_approval_line_cache(self, request_id: str, lines_data: List[Dict[str, Any]], ttl: int = 3600) -> None:
         """결재선 정보 캐시 저장 (1시간 TTL)"""
+        if not self.enabled:
+            return
         cache_key = f"approval_line:{request_id}"
         try:
             await self.redis.setex(
@@ -121,55 +237,127 @@ class CacheService:
             logger.error(f"결재선 캐시 무효화 실패 (request_id={request_id}): {e}")
     
     # 카운트 정보 캐싱
+    # 사용자별 해시 하나(count:{user_id})에 종류별 필드로 저장한다. 무효화는 키 하나 DEL이라
+    # 전체 키 공간을 SCAN하던 방식과 달리 키 개수와 상관없이 O(1)이다.
+    # 필드마다 TTL을 걸 수 없으므로 값에 만료 시각을 함께 넣고 조회 시 확인한다.
+    @staticmethod
+    def _count_cache_key(user_id: str) -> str:
+        return f"count:{user_id}"
+    
+    @staticmethod
+    def _encode_count(count: int, ttl: int, now: Optional[float] = None) -> str:
+        expires_at = int((time.time() if now is None else now) + ttl)
+        return f"{count}:{expires_at}"
+    
+    @staticmethod
+    def _decode_count(value: Any, now: Optional[float] = None) -> Optional[int]:
+        """만료됐거나 형식이 맞지 않으면 None"""
+        if isinstance(value, bytes):
+            value = value.decode()
+        count, _, expires_at = str(value).partition(":")
+        try:
+            if int(expires_at) <= (time.time() if now is None else now):
+                return None
+            return int(count)
+        except ValueError:
+            return None
+    
     async def get_count_cache(self, cache_type: str, user_id: str) -> Optional[int]:
         """카운트 정보 캐시 조회 (대기, 진행중, 완료 등)"""
-        cache_key = f"count:{cache_type}:{user_id}"
+        if not self.enabled:
+            return None
         try:
-            cached_data = await self.redis.get(cache_key)
+            cached_data = await self.redis.hget(self._count_cache_key(user_id), cache_type)
             if cached_data:
-                return int(cached_data)
+                count = self._decode_count(cached_data)
+                if count is not None:
+                    self._record("count", hits=1)
+                    return count
         except Exception as e:
+            self._record("count", errors=1)
             logger.error(f"카운트 캐시 조회 실패 ({cache_type}, {user_id}): {e}")
+        self._record("count", misses=1)
         return None
     
     async def set_count_cache(self, cache_type: str, user_id: str, count: int, ttl: int = 600) -> None:
         """카운트 정보 캐시 저장 (10분 TTL)"""
-        cache_key = f"count:{cache_type}:{user_id}"
+        if not self.enabled:
+            return
+        cache_key = self._count_cache_key(user_id)
         try:
-            await self.redis.setex(cache_key, ttl, str(count))
+            pipeline = self.redis.pipeline()
+            pipeline.hset(cache_key, cache_type, self._encode_count(count, ttl))
+            # 해시 전체는 마지막 저장 기준 TTL 뒤에 사라진다 (필드별 만료는 값으로 판단)
+            pipeline.expire(cache_key, ttl)
+            await pipeline.execute()
         except Exception as e:
             logger.error(f"카운트 캐시 저장 실패 ({cache_type}, {user_id}): {e}")
     
-    async def invalidate_count_cache(self, user_id: str, chunk_size: int = 1000) -> None:
-        """특정 사용자의 모든 카운트 캐시 무효화"""
+    async def get_count_caches(self, cache_type: str, user_ids: List[str]) -> Dict[str, int]:
+        """여러 사용자의 카운트 캐시 일괄 조회 (캐시에 있는 사용자만 반환)"""
+        if not user_ids or not self.enabled:
+            return {}
+        result = {}
         try:
-            pattern = f"count:*:{user_id}"
-            keys = []
-            deleted_count = 0
-            
-            async for key in self.redis.scan_iter(match=pattern):
-                keys.append(key)
-                
-                # 청크 크기에 도달하면 삭제 실행
-                if len(keys) >= chunk_size:
-                    await self.redis.delete(*keys)
-                    deleted_count += len(keys)
-                    keys.clear()
-            
-            # 남은 키들 삭제
-            if keys:
-                await self.redis.delete(*keys)
-                deleted_count += len(keys)
-                
-            if deleted_count > 0:
-                logger.info(f"카운트 캐시 무효화 완료 (user_id={user_id}): {deleted_count}개")
+            pipeline = self.redis.pipeline()
+            for user_id in user_ids:
+                pipeline.hget(self._count_cache_key(user_id), cache_type)
+            for user_id, cached_data in zip(user_ids, await pipeline.execute()):
+                count = self._decode_count(cached_data) if cached_data else None
+                if count is not None:
+                    result[user_id] = count
+        except Exception as e:
+            self._record("count", errors=1)
+            logger.error(f"카운트 캐시 일괄 조회 실패 ({cache_type}): {e}")
+        self._record("count", hits=len(result), misses=len(user_ids) - len(result))
+        return result
+    
+    async def set_count_caches(self, cache_type: str, counts: Dict[str, int], ttl: int = 600) -> None:
+        """여러 사용자의 카운트 캐시 일괄 저장"""
+        if not counts or not self.enabled:
+            return
+        try:
+            pipeline = self.redis.pipeline()
+            for user_id, count in counts.items():
+                cache_key = self._count_cache_key(user_id)
+                pipeline.hset(cache_key, cache_type, self._encode_count(count, ttl))
+                pipeline.expire(cache_key, ttl)
+            await pipeline.execute()
+        except Exception as e:
+            logger.error(f"카운트 캐시 일괄 저장 실패 ({cache_type}): {e}")
+    
+    async def invalidate_count_cache(self, user_id: str, cache_type: Optional[str] = None) -> None:
+        """특정 사용자의 카운트 캐시 무효화 (cache_type을 주면 그 종류만)"""
+        cache_key = self._count_cache_key(user_id)
+        try:
+            if cache_type is None:
+                await self.redis.delete(cache_key)
+            else:
+                await self.redis.hdel(cache_key, cache_type)
         except Exception as e:
             logger.error(f"카운트 캐시 무효화 실패 (user_id={user_id}): {e}")
     
+    async def invalidate_count_caches(self, user_ids: List[str]) -> None:
+        """여러 사용자의 카운트 캐시를 DEL 한 번으로 무효화"""
+        if not user_ids:
+            return
+        try:
+            await self.redis.delete(*(self._count_cache_key(user_id) for user_id in user_ids))
+        except Exception as e:
+            logger.error(f"카운트 캐시 일괄 무효화 실패 ({len(user_ids)}명): {e}")
+    
     # 범용 캐시 메서드
-    async def get_cache(self, key: str) -> Optional[Any]:
+    # namespace를 주면 키에 세대 번호를 붙인다 (cache:{namespace}:{generation}:{key}).
+    # clear_namespace()는 세대 번호만 올리므로 O(1)이고, 이전 세대 키는 TTL로 사라진다.
+    async def _namespaced_key(self, namespace: str, key: str) -> str:
+        generation = await self.redis.get(f"cache_gen:{namespace}")
+        return f"cache:{namespace}:{int(generation or 0)}:{key}"
+    
+    async def get_cache(self, key: str, namespace: Optional[str] = None) -> Optional[Any]:
         """범용 캐시 조회"""
         try:
+            if namespace:
+                key = await self._namespaced_key(namespace, key)
             cached_data = await self.redis.get(key)
             if cached_data:
                 return json.loads(cached_data)
@@ -177,9 +365,11 @@ class CacheService:
             logger.error(f"캐시 조회 실패 (key={key}): {e}")
         return None
     
-    async def set_cache(self, key: str, data: Any, ttl: int = 1800) -> None:
+    async def set_cache(self, key: str, data: Any, ttl: int = 1800, namespace: Optional[str] = None) -> None:
         """범용 캐시 저장"""
         try:
+            if namespace:
+                key = await self._namespaced_key(namespace, key)
             await self.redis.setex(
                 key, 
                 ttl, 
@@ -188,15 +378,122 @@ class CacheService:
         except Exception as e:
             logger.error(f"캐시 저장 실패 (key={key}): {e}")
     
-    async def delete_cache(self, key: str) -> None:
+    async def delete_cache(self, key: str, namespace: Optional[str] = None) -> None:
         """캐시 삭제"""
         try:
+            if namespace:
+                key = await self._namespaced_key(namespace, key)
             await self.redis.delete(key)
         except Exception as e:
             logger.error(f"캐시 삭제 실패 (key={key}): {e}")
     
+    async def clear_namespace(self, namespace: str) -> None:
+        """namespace의 모든 범용 캐시 무효화 (세대 번호 증가, O(1))"""
+        try:
+            await self.redis.incr(f"cache_gen:{namespace}")
+        except Exception as e:
+            logger.error(f"캐시 namespace 무효화 실패 (namespace={namespace}): {e}")
+    
+    # 2단계 캐시 (메모리 → Redis)
+    # 값은 JSON으로 직렬화할 수 있어야 하고, 꺼낸 값은 공유되므로 수정하지 않는다.
+    async def get_tiered(self, namespace: str, key: str) -> Optional[Any]:
+        """메모리, Redis 순서로 조회 (없으면 None)"""
+        if not self.enabled:
+            return None
+        hit, value = self.local.get(namespace, key)
+        if hit:
+            self._record(namespace, hits=1, tier="local")
+            return value
+        self._record(namespace, misses=1, tier="local")
+        
+        try:
+            cached_data = await self.redis.get(await self._namespaced_key(namespace, key))
+            if cached_data:
+                self._record(namespace, hits=1)
+                value = json.loads(cached_data)
+                self.local.set(namespace, key, value)
+                return value
+        except Exception as e:
+            self._record(namespace, errors=1)
+            logger.error(f"캐시 조회 실패 ({namespace}, key={key}): {e}")
+        self._record(namespace, misses=1)
+        return None
+    
+    async def set_tiered(self, namespace: str, key: str, value: Any, ttl: int = 1800) -> None:
+        """메모리와 Redis에 저장 (메모리는 settings.local_cache_ttl_seconds를 넘지 않는다)"""
+        if not self.enabled:
+            return
+        payload = json.dumps(value, default=str)
+        self.local.set(namespace, key, json.loads(payload), ttl)
+        try:
+            await self.redis.setex(await self._namespaced_key(namespace, key), ttl, payload)
+        except Exception as e:
+            logger.error(f"캐시 저장 실패 ({namespace}, key={key}): {e}")
+    
+    async def invalidate_tiered(self, namespace: str, key: Optional[str] = None) -> None:
+        """key 하나 또는 namespace 전체 무효화 (모든 프로세스의 메모리 캐시 포함)"""
+        if key is None:
+            self.local.clear_namespace(namespace)
+            await self.clear_namespace(namespace)
+        else:
+            self.local.delete(namespace, key)
+            await self.delete_cache(key, namespace=namespace)
+        await self._publish_invalidation(namespace, key)
+    
+    async def _publish_invalidation(self, namespace: str, key: Optional[str]) -> None:
+        message = {"origin": self.instance_id, "namespace": namespace, "key": key}
+        try:
+            await self.redis.publish(CACHE_INVALIDATION_CHANNEL, json.dumps(message))
+        except Exception as e:
+            logger.error(f"캐시 무효화 메시지 전송 실패 ({namespace}, key={key}): {e}")
+    
+    def apply_invalidation(self, data: Any) -> None:
+        """다른 프로세스가 보낸 무효화 메시지를 메모리 캐시에 반영"""
+        try:
+            message = json.loads(data)
+        except (TypeError, ValueError):
+            logger.warning(f"잘못된 캐시 무효화 메시지: {data!r}")
+            return
+        if message.get("origin") == self.instance_id:
+            return
+        if message.get("key") is None:
+            self.local.clear_namespace(message["namespace"])
+        else:
+            self.local.delete(message["namespace"], message["key"])
+    
+    async def run_invalidation_listener(self, stop_event: asyncio.Event) -> None:
+        """stop_event가 설정될 때까지 무효화 채널을 구독한다
+        
+        연결이 끊기면 그 사이 메시지를 놓쳤을 수 있으므로 메모리 캐시를 비우고 다시 구독한다.
+        """
+        while not stop_event.is_set():
+            pubsub = self.redis.pubsub()
+            try:
+                await pubsub.subscribe(CACHE_INVALIDATION_CHANNEL)
+                while not stop_event.is_set():
+                    message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                    if message:
+                        self.apply_invalidation(message["data"])
+            except Exception as e:
+                logger.error(f"캐시 무효화 구독 오류: {e}")
+                self.local.clear()
+                try:
+                    await asyncio.wait_for(stop_event.wait(), timeout=1.0)
+                except asyncio.TimeoutError:
+                    pass
+            finally:
+                try:
+                    await pubsub.unsubscribe(CACHE_INVALIDATION_CHANNEL)
+                    await pubsub.close()
+                except Exception:
+                    pass
+    
     async def clear_pattern_cache(self, pattern: str, chunk_size: int = 1000) -> None:
-        """패턴에 맞는 모든 캐시 삭제"""
+        """패턴에 맞는 모든 캐시 삭제
+        
+        전체 키 공간을 SCAN하므로 키 개수에 비례해 느리다. 운영 점검용으로만 쓰고
+        요청 처리 중 무효화는 clear_namespace()나 키 단위 삭제를 사용한다.
+        """
         try:
             keys = []
             deleted_count = 0
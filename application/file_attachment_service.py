@@ -11,6 +11,8 @@ import zipfile
 from urllib.parse import quote
 
 from application.base_service import BaseService
+from application.request_access_service import RequestAccessService
+from application.user_loader import UserLoader
 from domain.repository.attached_file_repo import IAttachedFileRepository
 from domain.repository.approval_request_repo import IApprovalRequestRepository
 from common.exceptions import InternalServerError
@@ -30,8 +32,11 @@ class FileAttachmentService(BaseService[AttachedFile]):
         approval_repo: IApprovalRequestRepository,
         line_repo: IApprovalLineRepository,
         user_repo: IUserRepository,
+        access_service: RequestAccessService,
+        user_loader: UserLoader,
     ):
-        super().__init__(user_repo)
+        super().__init__(user_repo, user_loader)
+        self.access_service = access_service
         self.file_repo = file_repo
         self.approval_repo = approval_repo
         self.line_repo = line_repo
@@ -322,24 +327,4 @@ class FileAttachmentService(BaseService[AttachedFile]):
             raise HTTPException(status_code=500, detail=f"Failed to save file to GridFS: {str(e)}")
 
     async def _validate_request_access(self, request_id: str, user_id: str) -> None:
-        request = await self.approval_repo.find_by_id(request_id)
-        if not request:
-            raise HTTPException(status_code=404, detail="Approval request not found")
-        
-        # 기안자인지 확인
-        if request.requester_id == user_id:
-            return
-        
-        # 결재자인지 확인
-        approval_lines = await self.line_repo.find_by_request_id(request_id)
-        is_approver = any(line.approver_id == user_id for line in approval_lines)
-        
-        if is_approver:
-            return
-        
-        # 관리자인지 확인
-        user = await self.validate_user_exists(user_id)
-        is_admin = any(role.value == "ADMIN" for role in user.roles)
-        
-        if not is_admin:
-            raise HTTPException(status_code=403, detail="No permission to access this request")
+        await self.access_service.ensure_access(request_id, user_id, "No permission to access this request")
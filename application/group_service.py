@@ -13,7 +13,6 @@ from domain.responses.group_response import GroupResponse
 from ulid import ULID
 from infra.db_models.group import Group as GroupDocument
 from common.db import client
-from beanie.operators import And, In
 from common.exceptions import ConflictError, NotFoundError, PermissionError
 from utils.time import get_utc_now_naive
 
@@ -60,13 +59,14 @@ class GroupService(BaseService[Group]):
         return GroupResponse.from_document(group_doc)
 
     async def find(self, company: Company, id: str, roles: list[Role]):
-        filters = []
-        if Role.ADMIN not in roles:
-            filters.append(In(GroupDocument.auth_users, [id]))
-
-        filters.append(GroupDocument.company == company)
-
-        group_docs = await self.group_repo.find(And(*filters))
+        if Role.ADMIN in roles:
+            group_docs = await self.group_repo.find(GroupDocument.company == company)
+        else:
+            # 권한자별 그룹 목록은 캐시되므로 회사는 메모리에서 거른다
+            group_docs = [
+                group for group in await self.group_repo.find_by_auth_user(id)
+                if group.company == company
+            ]
         read_states = await self.folder_read_state_repo.find_by_user_and_group_ids(
             id,
             [group.id for group in group_docs],
@@ -90,7 +90,7 @@ class GroupService(BaseService[Group]):
         if Role.ADMIN in roles:
             return list(Company)
 
-        group_docs = await self.group_repo.find(In(GroupDocument.auth_users, [user_id]))
+        group_docs = await self.group_repo.find_by_auth_user(user_id)
         return list(dict.fromkeys(group.company for group in group_docs))
 
     async def mark_as_read(self, id: str, current_user_id: str, roles: list[Role]):
@@ -123,6 +123,9 @@ class GroupService(BaseService[Group]):
 
                 # Delete the group itself
 
+        # 트랜잭션 중에 다시 채워진 캐시가 남지 않도록 커밋 후 한 번 더 무효화
+        await self.group_repo.invalidate_cache()
+
     async def update(
         self,
         id: str,
@@ -135,7 +138,7 @@ class GroupService(BaseService[Group]):
         
         # Document를 직접 수정
         group_doc.name = name
-        updated_group_doc = await group_doc.save()
+        updated_group_doc = await self.group_repo.save_document(group_doc)
 
         return GroupResponse.from_document(updated_group_doc)
 
@@ -151,7 +154,7 @@ class GroupService(BaseService[Group]):
 
         # Document를 직접 수정
         group_doc.auth_users = auth_users
-        updated_group_doc = await group_doc.save()
+        updated_group_doc = await self.group_repo.save_document(group_doc)
 
         return GroupResponse.from_document(updated_group_doc)
     
@@ -184,6 +187,6 @@ class GroupService(BaseService[Group]):
         
         # Document를 직접 수정
         group_doc.auth_users = auth_users
-        updated_group_doc = await group_doc.save()
+        updated_group_doc = await self.group_repo.save_document(group_doc)
         
         return GroupResponse.from_document(updated_group_doc)
@@ -1,12 +1,16 @@
-import hashlib
-import json
-from datetime import datetime
+import asyncio
+import multiprocessing
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone as dt_timezone
 from typing import Optional, Dict, Any, List, Tuple
 from dependency_injector.wiring import inject
 from fastapi import HTTPException
 from ulid import ULID
 
 from application.base_service import BaseService
+from application.request_access_service import RequestAccessService
+from common.auth import SYSTEM_USER_ID
 from domain.repository.document_integrity_repo import IDocumentIntegrityRepository
 from domain.repository.approval_request_repo import IApprovalRequestRepository
 from domain.repository.approval_line_repo import IApprovalLineRepository
@@ -15,10 +19,32 @@ from domain.repository.user_repo import IUserRepository
 from domain.document_integrity import (
     DocumentIntegrityResponse, 
     DocumentIntegrityChainResponse,
-    IntegrityVerificationResponse
+    IntegrityVerificationResponse,
+    IntegritySweepReport as IntegritySweepReportResponse,
+    IntegrityInclusionProofResponse,
+    IntegrityMerkleEpochResponse,
+    MerkleEpochVerificationResponse,
 )
 from infra.db_models.document_integrity import DocumentIntegrity
-from utils.time import get_utc_now_naive
+from infra.db_models.integrity_sweep_report import IntegritySweepReport
+from infra.db_models.integrity_merkle_epoch import IntegrityMerkleEpoch
+from utils.integrity_hash import (
+    compute_content_hash,
+    compute_metadata_hash,
+    evaluate_integrity_snapshots,
+    verify_chain,
+)
+from utils.logger import logger
+from utils.merkle import (
+    build_merkle_levels,
+    chain_epoch_root,
+    integrity_leaf_hash,
+    merkle_proof,
+    merkle_root,
+    verify_merkle_proof,
+)
+from utils.settings import settings
+from utils.time import KST, get_kst_now, get_utc_now_naive
 
 
 class IntegrityService(BaseService):
@@ -30,8 +56,10 @@ class IntegrityService(BaseService):
         line_repo: IApprovalLineRepository,
         history_repo: IApprovalHistoryRepository,
         user_repo: IUserRepository,
+        access_service: RequestAccessService,
     ):
         super().__init__(user_repo)
+        self.access_service = access_service
         self.integrity_repo = integrity_repo
         self.approval_repo = approval_repo
         self.line_repo = line_repo
@@ -50,37 +78,110 @@ class IntegrityService(BaseService):
         if not request:
             raise HTTPException(status_code=404, detail="Approval request not found")
         
-        # 사용자 검증
-        await self.validate_user_exists(created_by)
+        # 사용자 검증 (시스템 작업은 조회 없이 통과)
+        await self.validate_principal(created_by)
         
-        # 문서 내용 해시 생성
-        content_hash = await self._generate_content_hash(request)
+        approval_lines, histories, latest_integrity = await asyncio.gather(
+            self.line_repo.find_by_request_id(request_id),
+            self.history_repo.find_by_request_id(request_id),
+            self.integrity_repo.find_latest_by_request_id(request_id),
+        )
+        integrity = self._build_integrity_record(
+            request, approval_lines, histories, latest_integrity, created_by
+        )
         
-        # 메타데이터 해시 생성 (결재선, 히스토리, 첨부파일)
-        metadata_hash = await self._generate_metadata_hash(request_id)
+        saved_integrity = await self.integrity_repo.save(integrity)
+        return DocumentIntegrityResponse.model_validate(saved_integrity.model_dump())
+
+    async def create_many(
+        self,
+        request_ids: List[str],
+        created_by: str = SYSTEM_USER_ID,
+    ) -> List[DocumentIntegrityResponse]:
+        """여러 결재 문서의 무결성 기록을 한 번에 생성
+
+        결재 문서/결재선/히스토리/최신 무결성 기록을 각각 한 번의 쿼리로 읽고
+        insert_many 한 번으로 저장한다. 존재하지 않는 request_id는 건너뛴다.
+        """
+        request_ids = list(dict.fromkeys(request_ids))
+        if not request_ids:
+            return []
+        
+        await self.validate_principal(created_by)
+        
+        requests, approval_lines, histories, latest_by_request = await asyncio.gather(
+            self.approval_repo.find_by_ids(request_ids),
+            self.line_repo.find_by_request_ids(request_ids),
+            self.history_repo.find_by_request_ids(request_ids),
+            self.integrity_repo.find_latest_by_request_ids(request_ids),
+        )
+        requests_by_id = {request.id: request for request in requests}
+        lines_by_request = self._group_by_request(approval_lines)
+        histories_by_request = self._group_by_request(histories)
+        
+        missing = [request_id for request_id in request_ids if request_id not in requests_by_id]
+        if missing:
+            logger.warning(f"Integrity create_many skipped missing requests: {missing}")
+        
+        records = [
+            self._build_integrity_record(
+                requests_by_id[request_id],
+                lines_by_request.get(request_id, []),
+                histories_by_request.get(request_id, []),
+                latest_by_request.get(request_id),
+                created_by,
+            )
+            for request_id in request_ids
+            if request_id in requests_by_id
+        ]
+        await self.integrity_repo.save_many(records)
+        return [DocumentIntegrityResponse.model_validate(record.model_dump()) for record in records]
+
+    def _build_integrity_record(
+        self,
+        request,
+        approval_lines: List[Any],
+        histories: List[Any],
+        latest_integrity: Optional[DocumentIntegrity],
+        created_by: str,
+    ) -> DocumentIntegrity:
+        """문서/메타데이터 해시를 계산하고 이전 기록과 체인으로 연결한 무결성 기록 생성"""
         
         # 이전 무결성 기록과 체인 연결
-        latest_integrity = await self.integrity_repo.find_latest_by_request_id(request_id)
         next_version = (latest_integrity.document_version + 1) if latest_integrity else 1
         previous_hash = latest_integrity.content_hash if latest_integrity else None
         
-        # 무결성 기록 생성
-        integrity = DocumentIntegrity(
+        return DocumentIntegrity(
             id=self.ulid.generate(),
-            request_id=request_id,
-            content_hash=content_hash,
+            request_id=request.id,
+            content_hash=compute_content_hash(request.model_dump()),
             previous_hash=previous_hash,
             hash_algorithm="SHA-256",
             document_version=next_version,
-            metadata_hash=metadata_hash,
+            metadata_hash=compute_metadata_hash(
+                [line.model_dump() for line in approval_lines],
+                [history.model_dump() for history in histories],
+            ),
             created_at=get_utc_now_naive(),
             created_by=created_by,
             verification_count=0,
             is_tampered=False,
         )
-        
-        saved_integrity = await self.integrity_repo.save(integrity)
-        return DocumentIntegrityResponse.model_validate(saved_integrity.model_dump())
+
+    @staticmethod
+    def _group_by_request(items: List[Any]) -> Dict[str, List[Any]]:
+        grouped: Dict[str, List[Any]] = defaultdict(list)
+        for item in items:
+            grouped[item.request_id].append(item)
+        return grouped
+
+    async def handle_integrity_job(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """작업 큐 핸들러: 결재 완료 문서의 무결성 기록 생성"""
+        integrity = await self.create_document_integrity(
+            request_id=payload["request_id"],
+            created_by=payload.get("created_by", SYSTEM_USER_ID),
+        )
+        return {"integrity_id": integrity.id, "document_version": integrity.document_version}
 
     async def verify_document_integrity(self, request_id: str, user_id: str) -> IntegrityVerificationResponse:
         """문서 무결성 검증"""
@@ -156,19 +257,8 @@ class IntegrityService(BaseService):
             for record in chain_records
         ]
         
-        # 체인 유효성 검증
-        is_valid = await self._verify_integrity_chain(request_id)
-        broken_at_version = None
-        
-        if not is_valid and len(chain_records) > 1:
-            # 어느 버전에서 체인이 깨졌는지 찾기
-            for i in range(1, len(chain_records)):
-                current = chain_records[i]
-                previous = chain_records[i-1]
-                
-                if current.previous_hash != previous.content_hash:
-                    broken_at_version = current.document_version
-                    break
+        # 체인 유효성 검증 (어느 버전에서 체인이 깨졌는지 함께 확인)
+        is_valid, broken_at_version = verify_chain([record.model_dump() for record in chain_records])
         
         return DocumentIntegrityChainResponse(
             request_id=request_id,
@@ -186,10 +276,7 @@ class IntegrityService(BaseService):
         """위변조된 문서 목록 조회 (관리자 전용)"""
         
         # 관리자 권한 확인
-        user = await self.validate_user_exists(user_id)
-        is_admin = any(role.value == "ADMIN" for role in user.roles)
-        if not is_admin:
-            raise HTTPException(status_code=403, detail="Admin access required")
+        await self.validate_user_is_admin(user_id)
         
         tampered_records, total = await self.integrity_repo.find_tampered_documents(page, page_size)
         
@@ -200,113 +287,267 @@ class IntegrityService(BaseService):
         
         return responses, total
 
-    async def _generate_content_hash(self, request) -> str:
-        """문서 내용 해시 생성"""
-        content_data = {
-            "id": request.id,
-            "title": request.title,
-            "content": request.content,
-            "form_data": request.form_data,
-            "template_id": request.template_id,
-            "document_number": request.document_number,
-            "requester_id": request.requester_id,
-            "department_id": request.department_id,
-            "status": request.status.value if hasattr(request.status, 'value') else str(request.status),
-            "completed_at": request.completed_at.isoformat() if request.completed_at else None,
+    async def run_integrity_sweep(
+        self,
+        batch_size: Optional[int] = None,
+        workers: Optional[int] = None,
+    ) -> IntegritySweepReportResponse:
+        """결재 완료 문서 전체 무결성 일괄 검증
+
+        결재 문서/결재선/히스토리/무결성 체인을 배치 단위 aggregation으로 읽고,
+        해시 재계산은 프로세스 풀에서 처리한 뒤 검증 정보를 bulk write로 반영한다.
+        """
+        batch_size = batch_size or settings.integrity_sweep_batch_size
+        workers = settings.integrity_sweep_workers if workers is None else workers
+        
+        report = IntegritySweepReport(
+            id=self.ulid.generate(),
+            started_at=get_utc_now_naive(),
+            finished_at=get_utc_now_naive(),
+        )
+        executor = (
+            ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+            if workers > 1 else None
+        )
+        
+        try:
+            last_request_id = None
+            while True:
+                snapshots = await self.integrity_repo.find_verification_snapshots(last_request_id, batch_size)
+                if not snapshots:
+                    break
+                last_request_id = snapshots[-1]["request"]["id"]
+                
+                results = await self._evaluate_snapshots(snapshots, executor, workers)
+                await self.integrity_repo.bulk_update_verification_info(
+                    [(result["integrity_id"], not result["is_valid"]) for result in results if result["integrity_id"]],
+                    get_utc_now_naive(),
+                )
+                self._add_sweep_results(report, results)
+                
+                if len(snapshots) < batch_size:
+                    break
+        finally:
+            if executor:
+                executor.shutdown()
+        
+        report.finished_at = get_utc_now_naive()
+        await self.integrity_repo.save_sweep_report(report)
+        logger.info(
+            f"Integrity sweep {report.id}: checked={report.checked_count} "
+            f"tampered={report.tampered_count} missing={report.missing_count}"
+        )
+        return IntegritySweepReportResponse.model_validate(report.model_dump())
+
+    async def handle_sweep_job(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """작업 큐 핸들러: 무결성 일괄 검증"""
+        report = await self.run_integrity_sweep(
+            batch_size=payload.get("batch_size"),
+            workers=payload.get("workers"),
+        )
+        return {
+            "report_id": report.id,
+            "checked_count": report.checked_count,
+            "tampered_count": report.tampered_count,
+            "missing_count": report.missing_count,
         }
+
+    async def get_latest_sweep_report(self, user_id: str) -> IntegritySweepReportResponse:
+        """최근 무결성 일괄 검증 리포트 조회 (관리자 전용)"""
+        await self.validate_user_is_admin(user_id)
+        
+        report = await self.integrity_repo.find_latest_sweep_report()
+        if not report:
+            raise HTTPException(status_code=404, detail="Integrity sweep report not found")
+        return IntegritySweepReportResponse.model_validate(report.model_dump())
+
+    async def seal_merkle_epoch(self, epoch_id: Optional[str] = None) -> IntegrityMerkleEpochResponse:
+        """하루(KST) 단위 Merkle 에폭 봉인
+
+        epoch_id 날짜가 끝나는 시각(다음날 0시 KST) 이전에 생성된 미봉인 무결성 기록으로
+        Merkle 트리를 만들고, 기록마다 포함 증명을 저장한다. 에폭 루트는 직전 에폭 루트와
+        묶이므로 최신 루트 하나가 전체 기록을 보증한다. 이미 봉인된 에폭이면 그대로 반환한다.
+        """
+        if epoch_id is None:
+            epoch_id = (get_kst_now() - timedelta(days=1)).strftime("%Y-%m-%d")
+        existing = await self.integrity_repo.find_merkle_epoch(epoch_id)
+        if existing:
+            return IntegrityMerkleEpochResponse.model_validate(existing.model_dump())
+        
+        cutoff_at = self._epoch_cutoff(epoch_id)
+        previous = await self.integrity_repo.find_latest_merkle_epoch()
+        if previous and previous.cutoff_at >= cutoff_at:
+            raise HTTPException(status_code=400, detail=f"Epoch {epoch_id} is older than sealed epoch {previous.id}")
+        
+        records = await self.integrity_repo.find_unsealed_before(cutoff_at, epoch_id)
+        levels = build_merkle_levels([integrity_leaf_hash(record.model_dump()) for record in records])
+        tree_root = merkle_root(levels)
+        
+        # 증명을 먼저 저장하고 에폭을 마지막에 기록한다 (중간에 실패하면 같은 epoch_id로 다시 봉인)
+        await self.integrity_repo.bulk_set_merkle_proofs(
+            epoch_id,
+            [(record.id, index, merkle_proof(levels, index)) for index, record in enumerate(records)],
+        )
+        previous_root = previous.root if previous else None
+        epoch = IntegrityMerkleEpoch(
+            id=epoch_id,
+            cutoff_at=cutoff_at,
+            tree_root=tree_root,
+            previous_root=previous_root,
+            root=chain_epoch_root(previous_root, tree_root),
+            leaf_count=len(records),
+            created_at=get_utc_now_naive(),
+        )
+        await self.integrity_repo.save_merkle_epoch(epoch)
+        logger.info(f"Integrity merkle epoch {epoch_id} sealed: {len(records)} records, root={epoch.root}")
+        return IntegrityMerkleEpochResponse.model_validate(epoch.model_dump())
+
+    async def handle_merkle_seal_job(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """작업 큐 핸들러: Merkle 에폭 봉인"""
+        epoch = await self.seal_merkle_epoch(payload.get("epoch_id"))
+        return {"epoch_id": epoch.id, "root": epoch.root, "leaf_count": epoch.leaf_count}
+
+    async def get_latest_merkle_epoch(self, user_id: str) -> IntegrityMerkleEpochResponse:
+        """최신 Merkle 에폭 (전체 무결성 기록의 루트) 조회 (관리자 전용)"""
+        await self.validate_user_is_admin(user_id)
+
+        epoch = await self.integrity_repo.find_latest_merkle_epoch()
+        if not epoch:
+            raise HTTPException(status_code=404, detail="Merkle epoch not found")
+        return IntegrityMerkleEpochResponse.model_validate(epoch.model_dump())
+
+    async def get_inclusion_proof(self, request_id: str, user_id: str) -> IntegrityInclusionProofResponse:
+        """최신 무결성 기록의 Merkle 포함 증명 조회 및 검증 (O(log n))"""
         
-        # JSON 정렬하여 일관된 해시 생성
-        content_json = json.dumps(content_data, sort_keys=True, ensure_ascii=False)
-        return hashlib.sha256(content_json.encode('utf-8')).hexdigest()
+        # 권한 확인
+        await self._validate_access_permission(request_id, user_id)
+        
+        record = await self.integrity_repo.find_latest_by_request_id(request_id)
+        if not record:
+            raise HTTPException(status_code=404, detail="No integrity record found")
+        
+        leaf_hash = integrity_leaf_hash(record.model_dump())
+        proof = record.merkle_proof or []
+        epoch = None
+        if record.merkle_epoch_id:
+            epoch = await self.integrity_repo.find_merkle_epoch(record.merkle_epoch_id)
+        
+        is_valid = bool(epoch) and (
+            verify_merkle_proof(leaf_hash, proof, epoch.tree_root)
+            and chain_epoch_root(epoch.previous_root, epoch.tree_root) == epoch.root
+        )
+        return IntegrityInclusionProofResponse(
+            request_id=request_id,
+            integrity_id=record.id,
+            document_version=record.document_version,
+            epoch_id=record.merkle_epoch_id,
+            leaf_hash=leaf_hash,
+            proof=proof,
+            tree_root=epoch.tree_root if epoch else None,
+            epoch_root=epoch.root if epoch else None,
+            is_valid=is_valid,
+        )
+
+    async def verify_merkle_epoch(self, epoch_id: str, user_id: str) -> MerkleEpochVerificationResponse:
+        """에폭의 기록들로 트리를 다시 계산해 루트와 비교 (관리자 전용)"""
+        await self.validate_user_is_admin(user_id)
+        
+        epoch = await self.integrity_repo.find_merkle_epoch(epoch_id)
+        if not epoch:
+            raise HTTPException(status_code=404, detail="Merkle epoch not found")
+        
+        records = await self.integrity_repo.find_by_merkle_epoch(epoch_id)
+        leaves = [integrity_leaf_hash(record.model_dump()) for record in records]
+        tree_root_valid = (
+            len(records) == epoch.leaf_count
+            and merkle_root(build_merkle_levels(leaves)) == epoch.tree_root
+        )
+        chain_valid = chain_epoch_root(epoch.previous_root, epoch.tree_root) == epoch.root
+        
+        # 루트가 다르면 저장된 증명으로 어느 기록이 바뀌었는지 찾는다
+        tampered_integrity_ids = []
+        if not tree_root_valid:
+            tampered_integrity_ids = [
+                record.id
+                for record, leaf in zip(records, leaves)
+                if not verify_merkle_proof(leaf, record.merkle_proof or [], epoch.tree_root)
+            ]
+        
+        return MerkleEpochVerificationResponse(
+            epoch_id=epoch_id,
+            is_valid=tree_root_valid and chain_valid,
+            tree_root_valid=tree_root_valid,
+            chain_valid=chain_valid,
+            leaf_count=len(records),
+            tampered_integrity_ids=tampered_integrity_ids,
+            verified_at=get_utc_now_naive(),
+        )
+
+    @staticmethod
+    def _epoch_cutoff(epoch_id: str) -> datetime:
+        """에폭 날짜(KST)가 끝나는 시각을 UTC naive로 변환"""
+        try:
+            epoch_date = datetime.strptime(epoch_id, "%Y-%m-%d")
+        except ValueError:
+            raise HTTPException(status_code=400, detail=f"Invalid epoch id: {epoch_id}")
+        next_midnight = KST.localize(epoch_date + timedelta(days=1))
+        return next_midnight.astimezone(dt_timezone.utc).replace(tzinfo=None)
+
+    @staticmethod
+    async def _evaluate_snapshots(
+        snapshots: List[Dict[str, Any]],
+        executor: Optional[ProcessPoolExecutor],
+        workers: int,
+    ) -> List[Dict[str, Any]]:
+        if executor is None:
+            return evaluate_integrity_snapshots(snapshots)
+        
+        # 배치를 워커 수만큼 나눠 프로세스 풀에서 병렬 계산
+        loop = asyncio.get_running_loop()
+        chunk_size = -(-len(snapshots) // workers)
+        chunks = [snapshots[i:i + chunk_size] for i in range(0, len(snapshots), chunk_size)]
+        chunk_results = await asyncio.gather(
+            *(loop.run_in_executor(executor, evaluate_integrity_snapshots, chunk) for chunk in chunks)
+        )
+        return [result for results in chunk_results for result in results]
+
+    @staticmethod
+    def _add_sweep_results(report: IntegritySweepReport, results: List[Dict[str, Any]]) -> None:
+        for result in results:
+            report.checked_count += 1
+            if result["integrity_id"] is None:
+                report.missing_count += 1
+                report.missing_request_ids.append(result["request_id"])
+            elif result["is_valid"]:
+                report.valid_count += 1
+            else:
+                report.tampered_count += 1
+                report.tampered.append({
+                    "request_id": result["request_id"],
+                    "integrity_id": result["integrity_id"],
+                    "document_version": result["document_version"],
+                    "tampered_fields": result["tampered_fields"],
+                })
+
+    async def _generate_content_hash(self, request) -> str:
+        """문서 내용 해시 생성"""
+        return compute_content_hash(request.model_dump())
 
     async def _generate_metadata_hash(self, request_id: str) -> str:
         """메타데이터 해시 생성 (결재선, 히스토리)"""
-        
-        # 결재선 정보
         approval_lines = await self.line_repo.find_by_request_id(request_id)
-        lines_data = [
-            {
-                "approver_id": line.approver_id,
-                "approver_name": line.approver_name,
-                "step_order": line.step_order,
-                "status": line.status.value if hasattr(line.status, 'value') else str(line.status),
-                "is_required": line.is_required,
-                "is_parallel": line.is_parallel,
-                "approved_at": line.approved_at.isoformat() if line.approved_at else None,
-                "comment": line.comment,
-            }
-            for line in sorted(approval_lines, key=lambda x: x.step_order)
-        ]
-        
-        # 결재 히스토리
         histories = await self.history_repo.find_by_request_id(request_id)
-        history_data = [
-            {
-                "approver_id": history.approver_id,
-                "approver_name": history.approver_name,
-                "action": history.action.value if hasattr(history.action, 'value') else str(history.action),
-                "created_at": history.created_at.isoformat(),
-                "ip_address": history.ip_address,
-                "comment": history.comment,
-            }
-            for history in sorted(histories, key=lambda x: x.created_at)
-        ]
-        
-        metadata = {
-            "approval_lines": lines_data,
-            "histories": history_data,
-            "lines_count": len(lines_data),
-            "histories_count": len(history_data),
-        }
-        
-        metadata_json = json.dumps(metadata, sort_keys=True, ensure_ascii=False)
-        return hashlib.sha256(metadata_json.encode('utf-8')).hexdigest()
+        return compute_metadata_hash(
+            [line.model_dump() for line in approval_lines],
+            [history.model_dump() for history in histories],
+        )
 
     async def _verify_integrity_chain(self, request_id: str) -> bool:
         """무결성 체인 검증"""
-        
         chain_records = await self.integrity_repo.get_chain_by_request_id(request_id)
-        
-        if len(chain_records) <= 1:
-            return True
-        
-        # 체인 연결 검증
-        for i in range(1, len(chain_records)):
-            current = chain_records[i]
-            previous = chain_records[i-1]
-            
-            # 이전 해시가 올바르게 연결되어 있는지 확인
-            if current.previous_hash != previous.content_hash:
-                return False
-            
-            # 버전 순서가 올바른지 확인
-            if current.document_version != previous.document_version + 1:
-                return False
-        
-        return True
+        is_valid, _ = verify_chain([record.model_dump() for record in chain_records])
+        return is_valid
 
     async def _validate_access_permission(self, request_id: str, user_id: str) -> None:
         """접근 권한 검증 (기안자, 결재자, 관리자만)"""
-        
-        request = await self.approval_repo.find_by_id(request_id)
-        if not request:
-            raise HTTPException(status_code=404, detail="Approval request not found")
-        
-        user = await self.validate_user_exists(user_id)
-        
-        # 기안자인지 확인
-        if request.requester_id == user_id:
-            return
-        
-        # 결재자인지 확인
-        approval_lines = await self.line_repo.find_by_request_id(request_id)
-        is_approver = any(line.approver_id == user_id for line in approval_lines)
-        if is_approver:
-            return
-        
-        # 관리자인지 확인
-        is_admin = any(role.value == "ADMIN" for role in user.roles)
-        if is_admin:
-            return
-        
-        raise HTTPException(status_code=403, detail="No permission to access this document integrity")
\ No newline at end of file
+        await self.access_service.ensure_access(request_id, user_id, "No permission to access this document integrity")
\ No newline at end of file
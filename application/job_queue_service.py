@@ -0,0 +1,226 @@
+"""Mongo 기반 백그라운드 작업 큐.
+
+API 요청 안에서 처리하기 무거운 작업(법적 문서 PDF 생성, 무결성 기록, 캘린더 동기화 등)을
+작업 레코드로 등록하고, 워커 루프가 가져가 재시도/백오프와 함께 처리한다.
+"""
+import asyncio
+import os
+import socket
+from datetime import timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from ulid import ULID
+
+from common.exceptions import NotFoundError
+from domain.background_job import BackgroundJob, JobStatus
+from domain.repository.background_job_repo import IBackgroundJobRepository
+from utils.logger import logger
+from utils.settings import settings
+from utils.time import get_utc_now_naive
+
+DOCUMENT_INTEGRITY_JOB = "document_integrity"
+LEGAL_ARCHIVE_JOB = "legal_archive"
+LEGAL_ARCHIVE_BACKFILL_JOB = "legal_archive_backfill"
+INTEGRITY_SWEEP_JOB = "integrity_sweep"
+INTEGRITY_MERKLE_SEAL_JOB = "integrity_merkle_seal"
+PAYMENT_TASK_CALENDAR_SYNC_JOB = "payment_task_calendar_sync"
+VOUCHER_SYNC_JOB = "voucher_sync"
+
+JobHandler = Callable[[Dict[str, Any]], Awaitable[Optional[Dict[str, Any]]]]
+# 재시도를 모두 실패한 작업의 정리 (payload, 마지막 오류 메시지)
+JobFailureHandler = Callable[[Dict[str, Any], str], Awaitable[None]]
+
+
+class JobDeferred(Exception):
+    """핸들러가 작업을 시작할 수 없을 때(잠금 사용 중 등) 던진다.
+
+    실패가 아니므로 시도 횟수를 쓰지 않고 delay_seconds 뒤로 다시 미룬다.
+    """
+
+    def __init__(self, delay_seconds: float, reason: str):
+        super().__init__(reason)
+        self.delay_seconds = delay_seconds
+        self.reason = reason
+
+
+def job_key(job_type: str, *parts: str) -> str:
+    """작업 종류와 대상 ID로 idempotency key를 만든다 (예: legal_archive:{request_id})"""
+    return ":".join([job_type, *parts])
+
+
+class JobQueueService:
+    def __init__(
+        self,
+        job_repo: IBackgroundJobRepository,
+        handlers: Optional[Dict[str, JobHandler]] = None,
+        failure_handlers: Optional[Dict[str, JobFailureHandler]] = None,
+    ):
+        self.job_repo = job_repo
+        self.handlers: Dict[str, JobHandler] = dict(handlers or {})
+        self.failure_handlers: Dict[str, JobFailureHandler] = dict(failure_handlers or {})
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self.ulid = ULID()
+
+    async def enqueue(
+        self,
+        job_type: str,
+        payload: Dict[str, Any],
+        idempotency_key: Optional[str] = None,
+        max_attempts: Optional[int] = None,
+        job_id: Optional[str] = None,
+        created_by: Optional[str] = None,
+    ) -> BackgroundJob:
+        """작업 등록. 같은 idempotency_key의 작업이 이미 있으면 그 작업을 반환한다.
+
+        그 작업이 재시도를 모두 실패(FAILED)했으면 새 payload로 처음부터 다시 실행한다.
+
+        job_id를 주면 그 ID로 등록한다 (payload나 Redis 키에 작업 ID를 미리 써야 할 때).
+        created_by는 작업 조회 API의 권한 확인에 쓴다 (등록한 사용자 또는 관리자만 조회).
+        """
+        now = get_utc_now_naive()
+        job = BackgroundJob(
+            id=job_id or self.ulid.generate(),
+            job_type=job_type,
+            idempotency_key=idempotency_key or job_key(job_type, self.ulid.generate()),
+            payload=payload,
+            status=JobStatus.PENDING,
+            max_attempts=max_attempts or settings.job_max_attempts,
+            run_at=now,
+            created_at=now,
+            updated_at=now,
+            created_by=created_by,
+        )
+        saved = await self.job_repo.save_if_absent(job)
+        return BackgroundJob.model_validate(saved.model_dump())
+
+    async def get_job(self, job_id: str) -> BackgroundJob:
+        job = await self.job_repo.find_by_id(job_id)
+        if not job:
+            raise NotFoundError(f"Job not found: {job_id}")
+        return BackgroundJob.model_validate(job.model_dump())
+
+    async def get_jobs_by_keys(self, keys: List[str]) -> List[BackgroundJob]:
+        jobs = await self.job_repo.find_by_idempotency_keys(keys)
+        return [BackgroundJob.model_validate(job.model_dump()) for job in jobs]
+
+    async def run_worker(self, stop_event: asyncio.Event, concurrency: Optional[int] = None) -> None:
+        """stop_event가 설정될 때까지 작업을 처리한다. concurrency로 동시 처리량을 제한한다."""
+        concurrency = concurrency or settings.job_worker_concurrency
+        logger.info(f"Job worker {self.worker_id} started (concurrency={concurrency})")
+        await asyncio.gather(*(self._worker_loop(stop_event) for _ in range(concurrency)))
+        logger.info(f"Job worker {self.worker_id} stopped")
+
+    async def _worker_loop(self, stop_event: asyncio.Event) -> None:
+        while not stop_event.is_set():
+            try:
+                processed = await self.run_one()
+            except Exception as e:
+                logger.error(f"Job worker loop error: {e}")
+                processed = False
+
+            if not processed:
+                try:
+                    await asyncio.wait_for(stop_event.wait(), timeout=settings.job_poll_interval_seconds)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def run_one(self) -> bool:
+        """실행 가능한 작업 하나를 처리한다. 처리한 작업이 없으면 False."""
+        if not self.handlers:
+            return False
+
+        now = get_utc_now_naive()
+        # 가져갈 때마다 새 ID (같은 프로세스의 다른 루프가 다시 가져간 작업과도 구분)
+        claim_id = f"{self.worker_id}:{self.ulid.generate()}"
+        job = await self.job_repo.claim_next(
+            claim_id,
+            list(self.handlers),
+            now=now,
+            stale_before=now - timedelta(seconds=settings.job_lock_timeout_seconds),
+        )
+        if not job:
+            return False
+
+        handler = self.handlers[job.job_type]
+        heartbeat_task = asyncio.create_task(self._heartbeat(job, claim_id))
+        try:
+            result = await handler(job.payload)
+        except JobDeferred as e:
+            heartbeat_task.cancel()
+            await self._defer(job, claim_id, e)
+        except Exception as e:
+            heartbeat_task.cancel()
+            await self._handle_failure(job, claim_id, e)
+        else:
+            heartbeat_task.cancel()
+            if await self.job_repo.mark_succeeded(job.id, claim_id, result, get_utc_now_naive()):
+                logger.info(f"Job {job.job_type} succeeded ({job.idempotency_key}, attempt {job.attempts})")
+            else:
+                self._log_lost_claim(job, "success")
+        return True
+
+    async def _heartbeat(self, job, claim_id: str) -> None:
+        """핸들러가 끝날 때까지 locked_at을 갱신해 오래 걸리는 작업을 다른 워커가 다시 가져가지 않게 한다"""
+        interval = settings.job_lock_timeout_seconds / 3
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                if not await self.job_repo.heartbeat(job.id, claim_id, get_utc_now_naive()):
+                    logger.error(f"Job {job.job_type} ({job.idempotency_key}) was claimed by another worker while running")
+                    return
+            except Exception as e:
+                logger.error(f"Job {job.job_type} heartbeat failed ({job.idempotency_key}): {e}")
+
+    async def _defer(self, job, claim_id: str, deferred: JobDeferred) -> None:
+        now = get_utc_now_naive()
+        run_at = now + timedelta(seconds=deferred.delay_seconds)
+        if not await self.job_repo.defer(job.id, claim_id, run_at, now):
+            self._log_lost_claim(job, "deferral")
+            return
+        logger.info(
+            f"Job {job.job_type} deferred ({job.idempotency_key}) for {deferred.delay_seconds}s: {deferred.reason}"
+        )
+
+    async def _handle_failure(self, job, claim_id: str, error: Exception) -> None:
+        now = get_utc_now_naive()
+        message = str(getattr(error, "detail", None) or error)
+
+        if job.attempts >= job.max_attempts:
+            if not await self.job_repo.mark_failed(job.id, claim_id, message, now):
+                self._log_lost_claim(job, "failure")
+                return
+            logger.error(f"Job {job.job_type} failed permanently ({job.idempotency_key}): {message}")
+            await self._run_failure_handler(job, message)
+            return
+
+        delay = self._retry_delay(job.attempts)
+        if not await self.job_repo.mark_retry(job.id, claim_id, message, now + timedelta(seconds=delay), now):
+            self._log_lost_claim(job, "retry")
+            return
+        logger.warning(
+            f"Job {job.job_type} failed ({job.idempotency_key}, attempt {job.attempts}/{job.max_attempts}), "
+            f"retry in {delay}s: {message}"
+        )
+
+    @staticmethod
+    def _log_lost_claim(job, outcome: str) -> None:
+        # 다른 워커가 다시 가져갔거나 이미 끝난 작업: 그쪽 결과를 덮어쓰지 않는다
+        logger.error(
+            f"Job {job.job_type} ({job.idempotency_key}) {outcome} not recorded: "
+            f"the job is no longer held by this worker"
+        )
+
+    async def _run_failure_handler(self, job, message: str) -> None:
+        failure_handler = self.failure_handlers.get(job.job_type)
+        if failure_handler is None:
+            return
+        try:
+            await failure_handler(job.payload, message)
+        except Exception as e:
+            logger.error(f"Job {job.job_type} failure cleanup failed ({job.idempotency_key}): {e}")
+
+    @staticmethod
+    def _retry_delay(attempts: int) -> int:
+        """지수 백오프 (base * 2^(attempts-1), 최대 job_retry_max_seconds)"""
+        delay = settings.job_retry_base_seconds * (2 ** max(attempts - 1, 0))
+        return min(delay, settings.job_retry_max_seconds)
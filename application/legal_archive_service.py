@@ -1,31 +1,33 @@
+import asyncio
 import io
 import json
+from collections import defaultdict
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 from dependency_injector.wiring import inject
 from fastapi import HTTPException
 from motor.motor_asyncio import AsyncIOMotorGridFSBucket
 from ulid import ULID
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch, mm
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
-from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT, TA_JUSTIFY
-from reportlab.lib import colors
-from reportlab.lib.utils import ImageReader
-from reportlab.graphics.shapes import Drawing, Rect, String
-from reportlab.graphics import renderPDF
 
 from application.base_service import BaseService
+from application.lock_service import LockService
+from application.request_access_service import RequestAccessService
 from domain.repository.approval_request_repo import IApprovalRequestRepository
 from domain.repository.approval_line_repo import IApprovalLineRepository
 from domain.repository.approval_history_repo import IApprovalHistoryRepository
 from domain.repository.user_repo import IUserRepository
 from domain.repository.attached_file_repo import IAttachedFileRepository
+from common.auth import DocumentStatus, SYSTEM_USER_ID
 from common.db import client
-from utils.time import get_utc_now_naive, utc_to_kst_naive
+from common.exceptions import ConflictError
+from utils.legal_pdf import render_legal_pdf_async
+from utils.logger import logger
+from utils.settings import settings
+from utils.time import get_utc_now_naive
+
+
+def backfill_lock(checkpoint_name: str) -> str:
+    return f"legal_archive_backfill:{checkpoint_name}"
 
 
 class LegalArchiveService(BaseService):
@@ -37,8 +39,12 @@ class LegalArchiveService(BaseService):
         history_repo: IApprovalHistoryRepository,
         user_repo: IUserRepository,
         file_repo: IAttachedFileRepository,
+        access_service: RequestAccessService,
+        lock_service: LockService,
     ):
         super().__init__(user_repo)
+        self.access_service = access_service
+        self.lock_service = lock_service
         self.approval_repo = approval_repo
         self.line_repo = line_repo
         self.history_repo = history_repo
@@ -48,6 +54,8 @@ class LegalArchiveService(BaseService):
         # GridFS 설정 (법적 문서 보관용)
         self.db = client.dup
         self.legal_fs = AsyncIOMotorGridFSBucket(self.db, bucket_name="legal_documents")
+        self.legal_files = self.db["legal_documents.files"]
+        self.backfill_checkpoints = self.db.legal_archive_backfill_checkpoints
 
     async def create_legal_document(self, request_id: str, created_by: str) -> str:
         """결재 완료된 문서를 법적 효력이 있는 PDF로 변환 및 보관"""
@@ -58,34 +66,22 @@ class LegalArchiveService(BaseService):
             raise HTTPException(status_code=404, detail="Approval request not found")
         
         # 완료된 결재만 처리
-        from common.auth import DocumentStatus
         if request.status != DocumentStatus.APPROVED:
             raise HTTPException(status_code=400, detail="Only approved documents can be archived")
         
-        # 사용자 검증
-        await self.validate_user_exists(created_by)
+        # 사용자 검증 (시스템 작업은 조회 없이 통과)
+        await self.validate_principal(created_by)
         
         try:
-            # PDF 문서 생성
-            pdf_content = await self._generate_pdf_document(request_id)
-            
-            # 메타데이터 준비
-            metadata = await self._prepare_document_metadata(request_id)
-            
-            # GridFS에 저장 (읽기 전용)
-            file_id = await self.legal_fs.upload_from_stream(
-                filename=f"legal_{request.document_number}_{request_id}.pdf",
-                source=io.BytesIO(pdf_content),
-                metadata={
-                    **metadata,
-                    "created_by": created_by,
-                    "created_at": get_utc_now_naive(),
-                    "is_legal_document": True,
-                    "readonly": True,
-                }
+            # 결재선/이력/첨부는 한 번만 조회해서 PDF와 메타데이터에 같이 사용
+            approval_lines, histories, attached_files = await asyncio.gather(
+                self.line_repo.find_by_request_id(request_id),
+                self.history_repo.find_by_request_id(request_id),
+                self.file_repo.find_by_request_id(request_id),
+            )
+            return await self._archive_request(
+                request, approval_lines, histories, attached_files, created_by
             )
-            
-            return str(file_id)
             
         except Exception as e:
             raise HTTPException(
@@ -93,36 +89,255 @@ class LegalArchiveService(BaseService):
                 detail=f"Failed to create legal document: {str(e)}"
             )
 
+    async def handle_archive_job(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """작업 큐 핸들러: 결재 완료 문서의 법적 PDF 생성 및 보관"""
+        request_id = payload["request_id"]
+        if await self.verify_legal_document_exists(request_id):
+            # 이전 시도에서 업로드까지 끝났으면 다시 만들지 않는다
+            return {"skipped": True}
+        file_id = await self.create_legal_document(
+            request_id=request_id,
+            created_by=payload.get("created_by", SYSTEM_USER_ID),
+        )
+        return {"legal_document_id": file_id}
+
+    async def backfill_legal_documents(
+        self,
+        created_by: str = SYSTEM_USER_ID,
+        batch_size: Optional[int] = None,
+        regenerate: bool = False,
+        checkpoint_name: Optional[str] = None,
+        reset: bool = False,
+        max_requests: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """결재 완료 문서의 법적 PDF 일괄 생성
+
+        APPROVED 문서를 id 커서로 batch_size씩 읽고, 배치마다 결재선/이력/첨부를
+        한 번에 조회한 뒤 프로세스 풀에서 병렬 렌더링한다. 배치가 끝날 때마다
+        체크포인트를 저장하므로 중단되어도 다음 실행에서 이어서 처리한다.
+        실패한 문서는 체크포인트에 남겨 다음 실행에서 먼저 다시 시도한다.
+        regenerate=True면 이미 보관된 문서도 다시 만들고 이전 파일을 삭제한다.
+        같은 체크포인트는 한 번에 하나의 작업만 진행한다 (Redis 락).
+        """
+        batch_size = batch_size or settings.legal_backfill_batch_size
+        checkpoint_name = checkpoint_name or ("regenerate" if regenerate else "backfill")
+
+        # 같은 체크포인트를 두 작업이 동시에 진행하면 같은 문서를 렌더링하고 서로의 이전 파일을 지운다
+        async with self.lock_service.hold(backfill_lock(checkpoint_name)) as acquired:
+            if not acquired:
+                raise ConflictError(f"법적 문서 일괄 생성({checkpoint_name})이 이미 진행 중입니다")
+            return await self._run_backfill(
+                created_by, batch_size, regenerate, checkpoint_name, reset, max_requests
+            )
+
+    async def _run_backfill(
+        self,
+        created_by: str,
+        batch_size: int,
+        regenerate: bool,
+        checkpoint_name: str,
+        reset: bool,
+        max_requests: Optional[int],
+    ) -> Dict[str, Any]:
+        if reset:
+            await self.backfill_checkpoints.delete_one({"_id": checkpoint_name})
+        checkpoint = await self.backfill_checkpoints.find_one({"_id": checkpoint_name}) or {}
+        last_request_id = checkpoint.get("last_request_id")
+        counts = {"processed": 0, "created": 0, "skipped": 0, "failed": 0}
+        failed_request_ids: List[str] = []
+
+        # 이전 실행에서 실패한 문서부터 다시 시도한다 (커서는 이미 지나갔으므로)
+        previous_failed = checkpoint.get("failed_request_ids", [])
+        if max_requests is not None:
+            previous_failed = previous_failed[:max_requests]
+        for start in range(0, len(previous_failed), batch_size):
+            retry_ids = previous_failed[start:start + batch_size]
+            batch_counts, batch_failed = await self._retry_failed_batch(
+                checkpoint_name, retry_ids, created_by, regenerate
+            )
+            for key, value in batch_counts.items():
+                counts[key] += value
+            failed_request_ids.extend(batch_failed)
+
+        completed = False
+        while max_requests is None or counts["processed"] < max_requests:
+            limit = batch_size if max_requests is None else min(batch_size, max_requests - counts["processed"])
+            requests = await self.approval_repo.find_by_status_after(
+                DocumentStatus.APPROVED, after_id=last_request_id, limit=limit
+            )
+            if not requests:
+                completed = True
+                break
+
+            batch_counts, batch_failed = await self._backfill_batch(requests, created_by, regenerate)
+            for key, value in batch_counts.items():
+                counts[key] += value
+            failed_request_ids.extend(batch_failed)
+            last_request_id = requests[-1].id
+
+            await self._save_backfill_checkpoint(checkpoint_name, last_request_id, batch_counts, batch_failed)
+            logger.info(
+                f"Legal archive backfill [{checkpoint_name}] up to {last_request_id}: {batch_counts}"
+            )
+
+            if len(requests) < limit:
+                completed = True
+                break
+
+        return {
+            "checkpoint": checkpoint_name,
+            "last_request_id": last_request_id,
+            "completed": completed,
+            **counts,
+            "failed_request_ids": failed_request_ids,
+        }
+
+    async def handle_backfill_job(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """작업 큐 핸들러: 법적 문서 일괄 생성 (체크포인트부터 max_requests건까지)"""
+        return await self.backfill_legal_documents(
+            created_by=payload.get("created_by", SYSTEM_USER_ID),
+            batch_size=payload.get("batch_size"),
+            regenerate=payload.get("regenerate", False),
+            checkpoint_name=payload.get("checkpoint_name"),
+            reset=payload.get("reset", False),
+            max_requests=payload.get("max_requests"),
+        )
+
+    async def _backfill_batch(
+        self, requests: List[Any], created_by: str, regenerate: bool
+    ) -> Tuple[Dict[str, int], List[str]]:
+        request_ids = [request.id for request in requests]
+        approval_lines, histories, attached_files = await asyncio.gather(
+            self.line_repo.find_by_request_ids(request_ids),
+            self.history_repo.find_by_request_ids(request_ids),
+            self.file_repo.find_by_request_ids(request_ids),
+        )
+        lines_by_request = self._group_by_request(approval_lines)
+        histories_by_request = self._group_by_request(histories)
+        files_by_request = self._group_by_request(attached_files)
+
+        existing = await self._find_legal_file_ids(request_ids)
+        targets = [
+            request for request in requests
+            if regenerate or request.id not in existing
+        ]
+
+        results = await asyncio.gather(
+            *(
+                self._archive_request(
+                    request,
+                    lines_by_request.get(request.id, []),
+                    histories_by_request.get(request.id, []),
+                    files_by_request.get(request.id, []),
+                    created_by,
+                    replace_file_ids=existing.get(request.id, []),
+                )
+                for request in targets
+            ),
+            return_exceptions=True,
+        )
+
+        failed = []
+        for request, result in zip(targets, results):
+            if isinstance(result, Exception):
+                logger.error(f"Legal archive backfill failed for {request.id}: {result}")
+                failed.append(request.id)
+
+        counts = {
+            "processed": len(requests),
+            "created": len(targets) - len(failed),
+            "skipped": len(requests) - len(targets),
+            "failed": len(failed),
+        }
+        return counts, failed
+
+    async def _retry_failed_batch(
+        self, checkpoint_name: str, request_ids: List[str], created_by: str, regenerate: bool
+    ) -> Tuple[Dict[str, int], List[str]]:
+        """체크포인트에 남은 실패 문서를 다시 처리하고, 성공(또는 더 이상 대상이 아닌) 문서는 목록에서 뺀다"""
+        requests = [
+            request for request in await self.approval_repo.find_by_ids(request_ids)
+            if request.status == DocumentStatus.APPROVED
+        ]
+        batch_counts, batch_failed = await self._backfill_batch(requests, created_by, regenerate)
+        resolved = [request_id for request_id in request_ids if request_id not in batch_failed]
+        if resolved:
+            await self.backfill_checkpoints.update_one(
+                {"_id": checkpoint_name},
+                {
+                    "$pull": {"failed_request_ids": {"$in": resolved}},
+                    "$set": {"updated_at": get_utc_now_naive()},
+                },
+            )
+        logger.info(
+            f"Legal archive backfill [{checkpoint_name}] retried {len(request_ids)} failed documents: {batch_counts}"
+        )
+        return batch_counts, batch_failed
+
+    async def _save_backfill_checkpoint(
+        self,
+        checkpoint_name: str,
+        last_request_id: str,
+        batch_counts: Dict[str, int],
+        batch_failed: List[str],
+    ) -> None:
+        update: Dict[str, Any] = {
+            "$set": {"last_request_id": last_request_id, "updated_at": get_utc_now_naive()},
+            "$inc": {f"counts.{key}": value for key, value in batch_counts.items()},
+        }
+        if batch_failed:
+            # 커서가 지나가도 다음 실행에서 다시 시도하도록 남긴다
+            update["$addToSet"] = {"failed_request_ids": {"$each": batch_failed}}
+        await self.backfill_checkpoints.update_one({"_id": checkpoint_name}, update, upsert=True)
+
+    async def _find_legal_file_ids(self, request_ids: List[str]) -> Dict[str, List[Any]]:
+        """request_id별 GridFS 파일 ID 목록 (metadata.request_id 인덱스 사용)"""
+        if not request_ids:
+            return {}
+        cursor = self.legal_files.find(
+            {"metadata.request_id": {"$in": list(set(request_ids))}},
+            {"metadata.request_id": 1},
+        )
+        file_ids: Dict[str, List[Any]] = defaultdict(list)
+        async for file_doc in cursor:
+            file_ids[file_doc["metadata"]["request_id"]].append(file_doc["_id"])
+        return file_ids
+
+    @staticmethod
+    def _group_by_request(items: List[Any]) -> Dict[str, List[Any]]:
+        grouped: Dict[str, List[Any]] = defaultdict(list)
+        for item in items:
+            grouped[item.request_id].append(item)
+        return grouped
+
+    @staticmethod
+    def _legal_filename(request) -> str:
+        return f"legal_{request.document_number}_{request.id}.pdf"
+
     async def get_legal_document(self, request_id: str, user_id: str) -> tuple[bytes, str]:
         """법적 문서 다운로드"""
         
         # 권한 확인
         await self._validate_access_permission(request_id, user_id)
         
-        # 문서 조회
-        request = await self.approval_repo.find_by_id(request_id)
-        if not request:
-            raise HTTPException(status_code=404, detail="Approval request not found")
-        
-        # GridFS에서 파일 조회
-        filename_pattern = f"legal_{request.document_number}_{request_id}.pdf"
-        
         try:
-            # 파일 스트림 조회
-            file_cursor = self.legal_fs.find({"filename": filename_pattern})
-            file_doc = await file_cursor.to_list(length=1)
-            
+            # metadata.request_id 인덱스로 최신 파일 조회
+            file_doc = await self.legal_files.find_one(
+                {"metadata.request_id": request_id},
+                {"filename": 1},
+                sort=[("uploadDate", -1)],
+            )
             if not file_doc:
                 raise HTTPException(status_code=404, detail="Legal document not found")
             
-            file_id = file_doc[0]["_id"]
-            
             # 파일 내용 다운로드
-            file_stream = await self.legal_fs.open_download_stream(file_id)
+            file_stream = await self.legal_fs.open_download_stream(file_doc["_id"])
             content = await file_stream.read()
             
-            return content, filename_pattern
+            return content, file_doc["filename"]
             
+        except HTTPException:
+            raise
         except Exception as e:
             raise HTTPException(
                 status_code=500,
@@ -131,378 +346,118 @@ class LegalArchiveService(BaseService):
 
     async def verify_legal_document_exists(self, request_id: str) -> bool:
         """법적 문서 존재 여부 확인"""
-        
-        request = await self.approval_repo.find_by_id(request_id)
-        if not request:
-            return False
-        
-        filename_pattern = f"legal_{request.document_number}_{request_id}.pdf"
-        
-        try:
-            file_cursor = self.legal_fs.find({"filename": filename_pattern})
-            files = await file_cursor.to_list(length=1)
-            return len(files) > 0
-        except:
-            return False
-
-    async def _generate_pdf_document(self, request_id: str) -> bytes:
-        """결재 문서를 PDF로 변환 (reportlab 사용)"""
-        
-        # 결재 정보 수집
-        request = await self.approval_repo.find_by_id(request_id)
-        approval_lines = await self.line_repo.find_by_request_id(request_id)
-        histories = await self.history_repo.find_by_request_id(request_id)
-        attached_files = await self.file_repo.find_by_request_id(request_id)
-        
-        # PDF 문서 생성 (전문적인 여백과 설정)
-        buffer = io.BytesIO()
-        doc = SimpleDocTemplate(
-            buffer, 
-            pagesize=A4,
-            rightMargin=20*mm,
-            leftMargin=20*mm,
-            topMargin=25*mm,
-            bottomMargin=25*mm
-        )
-        
-        # 한글 폰트 등록
-        import os
-        font_path = os.path.join(os.path.dirname(__file__), "..", "fonts", "malgun.ttf")
-        pdfmetrics.registerFont(TTFont("맑은고딕", font_path))
-        korean_font_name = "맑은고딕"
-        
-        # 스타일 설정
-        styles = getSampleStyleSheet()
-        
-        # 전문적인 한글 스타일 정의
-        document_title_style = ParagraphStyle(
-            'DocumentTitle',
-            parent=styles['Title'],
-            fontName=korean_font_name,
-            fontSize=20,
-            alignment=TA_CENTER,
-            spaceAfter=30,
-            textColor=colors.black,
-            borderWidth=2,
-            borderColor=colors.black,
-            borderPadding=10,
-            backColor=colors.lightgrey
-        )
-        
-        section_title_style = ParagraphStyle(
-            'SectionTitle',
-            parent=styles['Heading1'],
-            fontName=korean_font_name,
-            fontSize=14,
-            alignment=TA_LEFT,
-            spaceAfter=12,
-            spaceBefore=20,
-            textColor=colors.darkblue,
-            borderWidth=1,
-            borderColor=colors.darkblue,
-            borderPadding=8,
-            leftIndent=0
-        )
-        
-        subsection_style = ParagraphStyle(
-            'SubSection',
-            parent=styles['Heading2'],
-            fontName=korean_font_name,
-            fontSize=12,
-            alignment=TA_LEFT,
-            spaceAfter=6,
-            spaceBefore=12,
-            textColor=colors.darkred,
-            leftIndent=10
-        )
-        
-        content_style = ParagraphStyle(
-            'Content',
-            parent=styles['Normal'],
-            fontName=korean_font_name,
-            fontSize=10,
-            alignment=TA_JUSTIFY,
-            spaceAfter=6,
-            spaceBefore=3,
-            leftIndent=15,
-            rightIndent=15
-        )
-        
-        table_header_style = ParagraphStyle(
-            'TableHeader',
-            parent=styles['Normal'],
-            fontName=korean_font_name,
-            fontSize=9,
-            alignment=TA_CENTER,
-            textColor=colors.black
-        )
-        
-        table_content_style = ParagraphStyle(
-            'TableContent',
-            parent=styles['Normal'],
-            fontName=korean_font_name,
-            fontSize=9,
-            alignment=TA_LEFT
+        exists = await self.verify_legal_documents_exist([request_id])
+        return exists[request_id]
+
+    async def verify_legal_documents_exist(self, request_ids: List[str]) -> Dict[str, bool]:
+        """여러 결재 문서의 법적 문서 존재 여부를 한 번에 확인 (목록 화면용)"""
+        file_ids = await self._find_legal_file_ids(request_ids)
+        return {request_id: request_id in file_ids for request_id in request_ids}
+
+    async def verify_accessible_legal_documents_exist(self, request_ids: List[str], user_id: str) -> Dict[str, bool]:
+        """조회 권한이 있는 결재 문서만 법적 문서 존재 여부를 반환 (권한 없는 문서는 결과에서 제외)"""
+        accessible_ids = await self.access_service.filter_accessible(request_ids, user_id)
+        return await self.verify_legal_documents_exist(accessible_ids)
+
+    async def _archive_request(
+        self,
+        request,
+        approval_lines: List[Any],
+        histories: List[Any],
+        attached_files: List[Any],
+        created_by: str,
+        replace_file_ids: Optional[List[Any]] = None,
+    ) -> str:
+        """조회된 결재 데이터로 PDF를 렌더링해 GridFS에 저장 (읽기 전용)"""
+        pdf_content = await render_legal_pdf_async(
+            self._build_pdf_data(request, approval_lines, histories, attached_files)
         )
-        
-        footer_style = ParagraphStyle(
-            'Footer',
-            parent=styles['Normal'],
-            fontName=korean_font_name,
-            fontSize=8,
-            alignment=TA_CENTER,
-            textColor=colors.grey
+        metadata = self._build_document_metadata(request, len(approval_lines), len(histories))
+
+        file_id = await self.legal_fs.upload_from_stream(
+            filename=self._legal_filename(request),
+            source=io.BytesIO(pdf_content),
+            metadata={
+                **metadata,
+                "created_by": created_by,
+                "created_at": get_utc_now_naive(),
+                "is_legal_document": True,
+                "readonly": True,
+            }
         )
-        
-        # PDF 내용 구성
-        story = []
-        
-        # 문서 헤더 (공식 문서 스타일)
-        story.append(Paragraph("전자결재 법적문서", document_title_style))
-        story.append(Spacer(1, 0.3*inch))
-        
-        # 문서 기본 정보 테이블
-        story.append(Paragraph("I. 문서 기본 정보", section_title_style))
-        
-        basic_info_data = [
-            [Paragraph("문서번호", table_header_style), Paragraph(str(request.document_number), table_content_style)],
-            [Paragraph("제목", table_header_style), Paragraph(str(request.title), table_content_style)],
-            [Paragraph("기안자", table_header_style), Paragraph(str(request.requester_name), table_content_style)],
-            [Paragraph("기안일시", table_header_style), Paragraph(utc_to_kst_naive(request.created_at).strftime('%Y년 %m월 %d일 %H시 %M분'), table_content_style)],
-            [Paragraph("완료일시", table_header_style), Paragraph(utc_to_kst_naive(request.completed_at).strftime('%Y년 %m월 %d일 %H시 %M분') if request.completed_at else '처리중', table_content_style)],
-            [Paragraph("문서상태", table_header_style), Paragraph(request.status.value if hasattr(request.status, 'value') else str(request.status), table_content_style)]
-        ]
-        
-        basic_info_table = Table(basic_info_data, colWidths=[40*mm, 120*mm])
-        basic_info_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (0, -1), colors.darkblue),
-            ('TEXTCOLOR', (0, 0), (0, -1), colors.white),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, -1), korean_font_name),
-            ('FONTSIZE', (0, 0), (-1, -1), 9),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('ROWBACKGROUNDS', (0, 0), (-1, -1), [colors.white, colors.lightgrey]),
-        ]))
-        story.append(basic_info_table)
-        story.append(Spacer(1, 0.3*inch))
-        
-        # 문서 내용
-        story.append(Paragraph("II. 결재 요청 내용", section_title_style))
-        content_text = self._html_to_plain_text(request.content)
-        story.append(Paragraph(content_text, content_style))
-        story.append(Spacer(1, 0.3*inch))
-        
-        # 결재선 정보 테이블
-        story.append(Paragraph("III. 결재선 및 승인 현황", section_title_style))
-        
-        approval_data = [
-            [Paragraph("단계", table_header_style), 
-             Paragraph("결재자", table_header_style), 
-             Paragraph("상태", table_header_style), 
-             Paragraph("승인일시", table_header_style), 
-             Paragraph("의견", table_header_style)]
-        ]
-        
-        sorted_lines = sorted(approval_lines, key=lambda x: x.step_order)
-        for line in sorted_lines:
-            status_text = line.status.value if hasattr(line.status, 'value') else str(line.status)
-            approved_text = utc_to_kst_naive(line.approved_at).strftime('%Y-%m-%d %H:%M') if line.approved_at else '-'
-            comment = line.comment or '-'
-            
-            # 상태에 따른 색상 적용
-            status_color = colors.green if status_text == 'APPROVED' else colors.red if status_text == 'REJECTED' else colors.orange
-            
-            approval_data.append([
-                Paragraph(str(line.step_order), table_content_style),
-                Paragraph(str(line.approver_name), table_content_style),
-                Paragraph(status_text, ParagraphStyle('StatusStyle', parent=table_content_style, textColor=status_color)),
-                Paragraph(approved_text, table_content_style),
-                Paragraph(comment[:50] + ('...' if len(comment) > 50 else ''), table_content_style)
-            ])
-        
-        approval_table = Table(approval_data, colWidths=[20*mm, 35*mm, 25*mm, 35*mm, 55*mm])
-        approval_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.white),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, -1), korean_font_name),
-            ('FONTSIZE', (0, 0), (-1, -1), 9),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
-        ]))
-        story.append(approval_table)
-        story.append(Spacer(1, 0.3*inch))
-        
-        # 결재 이력
-        story.append(Paragraph("IV. 상세 결재 이력", section_title_style))
-        
-        history_data = [
-            [Paragraph("일시", table_header_style),
-             Paragraph("결재자", table_header_style),
-             Paragraph("처리내용", table_header_style),
-             Paragraph("접속IP", table_header_style),
-             Paragraph("의견", table_header_style)]
-        ]
-        
-        sorted_histories = sorted(histories, key=lambda x: x.created_at)
-        for history in sorted_histories:
-            action_text = history.action.value if hasattr(history.action, 'value') else str(history.action)
-            action_color = colors.green if action_text == 'APPROVE' else colors.red if action_text == 'REJECT' else colors.orange
-            
-            history_data.append([
-                Paragraph(utc_to_kst_naive(history.created_at).strftime('%Y-%m-%d<br/>%H:%M:%S'), table_content_style),
-                Paragraph(str(history.approver_name), table_content_style),
-                Paragraph(action_text, ParagraphStyle('ActionStyle', parent=table_content_style, textColor=action_color)),
-                Paragraph(history.ip_address or '-', table_content_style),
-                Paragraph((history.comment or '-')[:40] + ('...' if history.comment and len(history.comment) > 40 else ''), table_content_style)
-            ])
-        
-        history_table = Table(history_data, colWidths=[35*mm, 35*mm, 25*mm, 30*mm, 45*mm])
-        history_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.white),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, -1), korean_font_name),
-            ('FONTSIZE', (0, 0), (-1, -1), 8),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
-        ]))
-        story.append(history_table)
-        
-        # 첨부파일 정보
-        if attached_files:
-            story.append(Spacer(1, 0.3*inch))
-            story.append(Paragraph("V. 첨부파일 목록", section_title_style))
-            
-            file_data = [
-                [Paragraph("파일명", table_header_style),
-                 Paragraph("크기", table_header_style),
-                 Paragraph("업로드일시", table_header_style),
-                 Paragraph("업로드자", table_header_style)]
-            ]
-            
-            for file in attached_files:
-                file_size = f"{file.file_size:,} bytes" if file.file_size < 1024*1024 else f"{file.file_size/(1024*1024):.1f} MB"
-                file_data.append([
-                    Paragraph(str(file.file_name), table_content_style),
-                    Paragraph(file_size, table_content_style),
-                    Paragraph(utc_to_kst_naive(file.uploaded_at).strftime('%Y-%m-%d %H:%M'), table_content_style),
-                    Paragraph(str(file.uploaded_by), table_content_style)
-                ])
-            
-            file_table = Table(file_data, colWidths=[60*mm, 30*mm, 40*mm, 40*mm])
-            file_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.darkgreen),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, -1), korean_font_name),
-                ('FONTSIZE', (0, 0), (-1, -1), 8),
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
-            ]))
-            story.append(file_table)
-        
-        # 법적 효력 안내 (새 페이지)
-        story.append(PageBreak())
-        story.append(Paragraph("법적 효력 및 보안 안내", document_title_style))
-        story.append(Spacer(1, 0.2*inch))
-        
-        legal_notice = [
-            "■ 법적 효력 제한 사항",
-            "1. 본 문서는 전자결재 시스템을 통해 생성된 전자문서입니다.",
-            "2. 완전한 법적 효력을 위해서는 다음 요건이 추가로 필요합니다:",
-            "   - 전자서명법에 따른 공인인증서 기반 전자서명",
-            "   - 공인된 타임스탬프 기관(TSA)의 시각 인증",
-            "   - 문서 무결성 보장을 위한 해시체인 구현",
-            "3. 현재 문서는 내부 업무용 전자결재 기록으로 활용 가능합니다.",
-            "4. 대외적 법적 효력이 필요한 경우 별도 법적 검토가 필요합니다.",
-            "5. 본 시스템은 전자문서 보관 및 이력 관리 기능을 제공합니다."
-        ]
-        
-        for notice in legal_notice:
-            story.append(Paragraph(notice, content_style))
-            story.append(Spacer(1, 0.1*inch))
-        
-        # 문서 생성 정보
-        story.append(Spacer(1, 0.3*inch))
-        story.append(Paragraph("■ 문서 생성 정보", subsection_style))
-        story.append(Paragraph(f"생성일시: {utc_to_kst_naive(get_utc_now_naive()).strftime('%Y년 %m월 %d일 %H시 %M분 %S초')}", footer_style))
-        story.append(Paragraph(f"생성시스템: 전자결재시스템 v2.0", footer_style))
-        story.append(Paragraph(f"문서ID: {request_id}", footer_style))
-        
-        # PDF 빌드
-        doc.build(story)
-        
-        # PDF 바이트 반환
-        pdf_bytes = buffer.getvalue()
-        buffer.close()
-        return pdf_bytes
-
-    def _html_to_plain_text(self, html_content: str) -> str:
-        """HTML을 일반 텍스트로 변환 (간단한 처리)"""
-        import re
-        
-        # HTML 태그 제거
-        text = re.sub(r'<[^>]+>', '', html_content)
-        
-        # HTML 엔티티 변환
-        text = text.replace('&nbsp;', ' ')
-        text = text.replace('&lt;', '<')
-        text = text.replace('&gt;', '>')
-        text = text.replace('&amp;', '&')
-        
-        # 연속된 공백 정리
-        text = re.sub(r'\s+', ' ', text)
-        
-        return text.strip()
 
-    async def _prepare_document_metadata(self, request_id: str) -> Dict[str, Any]:
+        # 재생성한 경우 새 파일 저장이 끝난 뒤에 이전 파일을 지운다
+        for old_file_id in replace_file_ids or []:
+            await self.legal_fs.delete(old_file_id)
+
+        return str(file_id)
+
+    def _build_pdf_data(
+        self, request, approval_lines: List[Any], histories: List[Any], attached_files: List[Any]
+    ) -> Dict[str, Any]:
+        """PDF 렌더링에 필요한 결재 정보를 직렬화 가능한 dict로 변환"""
+        return {
+            "request_id": request.id,
+            "document_number": request.document_number,
+            "title": request.title,
+            "requester_name": request.requester_name,
+            "created_at": request.created_at,
+            "completed_at": request.completed_at,
+            "status": self._enum_text(request.status),
+            "content": request.content,
+            "approval_lines": [
+                {
+                    "step_order": line.step_order,
+                    "approver_name": line.approver_name,
+                    "status": self._enum_text(line.status),
+                    "approved_at": line.approved_at,
+                    "comment": line.comment,
+                }
+                for line in sorted(approval_lines, key=lambda x: x.step_order)
+            ],
+            "histories": [
+                {
+                    "created_at": history.created_at,
+                    "approver_name": history.approver_name,
+                    "action": self._enum_text(history.action),
+                    "ip_address": history.ip_address,
+                    "comment": history.comment,
+                }
+                for history in sorted(histories, key=lambda x: x.created_at)
+            ],
+            "attached_files": [
+                {
+                    "file_name": file.file_name,
+                    "file_size": file.file_size,
+                    "uploaded_at": file.uploaded_at,
+                    "uploaded_by": file.uploaded_by,
+                }
+                for file in attached_files
+            ],
+        }
+
+    @staticmethod
+    def _enum_text(value) -> str:
+        return value.value if hasattr(value, 'value') else str(value)
+
+    def _build_document_metadata(
+        self, request, approval_lines_count: int, histories_count: int
+    ) -> Dict[str, Any]:
         """문서 메타데이터 준비"""
-        
-        request = await self.approval_repo.find_by_id(request_id)
-        approval_lines = await self.line_repo.find_by_request_id(request_id)
-        histories = await self.history_repo.find_by_request_id(request_id)
-        
         return {
-            "request_id": request_id,
+            "request_id": request.id,
             "document_number": request.document_number,
             "title": request.title,
             "requester_id": request.requester_id,
             "requester_name": request.requester_name,
-            "status": request.status.value if hasattr(request.status, 'value') else str(request.status),
+            "status": self._enum_text(request.status),
             "created_at": request.created_at,
             "completed_at": request.completed_at,
-            "approval_lines_count": len(approval_lines),
-            "histories_count": len(histories),
+            "approval_lines_count": approval_lines_count,
+            "histories_count": histories_count,
             "archived_at": get_utc_now_naive(),
         }
 
     async def _validate_access_permission(self, request_id: str, user_id: str) -> None:
         """접근 권한 검증 (기안자, 결재자, 관리자만)"""
-        
-        request = await self.approval_repo.find_by_id(request_id)
-        if not request:
-            raise HTTPException(status_code=404, detail="Approval request not found")
-        
-        user = await self.validate_user_exists(user_id)
-        
-        # 기안자인지 확인
-        if request.requester_id == user_id:
-            return
-        
-        # 결재자인지 확인
-        approval_lines = await self.line_repo.find_by_request_id(request_id)
-        is_approver = any(line.approver_id == user_id for line in approval_lines)
-        if is_approver:
-            return
-        
-        # 관리자인지 확인
-        is_admin = any(role.value == "ADMIN" for role in user.roles)
-        if is_admin:
-            return
-        
-        raise HTTPException(status_code=403, detail="No permission to access this legal document")
\ No newline at end of file
+        await self.access_service.ensure_access(request_id, user_id, "No permission to access this legal document")
\ No newline at end of file
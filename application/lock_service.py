@@ -0,0 +1,133 @@
+"""Redis 분산 락과 리더 선출
+
+여러 프로세스/파드가 같은 작업을 동시에 돌리지 않도록 Redis 키(lock:{name})를
+SET NX PX로 잡는다. 값은 락마다 만든 token이라 만료 후 다른 프로세스가 잡은 락을
+실수로 풀거나 연장하지 않는다 (Lua로 token을 비교한 뒤 DEL/PEXPIRE).
+
+- LockService.hold(name): 작업 하나를 감싸는 락. 잡고 있는 동안 TTL의 1/3마다 연장한다.
+- LeaderElection: 스케줄러처럼 한 프로세스만 돌아야 하는 일을 위한 리더 락.
+  run(stop_event)가 TTL의 1/3마다 연장하거나 다시 잡으며 is_leader를 갱신한다.
+"""
+import asyncio
+import uuid
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+from redis.asyncio import Redis
+
+from utils.logger import logger
+
+SCHEDULER_LEADER_LOCK = "scheduler_leader"
+VOUCHER_SYNC_LOCK = "voucher_sync"
+
+# token이 같을 때만 지우기/연장하기
+_RELEASE_SCRIPT = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("DEL", KEYS[1])
+end
+return 0
+"""
+_EXTEND_SCRIPT = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("PEXPIRE", KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+
+def _lock_key(name: str) -> str:
+    return f"lock:{name}"
+
+
+class DistributedLock:
+    def __init__(self, redis: Redis, name: str, ttl_seconds: float):
+        self.redis = redis
+        self.name = name
+        self.key = _lock_key(name)
+        self.ttl_ms = int(ttl_seconds * 1000)
+        self.token = uuid.uuid4().hex
+
+    async def acquire(self) -> bool:
+        return bool(await self.redis.set(self.key, self.token, nx=True, px=self.ttl_ms))
+
+    async def extend(self) -> bool:
+        """아직 이 락을 잡고 있으면 TTL을 처음부터 다시 센다"""
+        return bool(await self.redis.eval(_EXTEND_SCRIPT, 1, self.key, self.token, self.ttl_ms))
+
+    async def release(self) -> bool:
+        return bool(await self.redis.eval(_RELEASE_SCRIPT, 1, self.key, self.token))
+
+    async def keep_alive(self) -> None:
+        """취소될 때까지 TTL의 1/3마다 연장한다 (hold에서 백그라운드로 실행)"""
+        while True:
+            await asyncio.sleep(self.ttl_ms / 3000)
+            try:
+                if not await self.extend():
+                    logger.error(f"Lock {self.name} was lost while the job was still running")
+                    return
+            except Exception as e:
+                logger.error(f"Lock {self.name} renewal failed: {e}")
+
+
+class LockService:
+    def __init__(self, redis: Redis, default_ttl_seconds: float = 60):
+        self.redis = redis
+        self.default_ttl_seconds = default_ttl_seconds
+
+    def lock(self, name: str, ttl_seconds: Optional[float] = None) -> DistributedLock:
+        return DistributedLock(self.redis, name, ttl_seconds or self.default_ttl_seconds)
+
+    @asynccontextmanager
+    async def hold(self, name: str, ttl_seconds: Optional[float] = None) -> AsyncIterator[bool]:
+        """락을 잡으면 True를 넘기고 블록이 끝날 때 푼다. 다른 곳에서 잡고 있으면 False.
+
+        async with lock_service.hold(VOUCHER_SYNC_LOCK) as acquired:
+            if not acquired:
+                raise ConflictError(...)
+        """
+        lock = self.lock(name, ttl_seconds)
+        if not await lock.acquire():
+            yield False
+            return
+
+        renew_task = asyncio.create_task(lock.keep_alive())
+        try:
+            yield True
+        finally:
+            renew_task.cancel()
+            try:
+                await lock.release()
+            except Exception as e:
+                # 못 풀어도 TTL이 지나면 풀린다
+                logger.error(f"Lock {name} release failed: {e}")
+
+
+class LeaderElection:
+    def __init__(self, redis: Redis, name: str = SCHEDULER_LEADER_LOCK, ttl_seconds: float = 30):
+        self.lock = DistributedLock(redis, name, ttl_seconds)
+        self.is_leader = False
+
+    async def run(self, stop_event: asyncio.Event) -> None:
+        """stop_event가 설정될 때까지 리더 락을 연장하거나 잡는다. 끝나면 락을 푼다."""
+        interval = self.lock.ttl_ms / 3000
+        while not stop_event.is_set():
+            was_leader = self.is_leader
+            try:
+                # Redis 오류 뒤에도 아직 내 락이면 연장으로 이어간다
+                self.is_leader = await self.lock.extend() or await self.lock.acquire()
+            except Exception as e:
+                logger.error(f"Leader election ({self.lock.name}) error: {e}")
+                self.is_leader = False
+            if self.is_leader != was_leader:
+                logger.info(f"{'Became' if self.is_leader else 'Lost'} leader for {self.lock.name}")
+            try:
+                await asyncio.wait_for(stop_event.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                pass
+
+        if self.is_leader:
+            self.is_leader = False
+            try:
+                await self.lock.release()
+            except Exception as e:
+                logger.error(f"Leader lock ({self.lock.name}) release failed: {e}")
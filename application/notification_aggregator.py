@@ -0,0 +1,85 @@
+"""사용자 알림 모아 보내기 (debounce)
+
+일괄 결재처럼 짧은 시간에 이벤트가 몰리면 사용자마다 대기 건수 재계산과 알림이
+반복된다. window_seconds 동안 사용자별 이벤트를 모으고, 대기 건수는 대상 사용자 전체를 한 번에
+계산해서 사용자당 한 번만 보낸다.
+
+- 이벤트는 기존 메시지 타입 그대로 모은 순서대로 보낸다 (클라이언트 프로토콜은 바뀌지 않음).
+- 대기 건수는 마지막에 approval_pending_count 하나로 보낸다 (inbox에 남기지 않음).
+"""
+import asyncio
+import contextvars
+from typing import Any, Dict, List, Optional, Set
+
+from application.notification_bus import UserNotificationBus
+from domain.repository.approval_line_repo import IApprovalLineRepository
+from utils.logger import logger
+from utils.time import get_kst_now
+
+PENDING_COUNT_MESSAGE = "approval_pending_count"
+
+
+class NotificationAggregator:
+    def __init__(
+        self,
+        notification_bus: UserNotificationBus,
+        approval_line_repo: IApprovalLineRepository,
+        window_seconds: float = 0.2,
+    ):
+        self.notification_bus = notification_bus
+        self.approval_line_repo = approval_line_repo
+        self.window_seconds = window_seconds
+        self._events: Dict[str, List[Dict[str, Any]]] = {}
+        self._count_users: Set[str] = set()
+        self._flush_task: Optional[asyncio.Task] = None
+
+    def add(self, user_id: str, message: Optional[Dict[str, Any]] = None, refresh_pending_count: bool = False) -> None:
+        """user_id에게 보낼 이벤트나 대기 건수 갱신을 모은다"""
+        if message is not None:
+            self._events.setdefault(user_id, []).append(message)
+        if refresh_pending_count:
+            self._count_users.add(user_id)
+        if self._flush_task is None:
+            # 요청이 끝난 뒤에 실행되므로 요청 scope(contextvar)를 물려받지 않는다
+            self._flush_task = asyncio.get_running_loop().create_task(
+                self._flush_later(), context=contextvars.Context()
+            )
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.window_seconds)
+        await self.flush()
+
+    async def flush(self) -> None:
+        """모은 알림을 지금 보낸다 (종료 시에도 호출)"""
+        events, self._events = self._events, {}
+        count_users, self._count_users = self._count_users, set()
+        if self._flush_task is not None and self._flush_task is not asyncio.current_task():
+            self._flush_task.cancel()
+        self._flush_task = None
+        if not events and not count_users:
+            return
+
+        counts: Dict[str, int] = {}
+        if count_users:
+            try:
+                counts = await self.approval_line_repo.find_pending_counts_by_approvers(list(count_users))
+            except Exception as e:
+                logger.error(f"대기 건수 일괄 조회 실패 ({len(count_users)}명): {e}")
+
+        timestamp = get_kst_now().isoformat()
+        await asyncio.gather(*(
+            self._send(user_id, events.get(user_id, []), counts.get(user_id), timestamp)
+            for user_id in set(events) | set(counts)
+        ))
+
+    async def _send(self, user_id: str, events: List[Dict[str, Any]], count: Optional[int], timestamp: str) -> None:
+        for event in events:
+            await self.notification_bus.publish(user_id, event)
+        if count is not None:
+            message = {
+                "type": PENDING_COUNT_MESSAGE,
+                "data": {"user_id": user_id, "count": count, "timestamp": timestamp},
+            }
+            await self.notification_bus.publish(
+                user_id, message, persist=False, coalesce_key=PENDING_COUNT_MESSAGE
+            )
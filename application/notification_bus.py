@@ -0,0 +1,120 @@
+"""사용자 알림 버스 (여러 프로세스/파드 간 전달)
+
+어느 프로세스에서 publish해도 Redis pub/sub(USER_NOTIFICATIONS_CHANNEL)으로 모든
+프로세스에 전달되고, 그 사용자의 웹소켓을 가진 프로세스만 실제로 보낸다.
+구독은 RedisPubSubService가 프로세스당 하나로 처리한다.
+
+persist=True인 알림은 사용자별 Redis stream(notifications:inbox:{user_id})에도
+남긴다 (최근 notification_inbox_max_len건, notification_inbox_ttl_seconds 동안).
+다시 연결하면 클라이언트가 준 last_event_id, 없으면 마지막으로 전달한 알림
+이후의 inbox를 다시 보낸다. 연결 직후에는 실시간 알림과 겹칠 수 있으므로
+클라이언트는 event_id로 중복을 거른다.
+
+cursor는 웹소켓으로 실제로 보낸 뒤에 옮긴다 (대기열에 남은 채 끊긴 알림은 다시 보낸다).
+기기마다 cursor를 따로 두려면 연결할 때 client_id를 준다 (없으면 사용자별 cursor 하나).
+"""
+import json
+from typing import Any, Dict, Optional
+
+from fastapi import WebSocket
+from redis.asyncio import Redis
+
+from application.websocket_manager import OnSent, WebSocketManager
+from utils.logger import logger
+from utils.settings import settings
+
+USER_NOTIFICATIONS_CHANNEL = "user_notifications_channel"
+
+
+def _inbox_key(user_id: str) -> str:
+    return f"notifications:inbox:{user_id}"
+
+
+def _cursor_key(user_id: str, client_id: Optional[str] = None) -> str:
+    # 이 사용자(기기)에게 마지막으로 보낸 inbox event_id
+    if client_id:
+        return f"notifications:cursor:{user_id}:{client_id}"
+    return f"notifications:cursor:{user_id}"
+
+
+class UserNotificationBus:
+    def __init__(self, redis: Redis, ws_manager: WebSocketManager):
+        self.redis = redis
+        self.ws_manager = ws_manager
+
+    async def publish(
+        self,
+        user_id: str,
+        message: Dict[str, Any],
+        persist: bool = True,
+        coalesce_key: Optional[str] = None,
+    ) -> None:
+        """user_id에게 알림 전송 (연결된 프로세스가 어디든 전달된다)
+
+        대기 건수처럼 다시 계산할 수 있는 알림은 persist=False로 inbox에 남기지 않는다.
+        """
+        try:
+            if persist:
+                event_id = await self.redis.xadd(
+                    _inbox_key(user_id),
+                    {"message": json.dumps(message, default=str)},
+                    maxlen=settings.notification_inbox_max_len,
+                    approximate=True,
+                )
+                await self.redis.expire(_inbox_key(user_id), settings.notification_inbox_ttl_seconds)
+                message = {**message, "event_id": event_id}
+            await self.redis.publish(
+                USER_NOTIFICATIONS_CHANNEL,
+                json.dumps({"user_id": user_id, "message": message, "coalesce_key": coalesce_key}, default=str),
+            )
+        except Exception as e:
+            logger.error(f"알림 전송 실패 (user_id={user_id}): {e}")
+
+    async def deliver(self, payload: Dict[str, Any]) -> None:
+        """USER_NOTIFICATIONS_CHANNEL 메시지를 이 프로세스의 웹소켓에 전달 (RedisPubSubService에서 호출)"""
+        user_id = payload["user_id"]
+        if not await self.ws_manager.is_user_connected(user_id):
+            return
+        message = payload["message"]
+        on_sent = self._cursor_saver(user_id, message["event_id"]) if message.get("event_id") else None
+        await self.ws_manager.send_to_user(user_id, message, payload.get("coalesce_key"), on_sent)
+
+    async def replay(self, user_id: str, websocket: WebSocket, last_event_id: Optional[str] = None) -> int:
+        """연결 직후 놓친 inbox 알림을 이 연결 대기열에 넣는다. 넣은 건수를 반환한다."""
+        try:
+            cursor_key = _cursor_key(user_id, self.ws_manager.get_client_id(websocket))
+            last_event_id = last_event_id or await self.redis.get(cursor_key)
+            # "(" 접두사: last_event_id 다음 항목부터 (Redis 6.2+)
+            start = f"({last_event_id}" if last_event_id else "-"
+            entries = await self.redis.xrange(
+                _inbox_key(user_id), min=start, count=settings.notification_inbox_max_len
+            )
+        except Exception as e:
+            logger.error(f"알림 inbox 조회 실패 (user_id={user_id}): {e}")
+            return 0
+
+        replayed = 0
+        for event_id, fields in entries:
+            message = json.loads(fields["message"])
+            on_sent = self._cursor_saver(user_id, event_id)
+            if not self.ws_manager.send(websocket, {**message, "event_id": event_id, "replayed": True}, on_sent=on_sent):
+                break
+            replayed += 1
+        if replayed:
+            logger.info(f"Replayed {replayed} notifications to user {user_id}")
+        return replayed
+
+    def _cursor_saver(self, user_id: str, event_id: str) -> OnSent:
+        """웹소켓 writer가 알림을 보낸 뒤 그 연결(기기)의 cursor를 옮긴다"""
+        async def save_cursor(websocket: WebSocket) -> None:
+            await self._save_cursor(user_id, event_id, self.ws_manager.get_client_id(websocket))
+
+        return save_cursor
+
+    async def _save_cursor(self, user_id: str, event_id: str, client_id: Optional[str] = None) -> None:
+        try:
+            await self.redis.set(
+                _cursor_key(user_id, client_id), event_id, ex=settings.notification_inbox_ttl_seconds
+            )
+        except Exception as e:
+            logger.error(f"알림 cursor 저장 실패 (user_id={user_id}): {e}")
@@ -4,7 +4,7 @@ import asyncio
 import hashlib
 import json
 from datetime import date, datetime, timedelta
-from typing import Dict
+from typing import Any, Dict
 
 import aiohttp
 from google.oauth2 import service_account
@@ -12,16 +12,24 @@ from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from pytz import timezone
 
+from application.lock_service import LockService
+from common.exceptions import ConflictError
 from domain.payment_task import PaymentTask
 from domain.repository.payment_task_repo import IPaymentTaskRepository
 from utils.settings import settings
 
 
+def _calendar_lock(task_id: str) -> str:
+    # 같은 업무의 일정을 두 워커가 동시에 만들지 않도록 (작업 큐 동시 실행, 10분 주기 재시도)
+    return f"payment_task_calendar:{task_id}"
+
+
 class PaymentTaskCalendarService:
     calendar_scope = "https://www.googleapis.com/auth/calendar"
 
-    def __init__(self, payment_task_repo: IPaymentTaskRepository):
+    def __init__(self, payment_task_repo: IPaymentTaskRepository, lock_service: LockService):
         self.payment_task_repo = payment_task_repo
+        self.lock_service = lock_service
 
     @property
     def calendar_enabled(self) -> bool:
@@ -36,12 +44,30 @@ class PaymentTaskCalendarService:
         task.calendar_sync_needed = False
         await self.payment_task_repo.update(task)
 
+    async def handle_sync_job(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Job queue handler: sync the latest state of one task (failures are retried by the queue)."""
+        async with self.lock_service.hold(_calendar_lock(payload["task_id"])) as acquired:
+            if not acquired:
+                # 같은 업무의 다른 동기화가 끝난 뒤 재시도한다 (그때 다시 읽어서 이미 반영됐으면 건너뜀)
+                raise ConflictError("같은 납부 업무의 캘린더 동기화가 진행 중입니다")
+            # 락을 잡은 뒤에 읽어야 앞선 작업이 저장한 일정 ID를 본다
+            task = await self.payment_task_repo.find_by_id(payload["task_id"])
+            if not task or not task.calendar_sync_needed:
+                return {"synced": False}
+            await self.sync_task(task)
+        return {"synced": True, "event_id": task.google_calendar_event_id}
+
     async def retry_unsynced_tasks(self) -> None:
         if not self.calendar_enabled:
             return
         for task in await self.payment_task_repo.find_for_calendar_sync():
             try:
-                await self.sync_task(task)
+                async with self.lock_service.hold(_calendar_lock(task.id)) as acquired:
+                    if not acquired:
+                        continue  # 작업 큐가 처리 중
+                    task = await self.payment_task_repo.find_by_id(task.id)
+                    if task and task.calendar_sync_needed:
+                        await self.sync_task(task)
             except Exception as error:
                 print(f"납부 업무 구글 캘린더 동기화 재시도 실패 ({task.id}): {error}")
 
@@ -1,3 +1,4 @@
+import asyncio
 from datetime import date
 from typing import Any, Dict, List, Optional
 
@@ -8,11 +9,14 @@ from ulid import ULID
 from application.approval_notification_service import ApprovalNotificationService
 from application.base_service import BaseService
 from application.file_attachment_service import FileAttachmentService
+from application.job_queue_service import JobQueueService, PAYMENT_TASK_CALENDAR_SYNC_JOB
 from application.payment_task_calendar_service import PaymentTaskCalendarService
+from application.user_loader import UserLoader
 from common.auth import Role
 from domain.payment_task import PaymentTask
 from domain.repository.payment_task_repo import IPaymentTaskRepository
 from domain.repository.user_repo import IUserRepository
+from utils.logger import logger
 from utils.time import get_utc_now_naive
 
 
@@ -27,20 +31,26 @@ class PaymentTaskService(BaseService[PaymentTask]):
         file_service: FileAttachmentService,
         notification_service: ApprovalNotificationService,
         payment_task_calendar_service: PaymentTaskCalendarService,
+        job_queue_service: JobQueueService,
+        user_loader: UserLoader,
     ):
-        super().__init__(user_repo)
+        super().__init__(user_repo, user_loader)
         self.payment_task_repo = payment_task_repo
         self.file_service = file_service
         self.notification_service = notification_service
         self.payment_task_calendar_service = payment_task_calendar_service
+        self.job_queue_service = job_queue_service
         self.ulid = ULID()
 
     async def create_direct_payment_task(
         self, requester_id: str, data: Dict[str, Any], files: List[UploadFile]
     ) -> Dict[str, Any]:
-        requester = await self.validate_user_exists(requester_id)
         assignee_id = self._required_text(data.get("assignee_id"), "납부 담당자")
-        assignee = await self.validate_user_exists(assignee_id)
+        # 기안자/담당자 조회는 한 번의 사용자 조회로 묶인다
+        requester, assignee = await asyncio.gather(
+            self.validate_user_exists(requester_id),
+            self.validate_user_exists(assignee_id),
+        )
         name = str(data.get("name") or "").strip()
         due_date = self._parse_optional_date(data.get("due_date"), "납부 기한")
         now = get_utc_now_naive()
@@ -209,11 +219,14 @@ class PaymentTaskService(BaseService[PaymentTask]):
     async def _sync_to_calendar(self, task: PaymentTask) -> None:
         task.calendar_sync_needed = True
         await self.payment_task_repo.update(task)
+        if not self.payment_task_calendar_service.calendar_enabled:
+            return
         try:
-            await self.payment_task_calendar_service.sync_task(task)
+            # 구글 캘린더 호출은 워커가 작업 큐에서 처리한다
+            await self.job_queue_service.enqueue(PAYMENT_TASK_CALENDAR_SYNC_JOB, {"task_id": task.id})
         except Exception as error:
-            # 외부 일정 장애 때문에 납부 업무 저장을 실패시키지 않는다.
-            print(f"납부 업무 구글 캘린더 동기화 실패 ({task.id}): {error}")
+            # 외부 일정 장애 때문에 납부 업무 저장을 실패시키지 않는다. (10분 주기 재시도가 처리)
+            logger.error(f"Failed to enqueue {PAYMENT_TASK_CALENDAR_SYNC_JOB} job for payment task {task.id}: {error}")
 
     async def _add_request_files(self, task: PaymentTask, files: List[UploadFile], uploaded_by: str, save: bool = True) -> None:
         for file in files:
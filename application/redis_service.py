@@ -1,18 +1,79 @@
 import asyncio
 import json
+from typing import Iterable, Optional
+
 from redis.asyncio import Redis
-from application.websocket_manager import WebSocketManager
+from application.notification_bus import USER_NOTIFICATIONS_CHANNEL, UserNotificationBus
+from application.websocket_manager import PENDING_USERS_TOPIC, SYNC_STATUS_TOPIC, WebSocketManager
+from utils.logger import logger
+
+SYNC_STATUS_CHANNEL = "sync_status_channel"
+PENDING_USERS_CHANNEL = "pending_users_channel"
+# Redis 채널 -> 웹소켓 주제
+CHANNEL_TOPICS = {
+    SYNC_STATUS_CHANNEL: SYNC_STATUS_TOPIC,
+    PENDING_USERS_CHANNEL: PENDING_USERS_TOPIC,
+}
+BROADCAST_CHANNELS = (*CHANNEL_TOPICS, USER_NOTIFICATIONS_CHANNEL)
+
 
 class RedisPubSubService:
-    def __init__(self, redis: Redis, ws_manager: WebSocketManager):
+    """프로세스당 Redis 구독 하나로 채널 메시지를 이 프로세스의 웹소켓에 전달한다
+
+    웹소켓마다 구독을 만들지 않고, lifespan에서 listen_and_broadcast를 한 번 띄운다.
+    메시지는 채널에 대응하는 주제(CHANNEL_TOPICS)를 구독한 소켓에만 한 번씩 보낸다.
+    사용자 알림 채널은 UserNotificationBus가 그 사용자의 소켓에 전달한다.
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        ws_manager: WebSocketManager,
+        notification_bus: Optional[UserNotificationBus] = None,
+    ):
         self.redis = redis
         self.ws_manager = ws_manager
+        self.notification_bus = notification_bus
 
-    async def listen_and_broadcast(self):
-        pubsub = self.redis.pubsub()
-        await pubsub.subscribe("sync_status_channel")
+    async def listen_and_broadcast(
+        self,
+        stop_event: asyncio.Event,
+        channels: Iterable[str] = BROADCAST_CHANNELS,
+    ) -> None:
+        """stop_event가 설정될 때까지 구독한다. 연결이 끊기면 1초 뒤 다시 구독한다."""
+        channels = list(channels)
+        while not stop_event.is_set():
+            pubsub = self.redis.pubsub()
+            try:
+                await pubsub.subscribe(*channels)
+                while not stop_event.is_set():
+                    message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                    if message and message["type"] == "message":
+                        await self._dispatch(message["channel"], message["data"])
+            except Exception as e:
+                logger.error(f"Redis PubSub listener error: {e}")
+                try:
+                    await asyncio.wait_for(stop_event.wait(), timeout=1.0)
+                except asyncio.TimeoutError:
+                    pass
+            finally:
+                try:
+                    await pubsub.unsubscribe(*channels)
+                    await pubsub.close()
+                except Exception:
+                    pass
 
-        async for message in pubsub.listen():
-            if message["type"] == "message":
-                data = json.loads(message["data"])
-                await self.ws_manager.broadcast(data)  # 모든 연결에 전송
+    async def _dispatch(self, channel: str, raw_data: str) -> None:
+        try:
+            data = json.loads(raw_data)
+        except (TypeError, ValueError):
+            logger.warning(f"Invalid PubSub message on {channel}: {raw_data!r}")
+            return
+        logger.debug(f"Redis PubSub received on {channel}: {data}")
+        if channel == USER_NOTIFICATIONS_CHANNEL:
+            if self.notification_bus:
+                await self.notification_bus.deliver(data)
+            return
+        topic = CHANNEL_TOPICS.get(channel, channel)
+        # 상태 스냅샷이므로 아직 못 보낸 이전 메시지는 최신 메시지로 덮어쓴다
+        await self.ws_manager.publish(topic, data, coalesce_key=topic)
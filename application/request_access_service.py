@@ -0,0 +1,160 @@
+"""결재 문서 접근 권한 (기안자, 결재자, 관리자) 공통 판단
+
+상세 화면 하나가 결재/결재선/첨부/무결성/법적 문서 서비스를 거치며 같은 권한 검사를
+여러 번 하므로, 문서별 ACL을 한 번 계산해서 요청 단위 캐시와 Redis(짧은 TTL)에 둔다.
+결재선이 바뀌면 invalidate()로 지운다.
+"""
+import asyncio
+from typing import Dict, List
+
+from dependency_injector.wiring import inject
+from fastapi import HTTPException
+from redis.asyncio import Redis
+
+from application.base_service import BaseService
+from application.user_loader import UserLoader
+from common.auth import Role
+from common.request_scope import request_cache
+from domain.repository.approval_line_repo import IApprovalLineRepository
+from domain.repository.approval_request_repo import IApprovalRequestRepository
+from domain.repository.user_repo import IUserRepository
+from domain.request_acl import RequestAcl
+from utils.logger import logger
+from utils.settings import settings
+
+ACL_CACHE_PREFIX = "acl:request:"
+
+
+def _acl_cache_key(request_id: str) -> str:
+    return f"{ACL_CACHE_PREFIX}{request_id}"
+
+
+class RequestAccessService(BaseService):
+    @inject
+    def __init__(
+        self,
+        approval_repo: IApprovalRequestRepository,
+        line_repo: IApprovalLineRepository,
+        user_repo: IUserRepository,
+        redis: Redis,
+        user_loader: UserLoader,
+    ):
+        super().__init__(user_repo, user_loader)
+        self.approval_repo = approval_repo
+        self.line_repo = line_repo
+        self.redis = redis
+
+    async def ensure_access(
+        self,
+        request_id: str,
+        user_id: str,
+        detail: str = "No permission to access this request",
+    ) -> RequestAcl:
+        """기안자, 결재자, 관리자가 아니면 403 (문서가 없으면 404)"""
+        acls = await self.get_acls([request_id])
+        acl = acls.get(request_id)
+        if acl is None:
+            raise HTTPException(status_code=404, detail="Approval request not found")
+
+        if acl.allows(user_id):
+            return acl
+
+        user = await self.validate_user_exists(user_id)
+        if Role.ADMIN not in user.roles:
+            raise HTTPException(status_code=403, detail=detail)
+        return acl
+
+    async def filter_accessible(self, request_ids: List[str], user_id: str) -> List[str]:
+        """조회 가능한 request_id만 원래 순서대로 반환 (목록 화면용, 없는 문서는 제외)"""
+        acls = await self.get_acls(request_ids)
+        if any(not acl.allows(user_id) for acl in acls.values()):
+            user = await self.validate_user_exists(user_id)
+            if Role.ADMIN in user.roles:
+                return [request_id for request_id in request_ids if request_id in acls]
+        return [
+            request_id for request_id in request_ids
+            if request_id in acls and acls[request_id].allows(user_id)
+        ]
+
+    async def get_acls(self, request_ids: List[str]) -> Dict[str, RequestAcl]:
+        """request_id별 ACL (요청 캐시 → Redis → DB 순서로 조회, 없는 문서는 빠진다)"""
+        unique_ids = list(dict.fromkeys(request_ids))
+        scope = request_cache()
+        result: Dict[str, RequestAcl] = {}
+        missing = []
+        for request_id in unique_ids:
+            if scope is not None and ("acl", request_id) in scope:
+                acl = scope[("acl", request_id)]
+                if acl is not None:
+                    result[request_id] = acl
+            else:
+                missing.append(request_id)
+        if not missing:
+            return result
+
+        loaded = await self._get_cached_acls(missing)
+        not_cached = [request_id for request_id in missing if request_id not in loaded]
+        if not_cached:
+            built = await self._build_acls(not_cached)
+            await self._set_cached_acls(list(built.values()))
+            loaded.update(built)
+
+        for request_id in missing:
+            acl = loaded.get(request_id)
+            if scope is not None:
+                scope[("acl", request_id)] = acl
+            if acl is not None:
+                result[request_id] = acl
+        return result
+
+    async def invalidate(self, request_id: str) -> None:
+        """결재선 변경/문서 삭제 시 ACL 캐시 무효화"""
+        scope = request_cache()
+        if scope is not None:
+            scope.pop(("acl", request_id), None)
+        try:
+            await self.redis.delete(_acl_cache_key(request_id))
+        except Exception as e:
+            logger.error(f"ACL 캐시 무효화 실패 (request_id={request_id}): {e}")
+
+    async def _build_acls(self, request_ids: List[str]) -> Dict[str, RequestAcl]:
+        requests, lines = await asyncio.gather(
+            self.approval_repo.find_by_ids(request_ids),
+            self.line_repo.find_by_request_ids(request_ids),
+        )
+        approver_ids: Dict[str, List[str]] = {request.id: [] for request in requests}
+        for line in lines:
+            if line.request_id in approver_ids and line.approver_id not in approver_ids[line.request_id]:
+                approver_ids[line.request_id].append(line.approver_id)
+        return {
+            request.id: RequestAcl(
+                request_id=request.id,
+                requester_id=request.requester_id,
+                approver_ids=approver_ids[request.id],
+            )
+            for request in requests
+        }
+
+    async def _get_cached_acls(self, request_ids: List[str]) -> Dict[str, RequestAcl]:
+        try:
+            cached_values = await self.redis.mget([_acl_cache_key(request_id) for request_id in request_ids])
+        except Exception as e:
+            logger.error(f"ACL 캐시 조회 실패: {e}")
+            return {}
+        return {
+            request_id: RequestAcl.model_validate_json(cached)
+            for request_id, cached in zip(request_ids, cached_values)
+            if cached
+        }
+
+    async def _set_cached_acls(self, acls: List[RequestAcl]) -> None:
+        # 없는 문서는 캐시하지 않는다 (생성 직후 조회가 막히지 않도록)
+        if not acls:
+            return
+        try:
+            pipeline = self.redis.pipeline()
+            for acl in acls:
+                pipeline.setex(_acl_cache_key(acl.request_id), settings.acl_cache_ttl_seconds, acl.model_dump_json())
+            await pipeline.execute()
+        except Exception as e:
+            logger.error(f"ACL 캐시 저장 실패: {e}")
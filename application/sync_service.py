@@ -1,6 +1,10 @@
 # app/services/sync_status_service.py
 
+import json
 from datetime import datetime, timezone
+from typing import Any, Dict
+
+from application.redis_service import SYNC_STATUS_CHANNEL
 from infra.db_models.sync_status import SyncStatus
 from redis.asyncio import Redis
 from utils.time import get_utc_now_naive
@@ -30,3 +34,7 @@ class SyncService:
 
         return status.syncing
 
+    async def publish_status(self, message: Dict[str, Any]) -> None:
+        """동기화 상태를 저장하고 sync_status_channel로 모든 프로세스의 웹소켓에 알린다"""
+        await self.set_sync_status(message["syncing"])
+        await self.redis.publish(SYNC_STATUS_CHANNEL, json.dumps(message, default=str))
@@ -0,0 +1,91 @@
+"""user_id 조회 일괄 처리 (DataLoader 방식)
+
+같은 이벤트 루프 턴에 들어온 user_id 조회를 모아 Redis(CacheService) mget 한 번,
+캐시에 없는 사용자만 find_by_user_ids 한 번으로 가져온다. 요청 scope가 있으면
+같은 요청 안에서 같은 사용자는 다시 조회하지 않는다.
+
+읽기 전용 조회용이다. 반환값은 domain User이며 비밀번호는 캐시하지 않으므로
+password는 빈 문자열이다 (사용자 수정/로그인은 UserRepository를 직접 사용).
+"""
+import asyncio
+from typing import Any, Dict, List, Optional
+
+from application.cache_service import CacheService
+from common.request_scope import request_cache
+from domain.repository.user_repo import IUserRepository
+from domain.user import User
+
+USER_LOADER_KEY = "user_loader"
+
+
+class UserLoader:
+    def __init__(self, user_repo: IUserRepository, cache_service: Optional[CacheService] = None):
+        self.user_repo = user_repo
+        self.cache_service = cache_service
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+
+    async def load(self, user_id: str) -> Optional[User]:
+        """user_id 1건 조회 (없으면 None)"""
+        scope = request_cache()
+        key = (USER_LOADER_KEY, user_id)
+        future = scope.get(key) if scope is not None else None
+        if future is None:
+            future = self._pending.get(user_id)
+            if future is None:
+                future = asyncio.get_running_loop().create_future()
+                self._pending[user_id] = future
+                if self._flush_task is None:
+                    self._flush_task = asyncio.get_running_loop().create_task(self._flush())
+            if scope is not None:
+                scope[key] = future
+        try:
+            return await asyncio.shield(future)
+        except Exception:
+            # 실패한 조회는 요청 캐시에 남기지 않는다 (같은 배치에 합류한 다른 요청도 각자 지운다)
+            if scope is not None and scope.get(key) is future:
+                del scope[key]
+            raise
+
+    async def load_many(self, user_ids: List[str]) -> Dict[str, User]:
+        """여러 user_id 조회. 찾은 사용자만 {user_id: User}로 반환"""
+        unique_ids = list(dict.fromkeys(user_ids))
+        users = await asyncio.gather(*(self.load(user_id) for user_id in unique_ids))
+        return {user_id: user for user_id, user in zip(unique_ids, users) if user is not None}
+
+    async def _flush(self) -> None:
+        # 같은 턴에 들어온 다른 조회가 합류할 때까지 한 번 양보
+        await asyncio.sleep(0)
+        # 이 배치의 future를 공유 대기열에서 떼어 낸다. 이후 호출은 새 배치에 들어가므로
+        # 이 배치가 실패해도 실패한 future를 다시 쓰지 않는다 (요청 캐시에서는 load가 지운다)
+        pending, self._pending = self._pending, {}
+        self._flush_task = None
+        try:
+            users = await self._fetch(list(pending))
+        except Exception as e:
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for user_id, future in pending.items():
+            if not future.done():
+                future.set_result(users.get(user_id))
+
+    async def _fetch(self, user_ids: List[str]) -> Dict[str, User]:
+        users: Dict[str, User] = {}
+        if self.cache_service:
+            cached = await self.cache_service.get_users_by_user_ids(user_ids)
+            users.update({user_id: CacheService.deserialize_user(data) for user_id, data in cached.items()})
+
+        missing = [user_id for user_id in user_ids if user_id not in users]
+        if not missing:
+            return users
+
+        loaded: Dict[str, Dict[str, Any]] = {}
+        for user_doc in await self.user_repo.find_by_user_ids(missing):
+            # 같은 user_id 문서가 여러 개면 find_one처럼 먼저 찾은 문서를 쓴다
+            loaded.setdefault(user_doc.user_id, CacheService.serialize_user(user_doc))
+        if self.cache_service and loaded:
+            await self.cache_service.set_users_by_user_ids_cache(loaded)
+        users.update({user_id: CacheService.deserialize_user(data) for user_id, data in loaded.items()})
+        return users
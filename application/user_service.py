@@ -8,6 +8,8 @@ from ulid import ULID
 from redis.asyncio import Redis
 
 from application.base_service import BaseService
+from application.cache_service import CacheService
+from application.redis_service import PENDING_USERS_CHANNEL
 from common.auth import create_access_token, create_refresh_token, Role, ApprovalStatus
 from domain.repository.user_repo import IUserRepository
 from domain.user import User
@@ -19,11 +21,12 @@ from utils.slack import send_signup_notification
 
 class UserService(BaseService[User]):
     @inject
-    def __init__(self, user_repo: IUserRepository, redis: Redis):
+    def __init__(self, user_repo: IUserRepository, redis: Redis, cache_service: CacheService):
         super().__init__(user_repo)
         self.ulid = ULID()
         self.crypto = Crypto()
         self.redis = redis
+        self.cache_service = cache_service
 
     async def create_user(self, user_id: str, name: Optional[str], password: str, roles: list[Role]) -> User:
         _user = None
@@ -72,6 +75,7 @@ class UserService(BaseService[User]):
             reusable_request.approval_status = ApprovalStatus.PENDING
             reusable_request.updated_at = now
             updated_user = await reusable_request.save()
+            await self.cache_service.invalidate_user_cache(user_id)
             await self._broadcast_pending_count()
             return updated_user
 
@@ -101,7 +105,7 @@ class UserService(BaseService[User]):
         return user
 
     async def login(self, user_id: str, password: str):
-        user_doc = await self.user_repo.find_by_user_id(user_id)
+        user_doc = await self.user_repo.find_by_user_id(user_id, for_update=True)
 
         if not user_doc or not self.crypto.verify(password, user_doc.password):
             raise AuthenticationError("Incorrect username or password")
@@ -141,7 +145,10 @@ class UserService(BaseService[User]):
         password: Optional[str] = None,
         roles: Optional[list[Role]] = None,
     ) -> UserResponse:
-        user_doc = await self.validate_user_exists(user_id)
+        # 저장할 문서이므로 캐시가 아닌 DB에서 읽는다
+        user_doc = await self.user_repo.find_by_user_id(user_id, for_update=True)
+        if not user_doc:
+            raise NotFoundError(f"User not found: {user_id}")
 
         if password:
             user_doc.password = self.crypto.encrypt(password)
@@ -154,6 +161,7 @@ class UserService(BaseService[User]):
 
         user_doc.updated_at = get_utc_now_naive()
         updated_user_doc = await user_doc.save()
+        await self.cache_service.invalidate_user_cache(user_doc.user_id)
 
         return UserResponse.from_document(updated_user_doc)
 
@@ -165,6 +173,7 @@ class UserService(BaseService[User]):
         was_pending = user_doc.approval_status == ApprovalStatus.PENDING
 
         await user_doc.delete()
+        await self.cache_service.invalidate_user_cache(user_doc.user_id)
 
         if was_pending:
             await self._broadcast_pending_count()
@@ -179,6 +188,7 @@ class UserService(BaseService[User]):
 
         if approval_status == ApprovalStatus.REJECTED:
             await user_doc.delete()
+            await self.cache_service.invalidate_user_cache(user_doc.user_id)
             # 거절 시 pending 수 업데이트 브로드캐스트
             await self._broadcast_pending_count()
             return UserResponse.from_document(user_doc)
@@ -192,6 +202,7 @@ class UserService(BaseService[User]):
         user_doc.updated_at = get_utc_now_naive()
         
         updated_user_doc = await user_doc.save()
+        await self.cache_service.invalidate_user_cache(user_doc.user_id)
 
         # 승인 시 pending 수 업데이트 브로드캐스트
         await self._broadcast_pending_count()
@@ -220,7 +231,7 @@ class UserService(BaseService[User]):
         if user_doc:
             return user_doc
 
-        user_doc = await self.user_repo.find_by_user_id(user_id)
+        user_doc = await self.user_repo.find_by_user_id(user_id, for_update=True)
         if user_doc:
             return user_doc
 
@@ -290,6 +301,6 @@ class UserService(BaseService[User]):
         try:
             pending_count = await self.get_pending_users_count()
             message = {"pending_users_count": pending_count}
-            await self.redis.publish("pending_users_channel", json.dumps(message))
+            await self.redis.publish(PENDING_USERS_CHANNEL, json.dumps(message))
         except Exception as e:
             raise InternalServerError(f"대기 사용자 수 브로드캐스트 실패: {e}")
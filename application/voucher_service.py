@@ -11,11 +11,11 @@ from ulid import ULID
 from common.exceptions import ValidationError
 from domain.repository.voucher_repo import IVoucherRepository
 from domain.responses.voucher_response import VoucherResponse
-from domain.voucher import Company, SearchOption, VoucherFile
+from domain.voucher import Company, CrawlResult, SearchOption, VoucherFile
 from infra.db_models.voucher import Voucher as VoucherDocument
 from utils.pdf import Pdf
 from utils.time import get_utc_now_naive
-from utils.whg import Whg
+from utils.whg import ProgressCallback, Whg
 
 
 class VoucherService:
@@ -31,9 +31,9 @@ class VoucherService:
         company: Company = Company.BAEKSUNG,
         wehago_id: str = None,
         wehago_password: str = None,
-    ):
-        vouchers = await Whg().crawl_whg(company, year, month, wehago_id, wehago_password)
-        return await self._save_synced_vouchers(company, year, month, vouchers)
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> CrawlResult:
+        return await self.sync_many([company], year, month, wehago_id, wehago_password, on_progress)
 
     async def sync_many(
         self,
@@ -42,45 +42,58 @@ class VoucherService:
         month: int = None,
         wehago_id: str = None,
         wehago_password: str = None,
-    ) -> dict[Company, list]:
-        vouchers_by_company = await Whg().crawl_companies(
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> CrawlResult:
+        """수집에 성공한 (회사, 월)만 저장한다. 실패한 월은 result.failed_units로 확인한다.
+
+        on_progress로 월별 수집 결과, 저장 시작, 회사별 저장 건수를 알린다.
+        """
+        result = await Whg(on_progress).crawl_companies(
             companies, year, month, wehago_id, wehago_password
         )
-        synced_vouchers = await asyncio.gather(
-            *(
-                self._save_synced_vouchers(company, year, month, vouchers)
-                for company, vouchers in vouchers_by_company.items()
-            )
+        if on_progress:
+            await on_progress({"event": "saving"})
+        await asyncio.gather(
+            *(self._save_synced_vouchers(company, year, result, on_progress) for company in companies)
         )
-        return dict(zip(vouchers_by_company, synced_vouchers))
+        return result
 
-    async def _save_synced_vouchers(self, company: Company, year: int, month: int, vouchers: list):
+    async def _save_synced_vouchers(
+        self,
+        company: Company,
+        year: int,
+        result: CrawlResult,
+        on_progress: Optional[ProgressCallback] = None,
+    ):
+        # 수집에 실패한 월은 건드리지 않는다 (빈 결과를 "모두 삭제됨"으로 보지 않도록)
+        months = result.fetched_months(company)
+        if not months:
+            return
+        vouchers = result.vouchers(company)
 
-        # 3. 새로 수집한 ID 목록
+        # 1. 새로 수집한 ID 목록
         new_ids = {v.id for v in vouchers}
 
-        # 4. 기존 DB에 저장된 ID 목록 조회
-        if month is None:
-            # month가 None이면 연도 전체 조회
-            existing_vouchers = await self.voucher_repo.find_by_company_and_year(
-                company, year
-            )
-        else:
-            # month가 있으면 해당 월만 조회
-            existing_vouchers = await self.voucher_repo.find_by_company_year_and_month(
-                company, year, month
-            )
+        # 2. 기존 DB에 저장된 ID 목록 조회 (수집에 성공한 월만)
+        existing_vouchers = await self.voucher_repo.find_by_company_year_and_months(
+            company, year, months
+        )
         existing_ids = {v.id for v in existing_vouchers}
 
-        # 5. 삭제 대상 ID 찾기 (기존에는 있었는데, 새로는 없음)
+        # 3. 삭제 대상 ID 찾기 (기존에는 있었는데, 새로는 없음)
         ids_to_delete = existing_ids - new_ids
 
         if ids_to_delete:
             await self.voucher_repo.delete_by_ids(ids_to_delete)
 
         await self.voucher_repo.save(vouchers)
-
-        return vouchers
+        if on_progress:
+            await on_progress({
+                "event": "company_saved",
+                "company": company.value,
+                "rows_written": len(vouchers),
+                "rows_deleted": len(ids_to_delete),
+            })
 
     async def find_by_id(self, id: str) -> VoucherResponse:
         voucher_doc = await self.voucher_repo.find_by_id(id)
@@ -0,0 +1,287 @@
+"""전표 동기화 작업 (POST /vouchers/sync)
+
+API는 동기화를 백그라운드 작업(voucher_sync)으로 등록하고 작업을 바로 돌려준다.
+워커(VoucherSyncRunner)는 크롤링과 저장을 하면서 회사/월별 진행 상황(수집한 월,
+파싱한 건수, 저장한 건수)을 sync_status_channel로 보낸다. 메시지는 누적 스냅샷이라
+웹소켓 대기열에서 최신 메시지로 덮어써도 잃는 정보가 없다.
+
+- 같은 사용자가 같은 조건(연도, 월, 회사 목록)으로 대기/실행 중인 동기화가 있으면 새로 등록하지 않고
+  그 작업을 돌려준다. 다른 사용자의 요청은 (자기 계정으로, 자기가 조회/취소할 수 있는) 별도 작업이 되고
+  VOUCHER_SYNC_LOCK으로 차례대로 실행된다.
+- 위하고 계정은 작업 payload(작업 조회 API로 보임)가 아니라 Redis에 작업 유지 시간 동안만 둔다.
+- 위하고 계정은 작업이 끝나거나(성공/취소) 재시도를 모두 실패하면 바로 지운다.
+- 취소는 크롤링 중에만 작업을 멈춘다. 저장을 시작하면 (삭제 후 저장 사이에 끊기지 않도록) 끝까지 저장한다.
+  취소는 작업을 등록한 사용자나 관리자만 할 수 있다.
+"""
+import asyncio
+import json
+from typing import Any, Dict, List, Optional
+
+from redis.asyncio import Redis
+from ulid import ULID
+
+from application.job_queue_service import JobDeferred, JobQueueService, VOUCHER_SYNC_JOB, job_key
+from application.base_service import BaseService
+from application.lock_service import LockService, VOUCHER_SYNC_LOCK
+from application.sync_service import SyncService
+from application.voucher_service import VoucherService
+from common.exceptions import ConflictError, NotFoundError, ValidationError
+from domain.background_job import BackgroundJob, JobStatus
+from domain.repository.user_repo import IUserRepository
+from domain.voucher import Company
+from utils.logger import logger
+from utils.settings import settings
+
+ACTIVE_JOB_STATUSES = (JobStatus.PENDING, JobStatus.RUNNING)
+# 실행 중인 작업이 취소 요청을 확인하는 간격 (초)
+CANCEL_POLL_SECONDS = 1.0
+# 다른 동기화가 잠금을 잡고 있을 때 작업을 미루는 시간 (초, 시도 횟수는 쓰지 않음)
+LOCK_BUSY_DEFER_SECONDS = 30
+
+
+def _sync_signature(companies: List[Company], year: int, month: Optional[int], requested_by: str) -> str:
+    # 요청자를 넣어 다른 사용자가 조회/취소 권한이 없는 작업(과 남의 위하고 계정)에 합류하지 않게 한다
+    companies_key = ",".join(sorted(company.value for company in companies))
+    return ":".join([requested_by, str(year), str(month or "all"), companies_key])
+
+
+def _active_key(signature: str) -> str:
+    # 같은 조건으로 대기/실행 중인 작업 ID
+    return f"voucher_sync:active:{signature}"
+
+
+def _credentials_key(job_id: str) -> str:
+    return f"voucher_sync:credentials:{job_id}"
+
+
+def _cancel_key(job_id: str) -> str:
+    return f"voucher_sync:cancel:{job_id}"
+
+
+class VoucherSyncService(BaseService):
+    """동기화 작업 등록/취소 (API 쪽)"""
+
+    def __init__(self, redis: Redis, job_queue_service: JobQueueService, user_repo: IUserRepository):
+        super().__init__(user_repo)
+        self.redis = redis
+        self.job_queue_service = job_queue_service
+        self.ulid = ULID()
+
+    async def submit(
+        self,
+        companies: List[Company],
+        year: int,
+        month: Optional[int],
+        wehago_id: str,
+        wehago_password: str,
+        requested_by: str,
+    ) -> BackgroundJob:
+        """동기화 작업을 등록한다. 같은 사용자의 같은 조건 작업이 대기/실행 중이면 그 작업을 반환한다."""
+        ttl = settings.voucher_sync_job_ttl_seconds
+        signature = _sync_signature(companies, year, month, requested_by)
+        job_id = self.ulid.generate()
+
+        if not await self.redis.set(_active_key(signature), job_id, nx=True, ex=ttl):
+            active_id = await self.redis.get(_active_key(signature))
+            active_job = await self._find_job(active_id)
+            if active_id and (active_job is None or active_job.status in ACTIVE_JOB_STATUSES):
+                # 실행 중이면 그 작업, 다른 요청이 막 등록하는 중이면 같은 ID로 등록(idempotency key로 하나만 생김)
+                job_id = active_id
+                logger.info(f"Voucher sync {signature} is already queued as job {job_id}")
+            else:
+                # 워커가 정리하지 못하고 끝난 작업의 키
+                await self.redis.set(_active_key(signature), job_id, ex=ttl)
+
+        await self.redis.set(
+            _credentials_key(job_id),
+            json.dumps({"wehago_id": wehago_id, "wehago_password": wehago_password}),
+            nx=True,
+            ex=ttl,
+        )
+        return await self.job_queue_service.enqueue(
+            VOUCHER_SYNC_JOB,
+            {
+                "job_id": job_id,
+                "signature": signature,
+                "companies": [company.value for company in companies],
+                "year": year,
+                "month": month,
+                "requested_by": requested_by,
+            },
+            idempotency_key=job_key(VOUCHER_SYNC_JOB, job_id),
+            max_attempts=settings.voucher_sync_max_attempts,
+            job_id=job_id,
+            created_by=requested_by,
+        )
+
+    async def cancel(self, job_id: str, user_id: str) -> BackgroundJob:
+        """취소 요청. 대기 중이면 시작하자마자, 크롤링 중이면 1초 안에 멈춘다."""
+        job = await self.job_queue_service.get_job(job_id)
+        if job.job_type != VOUCHER_SYNC_JOB:
+            raise NotFoundError(f"Voucher sync job not found: {job_id}")
+        if job.created_by != user_id:
+            await self.validate_user_is_admin(user_id)
+        if job.status not in ACTIVE_JOB_STATUSES:
+            raise ConflictError("이미 끝난 동기화 작업입니다")
+        await self.redis.set(_cancel_key(job_id), "1", ex=settings.voucher_sync_job_ttl_seconds)
+        return job
+
+    async def _find_job(self, job_id: Optional[str]) -> Optional[BackgroundJob]:
+        if not job_id:
+            return None
+        try:
+            return await self.job_queue_service.get_job(job_id)
+        except NotFoundError:
+            return None
+
+
+class VoucherSyncRunner:
+    """voucher_sync 작업 핸들러 (워커 쪽)"""
+
+    def __init__(
+        self,
+        redis: Redis,
+        voucher_service: VoucherService,
+        lock_service: LockService,
+        sync_service: SyncService,
+    ):
+        self.redis = redis
+        self.voucher_service = voucher_service
+        self.lock_service = lock_service
+        self.sync_service = sync_service
+
+    async def handle_sync_job(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        job_id = payload["job_id"]
+        companies = [Company(company) for company in payload["companies"]]
+        status = {
+            "syncing": True,
+            "job_id": job_id,
+            "status": "running",
+            "phase": "crawling",
+            "year": payload["year"],
+            "month": payload["month"],
+            "companies": {
+                company.value: {
+                    "months_fetched": [],
+                    "months_failed": [],
+                    "rows_parsed": 0,
+                    "rows_written": 0,
+                    "rows_deleted": 0,
+                }
+                for company in companies
+            },
+        }
+
+        if await self._is_cancelled(job_id):
+            return await self._finish(payload, status, "cancelled")
+
+        raw_credentials = await self.redis.get(_credentials_key(job_id))
+        if not raw_credentials:
+            raise ValidationError("동기화 계정 정보가 만료되었습니다. 다시 요청해 주세요")
+        credentials = json.loads(raw_credentials)
+
+        # 다른 프로세스의 동기화나 스케줄 동기화와 겹치지 않도록
+        # (못 잡으면 실패로 치지 않고 미룬다: 긴 스케줄 동기화 동안 재시도 횟수를 다 써 버리지 않게)
+        async with self.lock_service.hold(VOUCHER_SYNC_LOCK) as acquired:
+            if not acquired:
+                raise JobDeferred(LOCK_BUSY_DEFER_SECONDS, "다른 전표 동기화가 진행 중입니다")
+            await self._publish_quietly(status)
+            try:
+                cancelled = await self._run_cancellable(
+                    job_id,
+                    status,
+                    self.voucher_service.sync_many(
+                        companies=companies,
+                        year=payload["year"],
+                        month=payload["month"],
+                        wehago_id=credentials["wehago_id"],
+                        wehago_password=credentials["wehago_password"],
+                        on_progress=lambda event: self._on_progress(status, event),
+                    ),
+                )
+            except Exception as e:
+                await self._publish_quietly({**status, "syncing": False, "status": "failed", "error": str(e)})
+                raise
+
+        if cancelled:
+            return await self._finish(payload, status, "cancelled")
+        # 재시도 후에도 실패한 월은 저장하지 않았다 (기존 전표 유지)
+        partial = any(company["months_failed"] for company in status["companies"].values())
+        return await self._finish(payload, status, "partial" if partial else "completed")
+
+    async def handle_sync_failure(self, payload: Dict[str, Any], error: str) -> None:
+        """작업 큐 실패 핸들러: 재시도를 모두 실패한 작업의 계정/키를 TTL을 기다리지 않고 지운다"""
+        await self._cleanup(payload)
+        logger.info(f"Voucher sync job {payload['job_id']} failed: {error}")
+
+    async def _run_cancellable(self, job_id: str, status: Dict[str, Any], sync) -> bool:
+        """동기화를 실행한다. 크롤링 중에 취소 요청이 오면 멈추고 True를 반환한다."""
+        sync_task = asyncio.create_task(sync)
+        cancel_requested = False
+
+        async def watch_cancel():
+            nonlocal cancel_requested
+            while not sync_task.done():
+                await asyncio.sleep(CANCEL_POLL_SECONDS)
+                # 저장 단계는 끊지 않는다 (Redis 조회 뒤에 다시 확인)
+                if await self._is_cancelled(job_id) and status["phase"] == "crawling":
+                    cancel_requested = True
+                    sync_task.cancel()
+                    return
+
+        watcher = asyncio.create_task(watch_cancel())
+        try:
+            await sync_task
+        except asyncio.CancelledError:
+            if not cancel_requested:
+                raise
+            return True
+        finally:
+            watcher.cancel()
+        return False
+
+    async def _on_progress(self, status: Dict[str, Any], event: Dict[str, Any]) -> None:
+        if event["event"] == "saving":
+            status["phase"] = "saving"
+        elif event["event"] == "month_fetched":
+            company = status["companies"][event["company"]]
+            company["months_fetched"].append(event["month"])
+            company["rows_parsed"] += event["rows_parsed"]
+            if event["month"] in company["months_failed"]:
+                company["months_failed"].remove(event["month"])  # 재시도 성공
+        elif event["event"] == "month_failed":
+            company = status["companies"][event["company"]]
+            if event["month"] not in company["months_failed"]:
+                company["months_failed"].append(event["month"])
+        elif event["event"] == "company_saved":
+            company = status["companies"][event["company"]]
+            company["rows_written"] = event["rows_written"]
+            company["rows_deleted"] = event["rows_deleted"]
+        await self._publish_quietly(status)
+
+    async def _finish(self, payload: Dict[str, Any], status: Dict[str, Any], result: str) -> Dict[str, Any]:
+        status.update(syncing=False, status=result)
+        await self._publish_quietly(status)
+        await self._cleanup(payload)
+        logger.info(f"Voucher sync job {payload['job_id']} {result}")
+        return {"status": result, "companies": status["companies"]}
+
+    async def _cleanup(self, payload: Dict[str, Any]) -> None:
+        job_id = payload["job_id"]
+        try:
+            if await self.redis.get(_active_key(payload["signature"])) == job_id:
+                await self.redis.delete(_active_key(payload["signature"]))
+            await self.redis.delete(_credentials_key(job_id), _cancel_key(job_id))
+        except Exception as e:
+            # 남은 키는 voucher_sync_job_ttl_seconds 뒤에 사라진다
+            logger.error(f"Voucher sync job {job_id} cleanup failed: {e}")
+
+    async def _is_cancelled(self, job_id: str) -> bool:
+        return bool(await self.redis.exists(_cancel_key(job_id)))
+
+    async def _publish_quietly(self, status: Dict[str, Any]) -> None:
+        # 진행 상황 알림 실패 때문에 동기화를 멈추지 않는다
+        try:
+            await self.sync_service.publish_status(status)
+        except Exception as e:
+            logger.error(f"Voucher sync status publish failed: {e}")
@@ -1,92 +1,326 @@
+import asyncio
+from collections import deque
 from fastapi import WebSocket
-from typing import List, Dict
+from typing import Any, Awaitable, Callable, Deque, Dict, Iterable, Optional, Set, Union
+from utils import json_codec
 from utils.logger import logger
 
+# 웹소켓 구독 주제 (전송 대상은 주제를 구독한 연결로 한정된다)
+SYNC_STATUS_TOPIC = "sync_status"
+PENDING_USERS_TOPIC = "pending_users"
+
+# 느린 클라이언트를 끊을 때 쓰는 close code (1013: Try Again Later)
+SLOW_CLIENT_CLOSE_CODE = 1013
+
+# dict는 JSON text 프레임으로 인코딩하고, str은 이미 인코딩된 프레임으로 그대로 보낸다
+Message = Union[dict, str]
+# 메시지를 실제로 보낸 뒤 호출 (알림 inbox cursor 저장 등)
+OnSent = Callable[[WebSocket], Awaitable[None]]
+
+
+def approvals_topic(user_id: str) -> str:
+    """사용자별 전자결재 알림 주제"""
+    return f"approvals:{user_id}"
+
+
+class _Outgoing:
+    __slots__ = ("message", "coalesce_key", "on_sent")
+
+    def __init__(self, message: Message, coalesce_key: Optional[str], on_sent: Optional[OnSent] = None):
+        self.message = message
+        self.coalesce_key = coalesce_key
+        self.on_sent = on_sent
+
+
+class _Connection:
+    """연결 하나의 전송 대기열과 writer task"""
+
+    def __init__(self, websocket: WebSocket):
+        self.websocket = websocket
+        self.queue: Deque[_Outgoing] = deque()
+        # 아직 보내지 않은 coalesce_key 메시지 (같은 키가 오면 내용만 최신으로 바꾼다)
+        self.coalesced: Dict[str, _Outgoing] = {}
+        self.ready = asyncio.Event()
+        self.writer: Optional[asyncio.Task] = None
+        # 해제된 연결. writer는 깨어나거나 전송을 마치면 이 값을 보고 끝난다
+        self.closed = False
+
+
 class WebSocketManager:
-    def __init__(self):
-        self.active_connections: List[WebSocket] = []
-        self.user_connections: Dict[str, List[WebSocket]] = {}  # user_id -> websockets
+    """주제별 웹소켓 연결 관리
+
+    주제 -> 연결 집합과 연결 -> 주제/사용자 역참조를 함께 두어
+    연결/해제는 그 연결이 구독한 주제 수, 전송은 구독자 수에만 비례한다.
 
-    async def connect(self, websocket: WebSocket, user_id: str = None):
+    전송은 연결마다 크기가 제한된 대기열에 넣고 연결별 writer task가 보낸다.
+    느린 클라이언트가 다른 연결의 전송을 막지 않으며, 대기열이 넘치거나
+    전송이 send_timeout_seconds를 넘긴 연결은 끊는다. 최신 상태만 의미 있는
+    메시지(대기 건수 등)는 coalesce_key로 보내면 대기 중인 이전 메시지를 덮어쓴다.
+    """
+
+    def __init__(self, send_queue_size: int = 100, send_timeout_seconds: float = 10.0):
+        self.send_queue_size = send_queue_size
+        self.send_timeout_seconds = send_timeout_seconds
+        self.active_connections: Set[WebSocket] = set()
+        self.topic_connections: Dict[str, Set[WebSocket]] = {}  # topic -> websockets
+        self._connection_topics: Dict[WebSocket, Set[str]] = {}  # websocket -> topics
+        self._connection_users: Dict[WebSocket, str] = {}  # websocket -> user_id
+        self._connection_clients: Dict[WebSocket, str] = {}  # websocket -> client_id (기기 구분)
+        self._connections: Dict[WebSocket, _Connection] = {}
+        self._metrics = {
+            "enqueued": 0,
+            "sent": 0,
+            "coalesced": 0,
+            "send_errors": 0,
+            "evicted": 0,
+        }
+
+    async def connect(
+        self,
+        websocket: WebSocket,
+        user_id: str = None,
+        topics: Iterable[str] = (),
+        client_id: Optional[str] = None,
+    ):
+        """연결 수락 후 등록. user_id를 주면 approvals:{user_id} 주제도 구독한다.
+
+        client_id는 같은 사용자의 기기를 구분할 때 쓴다 (알림 inbox cursor).
+        """
         await websocket.accept()
-        self.active_connections.append(websocket)
-        
+        self.active_connections.add(websocket)
+        self._connection_topics[websocket] = set()
+        connection = _Connection(websocket)
+        connection.writer = asyncio.create_task(self._write_loop(connection))
+        self._connections[websocket] = connection
+
+        if client_id:
+            self._connection_clients[websocket] = client_id
+        if user_id:
+            self._connection_users[websocket] = user_id
+            self.subscribe(websocket, approvals_topic(user_id))
+        for topic in topics:
+            self.subscribe(websocket, topic)
+
         if user_id:
-            if user_id not in self.user_connections:
-                self.user_connections[user_id] = []
-            self.user_connections[user_id].append(websocket)
             logger.info(f"WebSocket connected for user {user_id}. Total: {len(self.active_connections)}")
         else:
             logger.info(f"WebSocket connected. Total: {len(self.active_connections)}")
 
+    def subscribe(self, websocket: WebSocket, topic: str) -> None:
+        if websocket not in self.active_connections:
+            return
+        self.topic_connections.setdefault(topic, set()).add(websocket)
+        self._connection_topics[websocket].add(topic)
+
+    def unsubscribe(self, websocket: WebSocket, topic: str) -> None:
+        self._connection_topics.get(websocket, set()).discard(topic)
+        connections = self.topic_connections.get(topic)
+        if connections is None:
+            return
+        connections.discard(websocket)
+        if not connections:
+            del self.topic_connections[topic]
+
     async def disconnect(self, websocket: WebSocket):
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
-            
-            # 사용자별 연결에서도 제거 - 딕셔너리 순회 중 삭제 방지
-            user_id_to_remove = None
-            for user_id, connections in self.user_connections.items():
-                if websocket in connections:
-                    connections.remove(websocket)
-                    if not connections:  # 빈 리스트면 사용자 항목 삭제 예약
-                        user_id_to_remove = user_id
-                    break
-            
-            # 순회 완료 후 안전하게 삭제
-            if user_id_to_remove:
-                del self.user_connections[user_id_to_remove]
-                    
+        connection = self._connections.get(websocket)
+        if self._unregister(websocket):
+            await self._wait_writer(connection)
             logger.info(f"WebSocket disconnected. Remaining: {len(self.active_connections)}")
 
-    async def broadcast(self, message: dict):
-        logger.debug(f"Broadcasting to {len(self.active_connections)} clients: {message}")
-        disconnected = []
+    def _unregister(self, websocket: WebSocket) -> bool:
+        if websocket not in self.active_connections:
+            return False
+        self.active_connections.discard(websocket)
+        for topic in self._connection_topics.pop(websocket, set()):
+            connections = self.topic_connections.get(topic)
+            if connections is not None:
+                connections.discard(websocket)
+                if not connections:
+                    del self.topic_connections[topic]
+        self._connection_users.pop(websocket, None)
+        self._connection_clients.pop(websocket, None)
 
-        for connection in self.active_connections:
-            try:
-                await connection.send_json(message)
-            except Exception as e:
-                logger.warning(f"Failed to send to a client: {e}")
-                disconnected.append(connection)
+        connection = self._connections.pop(websocket, None)
+        if connection:
+            connection.closed = True
+            connection.ready.set()
+            # 전송 중이면 취소로 깨운다. 전송이 막 끝나 취소가 무시돼도(wait_for) closed를 보고 끝난다
+            if connection.writer and connection.writer is not asyncio.current_task():
+                connection.writer.cancel()
+        return True
+
+    async def _wait_writer(self, connection: Optional[_Connection]) -> None:
+        """해제한 연결의 writer task가 끝날 때까지 기다린다 (최대 send_timeout_seconds)"""
+        if connection is None or connection.writer is None or connection.writer is asyncio.current_task():
+            return
+        await asyncio.wait({connection.writer}, timeout=self.send_timeout_seconds)
 
-        # 끊긴 연결은 정리
-        for conn in disconnected:
-            await self.disconnect(conn)
+    def send(
+        self,
+        websocket: WebSocket,
+        message: Message,
+        coalesce_key: Optional[str] = None,
+        on_sent: Optional[OnSent] = None,
+    ) -> bool:
+        """연결 하나의 대기열에 메시지를 넣는다 (dict는 JSON, str은 text 프레임)
 
-    async def send_to_user(self, user_id: str, message: dict):
-        """특정 사용자에게 메시지 전송"""
-        if user_id not in self.user_connections:
+        대기열이 가득 찬 연결은 끊고 False를 반환한다. on_sent는 writer가 실제로
+        보낸 뒤에 호출한다 (대기열에서 버려지면 호출하지 않는다).
+        """
+        connection = self._connections.get(websocket)
+        if connection is None:
+            return False
+        if not isinstance(message, str):
+            message = json_codec.dumps_text(message)
+
+        if coalesce_key is not None:
+            pending = connection.coalesced.get(coalesce_key)
+            if pending is not None:
+                pending.message = message
+                pending.on_sent = on_sent
+                self._metrics["coalesced"] += 1
+                return True
+
+        if len(connection.queue) >= self.send_queue_size:
+            self._evict(connection, "send queue overflow")
+            return False
+
+        outgoing = _Outgoing(message, coalesce_key, on_sent)
+        connection.queue.append(outgoing)
+        if coalesce_key is not None:
+            connection.coalesced[coalesce_key] = outgoing
+        connection.ready.set()
+        self._metrics["enqueued"] += 1
+        return True
+
+    async def publish(
+        self,
+        topic: str,
+        message: Message,
+        coalesce_key: Optional[str] = None,
+        on_sent: Optional[OnSent] = None,
+    ) -> int:
+        """topic 구독자 대기열에 넣는다. 넣은 연결 수를 반환한다."""
+        connections = list(self.topic_connections.get(topic, ()))  # 넘친 연결은 해제되므로 복사
+        logger.debug(f"Publishing to {len(connections)} {topic} clients: {message}")
+        frame = self._encode(message, connections)
+        return sum(self.send(connection, frame, coalesce_key, on_sent) for connection in connections)
+
+    async def broadcast(self, message: Message) -> int:
+        """모든 연결에 전송"""
+        connections = list(self.active_connections)
+        logger.debug(f"Broadcasting to {len(connections)} clients: {message}")
+        frame = self._encode(message, connections)
+        return sum(self.send(connection, frame) for connection in connections)
+
+    @staticmethod
+    def _encode(message: Message, connections) -> Message:
+        # 수신자가 여럿이어도 한 번만 인코딩한다
+        if not connections or isinstance(message, str):
+            return message
+        return json_codec.dumps_text(message)
+
+    async def send_to_user(
+        self,
+        user_id: str,
+        message: Message,
+        coalesce_key: Optional[str] = None,
+        on_sent: Optional[OnSent] = None,
+    ):
+        """특정 사용자에게 메시지 전송 (approvals:{user_id} 주제)"""
+        topic = approvals_topic(user_id)
+        total_connections = len(self.topic_connections.get(topic, ()))
+        if not total_connections:
             logger.warning(f"User {user_id} not connected")
             return False
 
-        connections = self.user_connections[user_id][:]  # 복사본 사용
-        disconnected = []
-        success_count = 0
-        total_connections = len(connections)
+        success_count = await self.publish(topic, message, coalesce_key, on_sent)
+        failed_count = total_connections - success_count
+        logger.info(f"User {user_id} message delivery: {success_count}/{total_connections} queued, {failed_count} failed")
+
+        return success_count > 0
+
+    async def _write_loop(self, connection: _Connection) -> None:
+        websocket = connection.websocket
+        while not connection.closed:
+            if not connection.queue:
+                connection.ready.clear()
+                await connection.ready.wait()
+                continue
+
+            outgoing = connection.queue.popleft()
+            if outgoing.coalesce_key is not None and connection.coalesced.get(outgoing.coalesce_key) is outgoing:
+                del connection.coalesced[outgoing.coalesce_key]
 
-        for connection in connections:
             try:
-                await connection.send_json(message)
-                success_count += 1
-                logger.debug(f"Message sent to user {user_id} connection")
+                await asyncio.wait_for(websocket.send_text(outgoing.message), timeout=self.send_timeout_seconds)
+                self._metrics["sent"] += 1
+            except asyncio.TimeoutError:
+                self._evict(connection, "send timeout")
+                return
             except Exception as e:
-                logger.warning(f"Failed to send to user {user_id}: {e}")
-                disconnected.append(connection)
-
-        # 끊긴 연결은 정리
-        for conn in disconnected:
-            await self.disconnect(conn)
-            
-        failed_count = len(disconnected)
-        logger.info(f"User {user_id} message delivery: {success_count}/{total_connections} success, {failed_count} failed")
-        
-        return success_count > 0
-            
+                self._metrics["send_errors"] += 1
+                logger.warning(f"Failed to send to a client: {e}")
+                await self.disconnect(websocket)
+                return
+
+            if outgoing.on_sent is not None:
+                try:
+                    await outgoing.on_sent(websocket)
+                except Exception as e:
+                    logger.error(f"WebSocket on_sent callback failed: {e}")
+
+    def _evict(self, connection: _Connection, reason: str) -> None:
+        """느린 클라이언트 해제. 등록은 바로 지우고 close는 백그라운드로 보낸다."""
+        websocket = connection.websocket
+        queued = len(connection.queue)
+        if not self._unregister(websocket):
+            return
+        self._metrics["evicted"] += 1
+        logger.warning(f"Evicting slow WebSocket client ({reason}, queued={queued})")
+        connection.queue.clear()
+        connection.coalesced.clear()
+        asyncio.get_running_loop().create_task(self._close_quietly(connection))
+
+    async def _close_quietly(self, connection: _Connection) -> None:
+        websocket = connection.websocket
+        await self._wait_writer(connection)
+        try:
+            await asyncio.wait_for(
+                websocket.close(code=SLOW_CLIENT_CLOSE_CODE, reason="Too slow"),
+                timeout=self.send_timeout_seconds,
+            )
+        except Exception:
+            pass
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """전송 통계 (이 프로세스 기준)"""
+        queue_sizes = [len(connection.queue) for connection in self._connections.values()]
+        return {
+            **self._metrics,
+            "connections": len(self.active_connections),
+            "queued": sum(queue_sizes),
+            "max_queue_depth": max(queue_sizes, default=0),
+            "send_queue_size": self.send_queue_size,
+        }
+
+    def get_user_id(self, websocket: WebSocket) -> Optional[str]:
+        return self._connection_users.get(websocket)
+
+    def get_client_id(self, websocket: WebSocket) -> Optional[str]:
+        return self._connection_clients.get(websocket)
+
+    def get_user_connection_counts(self) -> Dict[str, int]:
+        """사용자별 연결 수 (전자결재 알림 연결 기준)"""
+        counts: Dict[str, int] = {}
+        for user_id in self._connection_users.values():
+            counts[user_id] = counts.get(user_id, 0) + 1
+        return counts
+
     async def get_connection_count_for_user(self, user_id: str) -> int:
         """특정 사용자의 웹소켓 연결 수 반환"""
-        return len(self.user_connections.get(user_id, []))
-        
+        return len(self.topic_connections.get(approvals_topic(user_id), ()))
+
     async def is_user_connected(self, user_id: str) -> bool:
         """사용자가 웹소켓에 연결되어 있는지 확인"""
-        return user_id in self.user_connections and len(self.user_connections[user_id]) > 0
-
+        return bool(self.topic_connections.get(approvals_topic(user_id)))
@@ -15,6 +15,9 @@ SECRET_KEY = settings.secret_key
 ALGORITHM = "HS256"
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/users/login")
 
+# 워커/스케줄러처럼 로그인 사용자 없이 실행되는 작업의 주체 ID
+SYSTEM_USER_ID = "system"
+
 
 class Role(StrEnum):
     ADMIN = "ADMIN"
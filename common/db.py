@@ -1,5 +1,50 @@
 # db.py
+from beanie import init_beanie
 from motor.motor_asyncio import AsyncIOMotorClient
 from utils.settings import settings  # settings.db_url
+from infra.db_models.voucher import Voucher
+from infra.db_models.user import User
+from infra.db_models.file import File
+from infra.db_models.group import Group
+from infra.db_models.folder_read_state import FolderReadState
+from infra.db_models.document_template import DocumentTemplate
+from infra.db_models.approval_request import ApprovalRequest
+from infra.db_models.approval_line import ApprovalLine
+from infra.db_models.approval_favorite_group import ApprovalFavoriteGroup
+from infra.db_models.approval_history import ApprovalHistory
+from infra.db_models.attached_file import AttachedFile
+from infra.db_models.document_integrity import DocumentIntegrity
+from infra.db_models.wiki import WikiPage, WikiImage
+from infra.db_models.payment_task import PaymentTask
+from infra.db_models.background_job import BackgroundJob
+from infra.db_models.integrity_sweep_report import IntegritySweepReport
+from infra.db_models.integrity_merkle_epoch import IntegrityMerkleEpoch
 
 client = AsyncIOMotorClient(settings.db_url)
+
+
+async def init_db() -> None:
+    """beanie 초기화 (API 서버와 워커 프로세스 공통)"""
+    await init_beanie(
+        database=client.dup,
+        document_models=[
+            File,
+            User,
+            Voucher,
+            Group,
+            FolderReadState,
+            DocumentTemplate,
+            ApprovalRequest,
+            ApprovalLine,
+            ApprovalFavoriteGroup,
+            ApprovalHistory,
+            AttachedFile,
+            DocumentIntegrity,
+            WikiPage,
+            WikiImage,
+            PaymentTask,
+            BackgroundJob,
+            IntegritySweepReport,
+            IntegrityMerkleEpoch,
+        ],
+    )
@@ -0,0 +1,41 @@
+"""HTTP 요청 단위 캐시 (contextvar)
+
+한 요청 안에서 여러 서비스가 같은 조회(권한, 사용자 등)를 반복하지 않도록
+요청마다 새 dict를 열어 둔다. 요청 밖(워커, 스케줄러, 웹소켓)에서는 scope가 없으므로
+request_cache()가 None을 반환하고, 호출하는 쪽은 캐시 없이 동작해야 한다.
+웹소켓은 몇 시간씩 열려 있어 그동안 권한/사용자 캐시가 오래된 값이 되므로 열지 않는다.
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Optional
+
+_request_cache: ContextVar[Optional[Dict[Any, Any]]] = ContextVar("request_cache", default=None)
+
+
+def request_cache() -> Optional[Dict[Any, Any]]:
+    """현재 요청의 캐시 dict (요청 밖이면 None)"""
+    return _request_cache.get()
+
+
+@contextmanager
+def request_scope() -> Iterator[Dict[Any, Any]]:
+    """새 요청 캐시를 열고 블록이 끝나면 닫는다 (미들웨어, 스크립트, 테스트용)"""
+    token = _request_cache.set({})
+    try:
+        yield _request_cache.get()
+    finally:
+        _request_cache.reset(token)
+
+
+class RequestScopeMiddleware:
+    """HTTP 요청마다 request_scope를 여는 ASGI 미들웨어 (웹소켓 연결에는 열지 않는다)"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        with request_scope():
+            await self.app(scope, receive, send)
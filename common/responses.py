@@ -0,0 +1,12 @@
+from typing import Any
+
+from starlette.responses import JSONResponse
+
+from utils import json_codec
+
+
+class FastJSONResponse(JSONResponse):
+    """utils.json_codec으로 직렬화하는 기본 응답 클래스 (orjson이 있으면 orjson)"""
+
+    def render(self, content: Any) -> bytes:
+        return json_codec.dumps(content)
@@ -5,6 +5,8 @@ from redis.asyncio import Redis
 from application.voucher_service import VoucherService
 from application.file_service import FileService
 from application.user_service import UserService
+from application.cache_service import CacheService
+from application.user_loader import UserLoader
 from application.document_template_service import DocumentTemplateService
 from application.approval_service import ApprovalService
 from application.approval_line_service import ApprovalLineService
@@ -13,8 +15,19 @@ from application.document_number_service import DocumentNumberService
 from application.file_attachment_service import FileAttachmentService
 from application.integrity_service import IntegrityService
 from application.legal_archive_service import LegalArchiveService
+from application.request_access_service import RequestAccessService
 from application.payment_task_service import PaymentTaskService
 from application.payment_task_calendar_service import PaymentTaskCalendarService
+from application.job_queue_service import (
+    JobQueueService,
+    DOCUMENT_INTEGRITY_JOB,
+    LEGAL_ARCHIVE_JOB,
+    LEGAL_ARCHIVE_BACKFILL_JOB,
+    INTEGRITY_SWEEP_JOB,
+    INTEGRITY_MERKLE_SEAL_JOB,
+    PAYMENT_TASK_CALENDAR_SYNC_JOB,
+    VOUCHER_SYNC_JOB,
+)
 from infra.repository.file_repo import FileRepository
 from infra.repository.user_repo import UserRepository
 from infra.repository.voucher_repo import VoucherRepository
@@ -29,10 +42,16 @@ from infra.repository.attached_file_repo import AttachedFileRepository
 from infra.repository.document_integrity_repo import DocumentIntegrityRepository
 from infra.repository.wiki_repo import WikiRepository
 from infra.repository.payment_task_repo import PaymentTaskRepository
+from infra.repository.background_job_repo import BackgroundJobRepository
 from application.group_service import GroupService
 from application.websocket_manager import WebSocketManager
 from application.approval_notification_service import ApprovalNotificationService
 from application.sync_service import SyncService
+from application.redis_service import RedisPubSubService
+from application.notification_bus import UserNotificationBus
+from application.notification_aggregator import NotificationAggregator
+from application.lock_service import LockService, LeaderElection, SCHEDULER_LEADER_LOCK
+from application.voucher_sync_service import VoucherSyncService, VoucherSyncRunner
 from utils.settings import settings
 
 class Container(containers.DeclarativeContainer):
@@ -54,10 +73,26 @@ class Container(containers.DeclarativeContainer):
         decode_responses=True,
     )
 
-    user_repo = providers.Factory(UserRepository)
-    user_service = providers.Factory(UserService, user_repo=user_repo, redis=redis)
+    cache_service = providers.Singleton(CacheService, redis=redis, enabled=settings.cache_enabled)
 
-    group_repo = providers.Factory(GroupRepository)
+    # 여러 프로세스에서 겹치면 안 되는 작업(전표 동기화 등)의 Redis 락
+    lock_service = providers.Singleton(
+        LockService, redis=redis, default_ttl_seconds=settings.distributed_lock_ttl_seconds
+    )
+    # 스케줄러 작업은 리더 프로세스 하나만 실행한다
+    scheduler_leader = providers.Singleton(
+        LeaderElection,
+        redis=redis,
+        name=SCHEDULER_LEADER_LOCK,
+        ttl_seconds=settings.scheduler_leader_ttl_seconds,
+    )
+
+    user_repo = providers.Factory(UserRepository, cache_service=cache_service)
+    user_service = providers.Factory(UserService, user_repo=user_repo, redis=redis, cache_service=cache_service)
+    # 같은 턴의 user_id 조회를 한 번의 캐시/DB 조회로 묶는다 (결재/납부 화면)
+    user_loader = providers.Singleton(UserLoader, user_repo=user_repo, cache_service=cache_service)
+
+    group_repo = providers.Factory(GroupRepository, cache_service=cache_service)
     file_repo = providers.Factory(FileRepository)
     file_service = providers.Factory(
         FileService,
@@ -68,6 +103,15 @@ class Container(containers.DeclarativeContainer):
 
     voucher_repo = providers.Factory(VoucherRepository)
     voucher_service = providers.Factory(VoucherService, voucher_repo=voucher_repo)
+    sync_service = providers.Factory(SyncService, redis=redis)
+    # 전표 동기화 작업 핸들러 (크롤링/저장, 진행 상황 알림)
+    voucher_sync_runner = providers.Factory(
+        VoucherSyncRunner,
+        redis=redis,
+        voucher_service=voucher_service,
+        lock_service=lock_service,
+        sync_service=sync_service,
+    )
 
     folder_read_state_repo = providers.Factory(FolderReadStateRepository)
     group_service = providers.Factory(
@@ -79,9 +123,9 @@ class Container(containers.DeclarativeContainer):
     )
     
     # 전자결재 시스템 리포지토리
-    document_template_repo = providers.Factory(DocumentTemplateRepository)
+    document_template_repo = providers.Factory(DocumentTemplateRepository, cache_service=cache_service)
     approval_request_repo = providers.Factory(ApprovalRequestRepository)
-    approval_line_repo = providers.Factory(ApprovalLineRepository)
+    approval_line_repo = providers.Factory(ApprovalLineRepository, cache_service=cache_service)
     approval_favorite_group_repo = providers.Factory(ApprovalFavoriteGroupRepository)
     approval_history_repo = providers.Factory(ApprovalHistoryRepository)
     attached_file_repo = providers.Factory(AttachedFileRepository)
@@ -90,8 +134,19 @@ class Container(containers.DeclarativeContainer):
     payment_task_calendar_service = providers.Factory(
         PaymentTaskCalendarService,
         payment_task_repo=payment_task_repo,
+        lock_service=lock_service,
     )
     
+    # 결재 문서 접근 권한 (서비스 공통, Redis 캐시)
+    request_access_service = providers.Factory(
+        RequestAccessService,
+        approval_repo=approval_request_repo,
+        line_repo=approval_line_repo,
+        user_repo=user_repo,
+        redis=redis,
+        user_loader=user_loader,
+    )
+
     # 전자결재 시스템 서비스
     document_template_service = providers.Factory(
         DocumentTemplateService,
@@ -103,7 +158,9 @@ class Container(containers.DeclarativeContainer):
         ApprovalLineService,
         line_repo=approval_line_repo,
         approval_repo=approval_request_repo,
-        user_repo=user_repo
+        user_repo=user_repo,
+        access_service=request_access_service,
+        user_loader=user_loader,
     )
     
     approval_favorite_group_service = providers.Factory(
@@ -124,14 +181,36 @@ class Container(containers.DeclarativeContainer):
         file_repo=attached_file_repo,
         approval_repo=approval_request_repo,
         line_repo=approval_line_repo,
-        user_repo=user_repo
+        user_repo=user_repo,
+        access_service=request_access_service,
+        user_loader=user_loader,
     )
     
-    websocket_manager = providers.Singleton(WebSocketManager)
+    websocket_manager = providers.Singleton(
+        WebSocketManager,
+        send_queue_size=settings.ws_send_queue_size,
+        send_timeout_seconds=settings.ws_send_timeout_seconds,
+    )
+    # 사용자 알림 (다른 프로세스에 연결된 사용자에게도 전달, 오프라인 inbox)
+    notification_bus = providers.Singleton(UserNotificationBus, redis=redis, ws_manager=websocket_manager)
+    # 프로세스당 Redis 구독 하나로 sync/pending-users/사용자 알림을 웹소켓에 전달
+    redis_pubsub_service = providers.Singleton(
+        RedisPubSubService,
+        redis=redis,
+        ws_manager=websocket_manager,
+        notification_bus=notification_bus,
+    )
     
+    notification_aggregator = providers.Singleton(
+        NotificationAggregator,
+        notification_bus=notification_bus,
+        approval_line_repo=approval_line_repo,
+        window_seconds=settings.notification_batch_window_seconds,
+    )
     approval_notification_service = providers.Factory(
         ApprovalNotificationService,
-        websocket_manager=websocket_manager,
+        notification_bus=notification_bus,
+        notification_aggregator=notification_aggregator,
         approval_line_repo=approval_line_repo,
         approval_request_repo=approval_request_repo
     )
@@ -143,7 +222,8 @@ class Container(containers.DeclarativeContainer):
         approval_repo=approval_request_repo,
         line_repo=approval_line_repo,
         history_repo=approval_history_repo,
-        user_repo=user_repo
+        user_repo=user_repo,
+        access_service=request_access_service,
     )
     
     legal_archive_service = providers.Factory(
@@ -152,7 +232,35 @@ class Container(containers.DeclarativeContainer):
         line_repo=approval_line_repo,
         history_repo=approval_history_repo,
         user_repo=user_repo,
-        file_repo=attached_file_repo
+        file_repo=attached_file_repo,
+        access_service=request_access_service,
+        lock_service=lock_service,
+    )
+
+    # 백그라운드 작업 큐 (워커가 핸들러를 job_type으로 찾아 실행)
+    background_job_repo = providers.Factory(BackgroundJobRepository)
+    job_queue_service = providers.Singleton(
+        JobQueueService,
+        job_repo=background_job_repo,
+        handlers=providers.Dict({
+            DOCUMENT_INTEGRITY_JOB: integrity_service.provided.handle_integrity_job,
+            LEGAL_ARCHIVE_JOB: legal_archive_service.provided.handle_archive_job,
+            LEGAL_ARCHIVE_BACKFILL_JOB: legal_archive_service.provided.handle_backfill_job,
+            INTEGRITY_SWEEP_JOB: integrity_service.provided.handle_sweep_job,
+            INTEGRITY_MERKLE_SEAL_JOB: integrity_service.provided.handle_merkle_seal_job,
+            PAYMENT_TASK_CALENDAR_SYNC_JOB: payment_task_calendar_service.provided.handle_sync_job,
+            VOUCHER_SYNC_JOB: voucher_sync_runner.provided.handle_sync_job,
+        }),
+        failure_handlers=providers.Dict({
+            # 마지막 재시도까지 실패하면 위하고 계정을 바로 지운다
+            VOUCHER_SYNC_JOB: voucher_sync_runner.provided.handle_sync_failure,
+        }),
+    )
+    voucher_sync_service = providers.Factory(
+        VoucherSyncService,
+        redis=redis,
+        job_queue_service=job_queue_service,
+        user_repo=user_repo,
     )
 
     payment_task_service = providers.Factory(
@@ -162,6 +270,8 @@ class Container(containers.DeclarativeContainer):
         file_service=file_attachment_service,
         notification_service=approval_notification_service,
         payment_task_calendar_service=payment_task_calendar_service,
+        job_queue_service=job_queue_service,
+        user_loader=user_loader,
     )
 
     approval_service = providers.Factory(
@@ -175,9 +285,10 @@ class Container(containers.DeclarativeContainer):
         file_service=file_attachment_service,
         integrity_service=integrity_service,
         legal_archive_service=legal_archive_service,
+        job_queue_service=job_queue_service,
+        access_service=request_access_service,
+        user_loader=user_loader,
     )
 
-    sync_service = providers.Factory(SyncService, redis=redis)
-
     wiki_repo = providers.Factory(WikiRepository)
     wiki_service = providers.Factory(WikiService, wiki_repo=wiki_repo)
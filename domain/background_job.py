@@ -0,0 +1,37 @@
+from datetime import datetime
+from enum import StrEnum
+from typing import Any, Dict, Optional
+
+from pydantic import ConfigDict, Field
+
+from domain.responses.base_response import BaseResponse
+
+
+class JobStatus(StrEnum):
+    PENDING = "PENDING"        # 실행 대기 (재시도 대기 포함)
+    RUNNING = "RUNNING"        # 워커가 처리 중
+    SUCCEEDED = "SUCCEEDED"    # 처리 완료
+    FAILED = "FAILED"          # 최대 재시도 횟수 초과
+
+
+class BackgroundJob(BaseResponse):
+    """API 요청과 분리되어 워커가 처리하는 백그라운드 작업."""
+
+    id: str
+    job_type: str
+    idempotency_key: str
+    payload: Dict[str, Any] = Field(default_factory=dict)
+    status: JobStatus = JobStatus.PENDING
+    attempts: int = 0
+    max_attempts: int = 5
+    run_at: datetime
+    locked_at: Optional[datetime] = None
+    locked_by: Optional[str] = None
+    last_error: Optional[str] = None
+    result: Optional[Dict[str, Any]] = None
+    created_at: datetime
+    updated_at: datetime
+    completed_at: Optional[datetime] = None
+    created_by: Optional[str] = None  # 등록한 사용자 (스케줄러/시스템 작업은 None)
+
+    model_config = ConfigDict(extra="ignore")
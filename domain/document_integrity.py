@@ -16,6 +16,7 @@ class DocumentIntegrityResponse(BaseModel):
     verification_count: int = 0
     last_verified_at: Optional[datetime] = None
     is_tampered: bool = False
+    merkle_epoch_id: Optional[str] = None
     
     class Config:
         from_attributes = True
@@ -44,4 +45,74 @@ class IntegrityVerificationResponse(BaseModel):
     tampered_fields: List[str] = Field(default_factory=list)
     
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class TamperedDocument(BaseModel):
+    """일괄 검증에서 위변조가 감지된 문서"""
+    request_id: str
+    integrity_id: str
+    document_version: int
+    tampered_fields: List[str] = Field(default_factory=list)
+
+
+class IntegritySweepReport(BaseModel):
+    """전체 무결성 일괄 검증 결과 리포트"""
+    id: str
+    started_at: datetime
+    finished_at: datetime
+    checked_count: int = 0          # 검증한 결재 완료 문서 수
+    valid_count: int = 0
+    tampered_count: int = 0
+    missing_count: int = 0          # 무결성 기록이 없는 문서 수
+    tampered: List[TamperedDocument] = Field(default_factory=list)
+    missing_request_ids: List[str] = Field(default_factory=list)
+    
+    class Config:
+        from_attributes = True
+
+
+
+class MerkleProofStep(BaseModel):
+    hash: str
+    side: str                       # 형제 노드 위치 (left/right)
+
+
+class IntegrityInclusionProofResponse(BaseModel):
+    """무결성 기록의 Merkle 포함 증명"""
+    request_id: str
+    integrity_id: str
+    document_version: int
+    epoch_id: Optional[str] = None  # 아직 봉인되지 않았으면 None
+    leaf_hash: str
+    proof: List[MerkleProofStep] = Field(default_factory=list)
+    tree_root: Optional[str] = None
+    epoch_root: Optional[str] = None
+    is_valid: bool = False
+    
+    class Config:
+        from_attributes = True
+
+
+class IntegrityMerkleEpochResponse(BaseModel):
+    """일 단위 Merkle 봉인 에폭"""
+    id: str
+    cutoff_at: datetime
+    tree_root: Optional[str] = None
+    previous_root: Optional[str] = None
+    root: str
+    leaf_count: int = 0
+    created_at: datetime
+    
+    class Config:
+        from_attributes = True
+
+
+class MerkleEpochVerificationResponse(BaseModel):
+    """에폭 재계산 검증 결과"""
+    epoch_id: str
+    is_valid: bool
+    tree_root_valid: bool
+    chain_valid: bool
+    leaf_count: int
+    tampered_integrity_ids: List[str] = Field(default_factory=list)
+    verified_at: datetime
@@ -18,6 +18,10 @@ class IApprovalHistoryRepository(metaclass=ABCMeta):
     @abstractmethod
     async def find_by_request_id(self, request_id: str) -> List[ApprovalHistory]:
         raise NotImplementedError
+
+    @abstractmethod
+    async def find_by_request_ids(self, request_ids: List[str]) -> List[ApprovalHistory]:
+        raise NotImplementedError
     
     @abstractmethod
     async def find_by_approver_id(self, approver_id: str) -> List[ApprovalHistory]:
@@ -1,5 +1,5 @@
 from abc import ABCMeta, abstractmethod
-from typing import List, Optional
+from typing import Dict, List, Optional
 from domain.approval_line import ApprovalLine as ApprovalLineVo
 from infra.db_models.approval_line import ApprovalLine
 from common.auth import ApprovalStatus
@@ -18,6 +18,10 @@ class IApprovalLineRepository(metaclass=ABCMeta):
     @abstractmethod
     async def find_by_request_id(self, request_id: str) -> List[ApprovalLine]:
         raise NotImplementedError
+
+    @abstractmethod
+    async def find_by_request_ids(self, request_ids: List[str]) -> List[ApprovalLine]:
+        raise NotImplementedError
     
     @abstractmethod
     async def find_by_approver_id(self, approver_id: str, skip: int = 0, limit: int = 20) -> List[ApprovalLine]:
@@ -41,4 +45,8 @@ class IApprovalLineRepository(metaclass=ABCMeta):
     
     @abstractmethod
     async def find_pending_count_by_approver(self, approver_id: str) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_pending_counts_by_approvers(self, approver_ids: List[str]) -> Dict[str, int]:
         raise NotImplementedError
\ No newline at end of file
@@ -15,6 +15,10 @@ class IApprovalRequestRepository(metaclass=ABCMeta):
     async def find_by_id(self, request_id: str) -> Optional[ApprovalRequest]:
         raise NotImplementedError
     
+    @abstractmethod
+    async def find_by_ids(self, request_ids: List[str]) -> List[ApprovalRequest]:
+        raise NotImplementedError
+    
     @abstractmethod
     async def find_by_requester_id(self, requester_id: str, skip: int = 0, limit: int = 20) -> List[ApprovalRequest]:
         raise NotImplementedError
@@ -22,6 +26,13 @@ class IApprovalRequestRepository(metaclass=ABCMeta):
     @abstractmethod
     async def find_by_status(self, status: DocumentStatus, skip: int = 0, limit: int = 20) -> List[ApprovalRequest]:
         raise NotImplementedError
+
+    @abstractmethod
+    async def find_by_status_after(
+        self, status: DocumentStatus, after_id: Optional[str] = None, limit: int = 100
+    ) -> List[ApprovalRequest]:
+        """id 오름차순 커서 조회 (after_id 다음 문서부터 limit개)"""
+        raise NotImplementedError
     
     @abstractmethod
     async def find_by_approver_id(self, approver_id: str, skip: int = 0, limit: int = 20) -> List[ApprovalRequest]:
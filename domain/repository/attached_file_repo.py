@@ -18,6 +18,10 @@ class IAttachedFileRepository(metaclass=ABCMeta):
     async def find_by_request_id(self, request_id: str) -> List[AttachedFile]:
         raise NotImplementedError
 
+    @abstractmethod
+    async def find_by_request_ids(self, request_ids: List[str]) -> List[AttachedFile]:
+        raise NotImplementedError
+
     @abstractmethod
     async def find_by_payment_task_id(self, payment_task_id: str) -> List[AttachedFile]:
         raise NotImplementedError
@@ -0,0 +1,54 @@
+from abc import ABCMeta, abstractmethod
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from domain.background_job import BackgroundJob as BackgroundJobVo
+from infra.db_models.background_job import BackgroundJob
+
+
+class IBackgroundJobRepository(metaclass=ABCMeta):
+
+    @abstractmethod
+    async def save_if_absent(self, job: BackgroundJobVo) -> BackgroundJob:
+        """idempotency_key가 같은 작업이 이미 있으면 기존 작업을 반환 (FAILED 작업은 PENDING으로 되살려 반환)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_by_id(self, job_id: str) -> Optional[BackgroundJob]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_by_idempotency_keys(self, keys: List[str]) -> List[BackgroundJob]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def claim_next(
+        self, worker_id: str, job_types: List[str], now: datetime, stale_before: datetime
+    ) -> Optional[BackgroundJob]:
+        """실행 가능한 작업 하나를 원자적으로 RUNNING 상태로 가져온다"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def heartbeat(self, job_id: str, worker_id: str, now: datetime) -> bool:
+        """실행 중인 작업의 locked_at을 갱신한다 (다른 워커가 다시 가져가지 않도록)"""
+        raise NotImplementedError
+
+    # mark_*는 worker_id가 가져간 RUNNING 작업만 바꾸고, 바꾼 작업이 없으면 False를 반환한다
+    @abstractmethod
+    async def mark_succeeded(
+        self, job_id: str, worker_id: str, result: Optional[Dict[str, Any]], now: datetime
+    ) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def mark_retry(self, job_id: str, worker_id: str, error: str, run_at: datetime, now: datetime) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def defer(self, job_id: str, worker_id: str, run_at: datetime, now: datetime) -> bool:
+        """run_at까지 다시 대기시킨다. 가져갈 때 늘린 attempts를 되돌린다 (시도로 치지 않음)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def mark_failed(self, job_id: str, worker_id: str, error: str, now: datetime) -> bool:
+        raise NotImplementedError
@@ -1,8 +1,10 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime
 
 from infra.db_models.document_integrity import DocumentIntegrity
+from infra.db_models.integrity_sweep_report import IntegritySweepReport
+from infra.db_models.integrity_merkle_epoch import IntegrityMerkleEpoch
 
 
 class IDocumentIntegrityRepository(ABC):
@@ -12,6 +14,11 @@ class IDocumentIntegrityRepository(ABC):
         """무결성 기록 저장"""
         pass
     
+    @abstractmethod
+    async def save_many(self, integrities: List[DocumentIntegrity]) -> None:
+        """무결성 기록 일괄 저장"""
+        pass
+    
     @abstractmethod
     async def find_by_id(self, integrity_id: str) -> Optional[DocumentIntegrity]:
         """ID로 무결성 기록 조회"""
@@ -27,6 +34,11 @@ class IDocumentIntegrityRepository(ABC):
         """결재 요청 ID로 최신 무결성 기록 조회"""
         pass
     
+    @abstractmethod
+    async def find_latest_by_request_ids(self, request_ids: List[str]) -> Dict[str, DocumentIntegrity]:
+        """여러 결재 요청의 최신 무결성 기록 조회 (request_id별)"""
+        pass
+    
     @abstractmethod
     async def find_by_version(self, request_id: str, version: int) -> Optional[DocumentIntegrity]:
         """특정 버전의 무결성 기록 조회"""
@@ -45,4 +57,61 @@ class IDocumentIntegrityRepository(ABC):
     @abstractmethod
     async def get_chain_by_request_id(self, request_id: str) -> List[DocumentIntegrity]:
         """결재 요청의 무결성 체인 조회 (버전 순서대로)"""
-        pass
\ No newline at end of file
+        pass
+    
+    @abstractmethod
+    async def find_verification_snapshots(
+        self, after_request_id: Optional[str] = None, limit: int = 200
+    ) -> List[Dict[str, Any]]:
+        """결재 완료 문서와 결재선/히스토리/무결성 체인을 한 번에 조회 (request_id 오름차순 커서)"""
+        pass
+    
+    @abstractmethod
+    async def bulk_update_verification_info(
+        self, results: List[Tuple[str, bool]], verified_at: datetime
+    ) -> None:
+        """(무결성 기록 ID, 위변조 여부) 목록의 검증 정보를 한 번에 업데이트"""
+        pass
+    
+    @abstractmethod
+    async def save_sweep_report(self, report: IntegritySweepReport) -> IntegritySweepReport:
+        """일괄 검증 리포트 저장"""
+        pass
+    
+    @abstractmethod
+    async def find_latest_sweep_report(self) -> Optional[IntegritySweepReport]:
+        """가장 최근 일괄 검증 리포트 조회"""
+        pass
+
+    
+    @abstractmethod
+    async def find_unsealed_before(self, cutoff_at: datetime, epoch_id: str) -> List[DocumentIntegrity]:
+        """cutoff_at 이전에 생성되어 아직 봉인되지 않은 기록 (생성순). 중단된 epoch_id 봉인분 포함"""
+        pass
+    
+    @abstractmethod
+    async def bulk_set_merkle_proofs(
+        self, epoch_id: str, proofs: List[Tuple[str, int, List[Dict[str, Any]]]]
+    ) -> None:
+        """(무결성 기록 ID, 리프 위치, 포함 증명) 목록을 한 번에 저장"""
+        pass
+    
+    @abstractmethod
+    async def find_by_merkle_epoch(self, epoch_id: str) -> List[DocumentIntegrity]:
+        """에폭에 봉인된 기록 (리프 순서)"""
+        pass
+    
+    @abstractmethod
+    async def save_merkle_epoch(self, epoch: IntegrityMerkleEpoch) -> IntegrityMerkleEpoch:
+        """Merkle 에폭 저장"""
+        pass
+    
+    @abstractmethod
+    async def find_merkle_epoch(self, epoch_id: str) -> Optional[IntegrityMerkleEpoch]:
+        """Merkle 에폭 조회"""
+        pass
+    
+    @abstractmethod
+    async def find_latest_merkle_epoch(self) -> Optional[IntegrityMerkleEpoch]:
+        """가장 최근 Merkle 에폭 조회"""
+        pass
@@ -11,7 +11,7 @@ class IDocumentTemplateRepository(metaclass=ABCMeta):
         raise NotImplementedError
 
     @abstractmethod
-    async def find_by_id(self, template_id: str) -> Optional[DocumentTemplate]:
+    async def find_by_id(self, template_id: str, for_update: bool = False) -> Optional[DocumentTemplate]:
         raise NotImplementedError
     
     @abstractmethod
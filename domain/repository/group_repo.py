@@ -16,6 +16,10 @@ class IGroupRepository(metaclass=ABCMeta):
     async def find_by_id(self, id: str) -> Group:
         raise NotImplementedError
 
+    @abstractmethod
+    async def find_by_auth_user(self, user_id: str) -> List[Group]:
+        raise NotImplementedError
+
     @abstractmethod
     async def find(self, *filters: Any) -> List[Group]:
         raise NotImplementedError
@@ -32,6 +36,14 @@ class IGroupRepository(metaclass=ABCMeta):
     async def update(self, group: GroupVo) -> Group:
         raise NotImplementedError
 
+    @abstractmethod
+    async def save_document(self, group: Group) -> Group:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def invalidate_cache(self) -> None:
+        raise NotImplementedError
+
     @abstractmethod
     async def touch_file_activity(self, group_id: str, changed_at: datetime) -> None:
         raise NotImplementedError
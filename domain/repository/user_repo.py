@@ -12,7 +12,7 @@ class IUserRepository(metaclass=ABCMeta):
         raise NotImplementedError
 
     @abstractmethod
-    async def find_by_user_id(self, user_id: str) -> Optional[User]:
+    async def find_by_user_id(self, user_id: str, for_update: bool = False) -> Optional[User]:
         raise NotImplementedError
 
     @abstractmethod
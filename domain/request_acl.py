@@ -0,0 +1,14 @@
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+class RequestAcl(BaseModel):
+    """결재 문서 1건의 접근 권한 (기안자, 결재자). 관리자 여부는 사용자 쪽에서 판단한다."""
+
+    request_id: str
+    requester_id: str
+    approver_ids: List[str] = Field(default_factory=list)
+
+    def allows(self, user_id: str) -> bool:
+        return user_id == self.requester_id or user_id in self.approver_ids
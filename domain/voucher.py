@@ -71,3 +71,42 @@ class Voucher(BaseModel):
     company: Optional[Company] = None   
 
     model_config = ConfigDict(extra="ignore")  # 중요!
+
+
+class CrawlUnitStatus(str, Enum):
+    FETCHED = "FETCHED"
+    FAILED = "FAILED"
+
+
+class MonthCrawlResult(BaseModel):
+    """(회사, 월) 단위 전표 수집 결과"""
+    company: Company
+    year: int
+    month: int
+    # 아직 수집하지 못한 단위도 FAILED (재시도 대상)
+    status: CrawlUnitStatus = CrawlUnitStatus.FAILED
+    vouchers: List[Voucher] = Field(default_factory=list)
+    attempts: int = 0
+    error: Optional[str] = None
+
+
+class CrawlResult(BaseModel):
+    """Whg.crawl_companies 결과. 수집에 성공한 (회사, 월)만 저장/삭제 대상이 된다."""
+    units: List[MonthCrawlResult] = Field(default_factory=list)
+
+    @property
+    def fetched_units(self) -> List[MonthCrawlResult]:
+        return [unit for unit in self.units if unit.status == CrawlUnitStatus.FETCHED]
+
+    @property
+    def failed_units(self) -> List[MonthCrawlResult]:
+        return [unit for unit in self.units if unit.status == CrawlUnitStatus.FAILED]
+
+    def fetched_months(self, company: Company) -> List[int]:
+        return [unit.month for unit in self.fetched_units if unit.company == company]
+
+    def failed_months(self, company: Company) -> List[int]:
+        return [unit.month for unit in self.failed_units if unit.company == company]
+
+    def vouchers(self, company: Company) -> List[Voucher]:
+        return [voucher for unit in self.fetched_units if unit.company == company for voucher in unit.vouchers]
@@ -0,0 +1,39 @@
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from beanie import Document
+from pydantic import Field
+from pymongo import ASCENDING, DESCENDING, IndexModel
+
+from domain.background_job import JobStatus
+
+
+class BackgroundJob(Document):
+    """Mongo 기반 작업 큐의 작업 레코드."""
+
+    id: str
+    job_type: str                   # 작업 종류 (legal_archive, document_integrity ...)
+    idempotency_key: str            # 중복 등록 방지 키 (예: legal_archive:{request_id})
+    payload: Dict[str, Any] = Field(default_factory=dict)
+    status: JobStatus = JobStatus.PENDING
+    attempts: int = 0               # 지금까지 실행한 횟수
+    max_attempts: int = 5
+    run_at: datetime                # 다음 실행 가능 시각 (재시도 백오프 반영)
+    locked_at: Optional[datetime] = None    # 워커가 작업을 가져간 시각
+    locked_by: Optional[str] = None         # 작업을 가져간 워커 ID
+    last_error: Optional[str] = None
+    result: Optional[Dict[str, Any]] = None
+    created_at: datetime
+    updated_at: datetime
+    completed_at: Optional[datetime] = None
+    created_by: Optional[str] = None        # 등록한 사용자 (스케줄러/시스템 작업은 None)
+
+    class Settings:
+        name = "background_jobs"
+        indexes = [
+            # 같은 작업이 두 번 등록되지 않도록 보장
+            IndexModel([("idempotency_key", ASCENDING)], unique=True),
+            # 워커 폴링: 상태 + 실행 시각
+            IndexModel([("status", ASCENDING), ("run_at", ASCENDING)]),
+            IndexModel([("job_type", ASCENDING), ("created_at", DESCENDING)]),
+        ]
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
 from beanie import Document
 from pydantic import Field
@@ -19,6 +19,9 @@ class DocumentIntegrity(Document):
     verification_count: int = Field(default=0)  # 검증 횟수
     last_verified_at: Optional[datetime] = Field(default=None)  # 마지막 검증 시간
     is_tampered: bool = Field(default=False)    # 위변조 감지 여부
+    merkle_epoch_id: Optional[str] = Field(default=None)    # 봉인된 Merkle 에폭 ID
+    merkle_leaf_index: Optional[int] = Field(default=None)  # 에폭 트리의 리프 위치
+    merkle_proof: Optional[List[Dict[str, Any]]] = Field(default=None)  # 포함 증명 (형제 해시 목록)
     
     class Settings:
         name = "document_integrity"
@@ -31,4 +34,6 @@ class DocumentIntegrity(Document):
             IndexModel([("is_tampered", ASCENDING)]),
             # 복합 인덱스: request_id + version (버전 관리용)
             IndexModel([("request_id", ASCENDING), ("document_version", ASCENDING)]),
+            # 에폭 봉인/재검증: 에폭별 리프 순서
+            IndexModel([("merkle_epoch_id", ASCENDING), ("merkle_leaf_index", ASCENDING)]),
         ]
\ No newline at end of file
@@ -0,0 +1,23 @@
+from datetime import datetime
+from typing import Optional
+
+from beanie import Document
+from pydantic import Field
+from pymongo import IndexModel, DESCENDING
+
+
+class IntegrityMerkleEpoch(Document):
+    id: str                         # 에폭 ID (봉인 대상 날짜, KST YYYY-MM-DD)
+    cutoff_at: datetime             # 이 시각 이전에 생성된 미봉인 기록을 포함
+    tree_root: Optional[str] = Field(default=None)      # 이번 에폭 기록들의 Merkle 루트
+    previous_root: Optional[str] = Field(default=None)  # 직전 에폭 루트 (에폭 체인)
+    root: str                       # previous_root와 tree_root를 묶은 에폭 루트
+    leaf_count: int = Field(default=0)
+    created_at: datetime
+
+    class Settings:
+        name = "integrity_merkle_epochs"
+        indexes = [
+            # 최신 에폭 조회
+            IndexModel([("cutoff_at", DESCENDING)]),
+        ]
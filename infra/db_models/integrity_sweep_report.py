@@ -0,0 +1,25 @@
+from datetime import datetime
+from typing import Any, Dict, List
+
+from beanie import Document
+from pydantic import Field
+from pymongo import IndexModel, DESCENDING
+
+
+class IntegritySweepReport(Document):
+    id: str
+    started_at: datetime            # 일괄 검증 시작 시간
+    finished_at: datetime           # 일괄 검증 종료 시간
+    checked_count: int = 0          # 검증한 결재 완료 문서 수
+    valid_count: int = 0
+    tampered_count: int = 0
+    missing_count: int = 0          # 무결성 기록이 없는 문서 수
+    tampered: List[Dict[str, Any]] = Field(default_factory=list)    # 위변조 문서 (request_id, 필드)
+    missing_request_ids: List[str] = Field(default_factory=list)
+
+    class Settings:
+        name = "integrity_sweep_reports"
+        indexes = [
+            # 최신 리포트 조회
+            IndexModel([("started_at", DESCENDING)]),
+        ]
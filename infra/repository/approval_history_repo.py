@@ -1,5 +1,7 @@
 from typing import List, Optional
 
+from beanie.operators import In
+
 from domain.repository.approval_history_repo import IApprovalHistoryRepository
 from domain.approval_history import ApprovalHistory as ApprovalHistoryVo
 from infra.db_models.approval_history import ApprovalHistory
@@ -30,6 +32,16 @@ class ApprovalHistoryRepository(BaseRepository[ApprovalHistory], IApprovalHistor
     async def find_by_request_id(self, request_id: str) -> List[ApprovalHistory]:
         histories = await ApprovalHistory.find(ApprovalHistory.request_id == request_id).sort(-ApprovalHistory.created_at).to_list()
         return histories or []
+
+    async def find_by_request_ids(self, request_ids: List[str]) -> List[ApprovalHistory]:
+        """여러 request_id의 결재 이력을 한 번에 조회"""
+        if not request_ids:
+            return []
+
+        histories = await ApprovalHistory.find(
+            In(ApprovalHistory.request_id, request_ids)
+        ).sort(-ApprovalHistory.created_at).to_list()
+        return histories or []
     
     async def find_by_approver_id(self, approver_id: str) -> List[ApprovalHistory]:
         histories = await ApprovalHistory.find(ApprovalHistory.approver_id == approver_id).sort(-ApprovalHistory.created_at).to_list()
@@ -1,5 +1,7 @@
-from typing import List, Optional
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional
 
+from application.cache_service import CacheService
 from domain.repository.approval_line_repo import IApprovalLineRepository
 from domain.approval_line import ApprovalLine as ApprovalLineVo
 from infra.db_models.approval_line import ApprovalLine
@@ -9,9 +11,14 @@ from utils.logger import logger
 from beanie.operators import In
 
 
+# 결재 대기 건수 캐시 종류 (count:{user_id} 해시의 필드)
+PENDING_COUNT_CACHE = "approval_pending"
+
+
 class ApprovalLineRepository(BaseRepository[ApprovalLine], IApprovalLineRepository):
-    def __init__(self):
+    def __init__(self, cache_service: Optional[CacheService] = None):
         super().__init__(ApprovalLine)
+        self.cache_service = cache_service
 
     async def save(self, line: ApprovalLineVo) -> None:
         new_line = ApprovalLine(
@@ -27,12 +34,19 @@ class ApprovalLineRepository(BaseRepository[ApprovalLine], IApprovalLineReposito
             comment=line.comment,
         )
         await new_line.insert()
+        await self._invalidate_request_cache(line.request_id)
 
-    async def find_by_id(self, line_id: str) -> Optional[ApprovalLine]:
-        return await ApprovalLine.get(line_id)
-    
     async def find_by_request_id(self, request_id: str) -> List[ApprovalLine]:
+        if self.cache_service:
+            cached = await self.cache_service.get_approval_line_cache(request_id)
+            if cached is not None:
+                return [ApprovalLine.model_validate(data) for data in cached]
+
         lines = await ApprovalLine.find(ApprovalLine.request_id == request_id).sort(ApprovalLine.step_order).to_list()
+        if self.cache_service:
+            await self.cache_service.set_approval_line_cache(
+                request_id, [line.model_dump(mode="json") for line in lines]
+            )
         return lines or []
     
     async def find_by_approver_id(self, approver_id: str, skip: int = 0, limit: int = 20) -> List[ApprovalLine]:
@@ -76,7 +90,7 @@ class ApprovalLineRepository(BaseRepository[ApprovalLine], IApprovalLineReposito
         return lines or []
     
     async def update(self, line: ApprovalLineVo) -> ApprovalLine:
-        db_line = await self.find_by_id_or_raise(line.id, "ApprovalLine")
+        db_line = await self.find_by_id_or_raise(line.id, "ApprovalLine", for_update=True)
         db_line.request_id = line.request_id
         db_line.approver_id = line.approver_id
         db_line.step_order = line.step_order
@@ -86,12 +100,18 @@ class ApprovalLineRepository(BaseRepository[ApprovalLine], IApprovalLineReposito
         db_line.approved_at = line.approved_at
         db_line.comment = line.comment
         
-        return await db_line.save()
+        updated_line = await super().update(db_line)
+        await self._invalidate_request_cache(db_line.request_id)
+        return updated_line
     
     async def delete_by_request_id(self, request_id: str) -> None:
-        lines = await self.find_by_request_id(request_id)
+        lines = await ApprovalLine.find(ApprovalLine.request_id == request_id).to_list()
+        if not lines:
+            return
+        await ApprovalLine.find(ApprovalLine.request_id == request_id).delete()
         for line in lines:
-            await line.delete()
+            self._forget(line)
+        await self._invalidate_request_cache(request_id, [line.approver_id for line in lines])
     
     async def find_by_request_ids(self, request_ids: List[str]) -> List[ApprovalLine]:
         """여러 request_id의 결재선을 한 번에 조회"""
@@ -126,55 +146,97 @@ class ApprovalLineRepository(BaseRepository[ApprovalLine], IApprovalLineReposito
         
         # MongoDB bulk insert
         await ApprovalLine.insert_many(db_lines)
+        for request_id in {line.request_id for line in db_lines}:
+            await self._invalidate_request_cache(request_id)
 
     async def find_pending_count_by_approver(self, approver_id: str) -> int:
-        """실제 결재 가능한 대기 건수를 효율적으로 계산"""
-        # 1. 결재자의 모든 PENDING 결재선 조회 (1번의 DB 호출)
+        """실제 결재 가능한 대기 건수 (결재선이 바뀌면 캐시 무효화)"""
+        if self.cache_service:
+            cached = await self.cache_service.get_count_cache(PENDING_COUNT_CACHE, approver_id)
+            if cached is not None:
+                return cached
+
+        count = (await self._count_pending_by_approvers([approver_id]))[approver_id]
+        if self.cache_service:
+            await self.cache_service.set_count_cache(PENDING_COUNT_CACHE, approver_id, count)
+        return count
+
+    async def find_pending_counts_by_approvers(self, approver_ids: List[str]) -> Dict[str, int]:
+        """여러 결재자의 대기 건수 (캐시에 없는 결재자는 DB 조회 2번으로 함께 계산)"""
+        approver_ids = list(dict.fromkeys(approver_ids))
+        counts: Dict[str, int] = {}
+        if self.cache_service:
+            counts = await self.cache_service.get_count_caches(PENDING_COUNT_CACHE, approver_ids)
+
+        missing = [approver_id for approver_id in approver_ids if approver_id not in counts]
+        if missing:
+            computed = await self._count_pending_by_approvers(missing)
+            if self.cache_service:
+                await self.cache_service.set_count_caches(PENDING_COUNT_CACHE, computed)
+            counts.update(computed)
+        return counts
+
+    async def _count_pending_by_approvers(self, approver_ids: List[str]) -> Dict[str, int]:
+        """실제 결재 가능한 대기 건수를 결재자별로 계산"""
+        counts = {approver_id: 0 for approver_id in approver_ids}
+
+        # 1. 결재자들의 모든 PENDING 결재선 조회 (1번의 DB 호출)
         pending_lines = await ApprovalLine.find(
-            ApprovalLine.approver_id == approver_id,
+            In(ApprovalLine.approver_id, approver_ids),
             ApprovalLine.status == ApprovalStatus.PENDING
         ).to_list()
         
         if not pending_lines:
-            return 0
+            return counts
         
         # 2. 관련된 모든 request_id의 결재선을 한번에 조회 (1번의 DB 호출)
-        request_ids = list(set(line.request_id for line in pending_lines))
+        request_ids_by_approver = defaultdict(set)
+        for line in pending_lines:
+            request_ids_by_approver[line.approver_id].add(line.request_id)
+        request_ids = list({line.request_id for line in pending_lines})
         all_lines = await ApprovalLine.find(
             In(ApprovalLine.request_id, request_ids)
         ).sort(ApprovalLine.step_order).to_list()
         
         # 3. 메모리에서 그룹화 및 계산 (DB 호출 없음)
-        from collections import defaultdict
         lines_by_request = defaultdict(list)
         for line in all_lines:
             lines_by_request[line.request_id].append(line)
         
-        # 4. 각 요청서별로 실제 결재 가능한지 확인
-        actual_count = 0
-        for request_id in request_ids:
-            request_lines = lines_by_request[request_id]
-            
-            # 내 결재선 찾기
-            my_line = next((line for line in request_lines if line.approver_id == approver_id), None)
-            if not my_line:
-                continue
-            
-            # 반려된 결재선이 있는지 확인
-            has_rejected = any(line.status == ApprovalStatus.REJECTED for line in request_lines)
-            if has_rejected:
-                continue
-            
-            # 이전 단계가 모두 완료되었는지 확인
-            can_approve = True
-            for line in request_lines:
-                if (line.step_order < my_line.step_order and 
-                    line.status == ApprovalStatus.PENDING):
-                    can_approve = False
-                    break
-            
-            if can_approve:
-                actual_count += 1
+        # 4. 결재자별, 요청서별로 실제 결재 가능한지 확인
+        for approver_id, approver_request_ids in request_ids_by_approver.items():
+            for request_id in approver_request_ids:
+                if self._can_approve(approver_id, lines_by_request[request_id]):
+                    counts[approver_id] += 1
+            logger.debug(f"Actual pending count for approver {approver_id}: {counts[approver_id]}")
+        return counts
+
+    @staticmethod
+    def _can_approve(approver_id: str, request_lines: List[ApprovalLine]) -> bool:
+        # 내 결재선 찾기
+        my_line = next((line for line in request_lines if line.approver_id == approver_id), None)
+        if not my_line:
+            return False
         
-        logger.debug(f"Actual pending count for approver {approver_id}: {actual_count}")
-        return actual_count
\ No newline at end of file
+        # 반려된 결재선이 있는지 확인
+        if any(line.status == ApprovalStatus.REJECTED for line in request_lines):
+            return False
+        
+        # 이전 단계가 모두 완료되었는지 확인
+        return not any(
+            line.step_order < my_line.step_order and line.status == ApprovalStatus.PENDING
+            for line in request_lines
+        )
+
+    async def _invalidate_request_cache(self, request_id: str, approver_ids: Optional[Iterable[str]] = None) -> None:
+        """결재선 캐시와 그 문서 결재자들의 대기 건수 캐시 무효화
+
+        대기 건수는 같은 문서의 앞 단계 상태에 따라 달라지므로 결재자 전원을 무효화한다.
+        """
+        if not self.cache_service:
+            return
+        await self.cache_service.invalidate_approval_line_cache(request_id)
+        if approver_ids is None:
+            lines = await ApprovalLine.find(ApprovalLine.request_id == request_id).to_list()
+            approver_ids = [line.approver_id for line in lines]
+        await self.cache_service.invalidate_count_caches(list(set(approver_ids)))
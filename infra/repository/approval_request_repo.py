@@ -32,9 +32,6 @@ class ApprovalRequestRepository(BaseRepository[ApprovalRequest], IApprovalReques
         )
         await new_request.insert()
 
-    async def find_by_id(self, request_id: str) -> Optional[ApprovalRequest]:
-        return await ApprovalRequest.get(request_id)
-    
     async def find_by_requester_id(self, requester_id: str, skip: int = 0, limit: int = 20) -> List[ApprovalRequest]:
         requests = await ApprovalRequest.find(
             ApprovalRequest.requester_id == requester_id
@@ -46,6 +43,16 @@ class ApprovalRequestRepository(BaseRepository[ApprovalRequest], IApprovalReques
             ApprovalRequest.status == status
         ).sort(-ApprovalRequest.created_at).skip(skip).limit(limit).to_list()
         return requests or []
+
+    async def find_by_status_after(
+        self, status: DocumentStatus, after_id: Optional[str] = None, limit: int = 100
+    ) -> List[ApprovalRequest]:
+        # skip 대신 _id 커서로 이어서 조회 (ULID라 생성 순서와 같다)
+        query = ApprovalRequest.find(ApprovalRequest.status == status)
+        if after_id:
+            query = query.find(ApprovalRequest.id > after_id)
+        requests = await query.sort(+ApprovalRequest.id).limit(limit).to_list()
+        return requests or []
     
     async def find_by_approver_id(self, approver_id: str, skip: int = 0, limit: int = 20) -> List[ApprovalRequest]:
         # Aggregation Pipeline으로 한 번에 조회 (성능 최적화)
@@ -88,7 +95,7 @@ class ApprovalRequestRepository(BaseRepository[ApprovalRequest], IApprovalReques
         return [ApprovalRequest(**doc) for doc in results] if results else []
     
     async def update(self, request: ApprovalRequestVo) -> ApprovalRequest:
-        db_request = await self.find_by_id_or_raise(request.id, "ApprovalRequest")
+        db_request = await self.find_by_id_or_raise(request.id, "ApprovalRequest", for_update=True)
         db_request.template_id = request.template_id
         db_request.document_number = request.document_number
         db_request.title = request.title
@@ -102,10 +109,11 @@ class ApprovalRequestRepository(BaseRepository[ApprovalRequest], IApprovalReques
         db_request.submitted_at = request.submitted_at
         db_request.completed_at = request.completed_at
         
-        return await db_request.save()
+        return await super().update(db_request)
     
     async def delete(self, request_id: str) -> None:
-        await self.delete_by_id(request_id)
+        entity = await self.find_by_id_or_raise(request_id, "ApprovalRequest", for_update=True)
+        await super().delete(entity)
     
     async def find_by_document_number(self, document_number: str) -> Optional[ApprovalRequest]:
         return await ApprovalRequest.find_one(ApprovalRequest.document_number == document_number)
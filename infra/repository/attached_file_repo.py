@@ -1,5 +1,7 @@
 from typing import List, Optional
 
+from beanie.operators import In
+
 from domain.repository.attached_file_repo import IAttachedFileRepository
 from domain.attached_file import AttachedFile as AttachedFileVo
 from infra.db_models.attached_file import AttachedFile
@@ -26,13 +28,20 @@ class AttachedFileRepository(BaseRepository[AttachedFile], IAttachedFileReposito
         )
         await new_file.insert()
 
-    async def find_by_id(self, file_id: str) -> Optional[AttachedFile]:
-        return await AttachedFile.get(file_id)
-    
     async def find_by_request_id(self, request_id: str) -> List[AttachedFile]:
         files = await AttachedFile.find(AttachedFile.request_id == request_id).sort(-AttachedFile.uploaded_at).to_list()
         return files or []
 
+    async def find_by_request_ids(self, request_ids: List[str]) -> List[AttachedFile]:
+        """여러 request_id의 첨부파일을 한 번에 조회"""
+        if not request_ids:
+            return []
+
+        files = await AttachedFile.find(
+            In(AttachedFile.request_id, request_ids)
+        ).sort(-AttachedFile.uploaded_at).to_list()
+        return files or []
+
     async def find_by_payment_task_id(self, payment_task_id: str) -> List[AttachedFile]:
         files = await AttachedFile.find(
             AttachedFile.payment_task_id == payment_task_id
@@ -0,0 +1,159 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from beanie.operators import In
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+from domain.background_job import BackgroundJob as BackgroundJobVo, JobStatus
+from domain.repository.background_job_repo import IBackgroundJobRepository
+from infra.db_models.background_job import BackgroundJob
+from infra.repository.base_repo import BaseRepository
+
+
+class BackgroundJobRepository(BaseRepository[BackgroundJob], IBackgroundJobRepository):
+    def __init__(self):
+        super().__init__(BackgroundJob)
+
+    async def save_if_absent(self, job: BackgroundJobVo) -> BackgroundJob:
+        # model_dump()는 BaseResponse 직렬화(KST 변환)를 거치므로 원본 필드를 그대로 옮긴다
+        document = BackgroundJob(**dict(job))
+        try:
+            return await document.insert()
+        except DuplicateKeyError:
+            pass
+        # 재시도를 모두 실패한 작업은 다시 등록하면 처음부터 다시 실행한다 (대기/실행/성공한 작업은 그대로)
+        raw = await BackgroundJob.get_motor_collection().find_one_and_update(
+            {"idempotency_key": job.idempotency_key, "status": JobStatus.FAILED},
+            {
+                "$set": {
+                    "status": JobStatus.PENDING,
+                    "attempts": 0,
+                    "max_attempts": job.max_attempts,
+                    "payload": job.payload,
+                    "run_at": job.run_at,
+                    "locked_at": None,
+                    "locked_by": None,
+                    "result": None,
+                    "completed_at": None,
+                    "updated_at": job.updated_at,
+                }
+            },
+            return_document=ReturnDocument.AFTER,
+        )
+        if raw:
+            return BackgroundJob(**raw)
+        return await BackgroundJob.find_one(BackgroundJob.idempotency_key == job.idempotency_key)
+
+    async def find_by_id(self, job_id: str) -> Optional[BackgroundJob]:
+        return await BackgroundJob.get(job_id)
+
+    async def find_by_idempotency_keys(self, keys: List[str]) -> List[BackgroundJob]:
+        if not keys:
+            return []
+        jobs = await BackgroundJob.find(In(BackgroundJob.idempotency_key, keys)).to_list()
+        return jobs or []
+
+    async def claim_next(
+        self, worker_id: str, job_types: List[str], now: datetime, stale_before: datetime
+    ) -> Optional[BackgroundJob]:
+        # 대기 중인 작업 또는 워커가 죽어서 오래 RUNNING으로 남은 작업을 가져온다
+        query = {
+            "job_type": {"$in": job_types},
+            "$or": [
+                {"status": JobStatus.PENDING, "run_at": {"$lte": now}},
+                {"status": JobStatus.RUNNING, "locked_at": {"$lt": stale_before}},
+            ],
+        }
+        collection = BackgroundJob.get_motor_collection()
+        raw = await collection.find_one_and_update(
+            query,
+            {
+                "$set": {
+                    "status": JobStatus.RUNNING,
+                    "locked_at": now,
+                    "locked_by": worker_id,
+                    "updated_at": now,
+                },
+                "$inc": {"attempts": 1},
+            },
+            sort=[("run_at", 1)],
+            return_document=ReturnDocument.AFTER,
+        )
+        return BackgroundJob(**raw) if raw else None
+
+    async def heartbeat(self, job_id: str, worker_id: str, now: datetime) -> bool:
+        return await self._update_claimed(job_id, worker_id, {"locked_at": now, "updated_at": now})
+
+    async def mark_succeeded(
+        self, job_id: str, worker_id: str, result: Optional[Dict[str, Any]], now: datetime
+    ) -> bool:
+        return await self._update_claimed(
+            job_id,
+            worker_id,
+            {
+                "status": JobStatus.SUCCEEDED,
+                "result": result,
+                "last_error": None,
+                "locked_at": None,
+                "locked_by": None,
+                "completed_at": now,
+                "updated_at": now,
+            },
+        )
+
+    async def mark_retry(self, job_id: str, worker_id: str, error: str, run_at: datetime, now: datetime) -> bool:
+        return await self._update_claimed(
+            job_id,
+            worker_id,
+            {
+                "status": JobStatus.PENDING,
+                "last_error": error,
+                "run_at": run_at,
+                "locked_at": None,
+                "locked_by": None,
+                "updated_at": now,
+            },
+        )
+
+    async def defer(self, job_id: str, worker_id: str, run_at: datetime, now: datetime) -> bool:
+        return await self._update_claimed(
+            job_id,
+            worker_id,
+            {
+                "status": JobStatus.PENDING,
+                "run_at": run_at,
+                "locked_at": None,
+                "locked_by": None,
+                "updated_at": now,
+            },
+            inc={"attempts": -1},
+        )
+
+    async def mark_failed(self, job_id: str, worker_id: str, error: str, now: datetime) -> bool:
+        return await self._update_claimed(
+            job_id,
+            worker_id,
+            {
+                "status": JobStatus.FAILED,
+                "last_error": error,
+                "locked_at": None,
+                "locked_by": None,
+                "completed_at": now,
+                "updated_at": now,
+            },
+        )
+
+    async def _update_claimed(
+        self, job_id: str, worker_id: str, fields: Dict[str, Any], inc: Optional[Dict[str, int]] = None
+    ) -> bool:
+        # 이 워커가 가져간 RUNNING 작업만 바꾼다 (오래 걸려 다른 워커가 다시 가져갔으면 건드리지 않음)
+        collection = BackgroundJob.get_motor_collection()
+        update: Dict[str, Any] = {"$set": fields}
+        if inc:
+            update["$inc"] = inc
+        result = await collection.update_one(
+            {"_id": job_id, "status": JobStatus.RUNNING, "locked_by": worker_id},
+            update,
+        )
+        return result.matched_count > 0
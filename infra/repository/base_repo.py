@@ -1,13 +1,32 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import TypeVar, Generic, Optional, List, Any
+from typing import TypeVar, Generic, Optional, List, Any, Dict, Tuple
 from beanie import Document
 from common.exceptions import NotFoundError, InternalServerError
+from common.request_scope import request_cache
 
 T = TypeVar('T', bound=Document)
 
+# 요청 캐시(common.request_scope) 안에서 쓰는 키 접두어
+IDENTITY_MAP_KEY = "identity_map"
+IDENTITY_BATCH_KEY = "identity_batch"
+
+# 실행 중인 배치 조회 태스크 (완료 전에 GC되지 않도록 참조 유지)
+_flush_tasks = set()
+
 
 class BaseRepository(ABC, Generic[T]):
-    """Base repository class providing common CRUD operations."""
+    """Base repository class providing common CRUD operations.
+    
+    Inside an HTTP request scope, reads by ID go through a request-scoped
+    identity map: the same document is fetched once per request and returned
+    as the same instance, and lookups issued in the same event-loop tick are
+    batched into one ``$in`` query. Outside a request scope (workers,
+    scheduler, scripts) every read goes to the database.
+    """
+    
+    # _id 외에 identity map으로 조회할 고유 필드 (예: User.user_id)
+    identity_fields: Tuple[str, ...] = ()
     
     def __init__(self, model: type[T]):
         self.model = model
@@ -25,30 +44,39 @@ class BaseRepository(ABC, Generic[T]):
             InternalServerError: if creation fails
         """
         try:
-            return await entity.insert()
+            created = await entity.insert()
         except Exception as e:
             raise InternalServerError(f"Failed to create {self.model.__name__}: {str(e)}")
+        self._remember(created)
+        return created
     
-    async def find_by_id(self, entity_id: str) -> Optional[T]:
+    async def find_by_id(self, entity_id: str, for_update: bool = False) -> Optional[T]:
         """Find an entity by its ID.
         
         Args:
             entity_id: The ID of the entity to find
+            for_update: Skip the request-scoped identity map and read the
+                current document (read-modify-write paths)
             
         Returns:
             Optional[T]: The entity if found, None otherwise
         """
         try:
-            return await self.model.get(entity_id)
+            if for_update:
+                entity = await self.model.get(entity_id)
+                self._remember(entity)
+                return entity
+            return await self._load_by("_id", entity_id)
         except Exception:
             return None
     
-    async def find_by_id_or_raise(self, entity_id: str, entity_name: str = None) -> T:
+    async def find_by_id_or_raise(self, entity_id: str, entity_name: str = None, for_update: bool = False) -> T:
         """Find an entity by its ID or raise an exception.
         
         Args:
             entity_id: The ID of the entity to find
             entity_name: Custom name for error message
+            for_update: Skip the request-scoped identity map (see find_by_id)
             
         Returns:
             T: The entity if found
@@ -56,7 +84,7 @@ class BaseRepository(ABC, Generic[T]):
         Raises:
             NotFoundError: if entity is not found
         """
-        entity = await self.find_by_id(entity_id)
+        entity = await self.find_by_id(entity_id, for_update=for_update)
         if not entity:
             name = entity_name or self.model.__name__
             raise NotFoundError(f"{name} not found: {entity_id}")
@@ -87,9 +115,11 @@ class BaseRepository(ABC, Generic[T]):
             InternalServerError: if update fails
         """
         try:
-            return await entity.save()
+            updated = await entity.save()
         except Exception as e:
             raise InternalServerError(f"Failed to update {self.model.__name__}: {str(e)}")
+        self._remember(updated)
+        return updated
     
     async def delete(self, entity: T) -> bool:
         """Delete an entity.
@@ -105,9 +135,10 @@ class BaseRepository(ABC, Generic[T]):
         """
         try:
             await entity.delete()
-            return True
         except Exception as e:
             raise InternalServerError(f"Failed to delete {self.model.__name__}: {str(e)}")
+        self._forget(entity)
+        return True
     
     async def delete_by_id(self, entity_id: str) -> bool:
         """Delete an entity by its ID.
@@ -122,7 +153,7 @@ class BaseRepository(ABC, Generic[T]):
             NotFoundError: if entity is not found
             InternalServerError: if deletion fails
         """
-        entity = await self.find_by_id_or_raise(entity_id)
+        entity = await self.find_by_id_or_raise(entity_id, for_update=True)
         return await self.delete(entity)
     
     async def count(self, *filters: Any) -> int:
@@ -148,4 +179,82 @@ class BaseRepository(ABC, Generic[T]):
         Returns:
             bool: True if at least one entity matches
         """
-        return await self.count(*filters) > 0
\ No newline at end of file
+        return await self.count(*filters) > 0
+    
+    async def _load_by(self, field: str, value: Any) -> Optional[T]:
+        """Load one entity by a unique field through the request-scoped identity map.
+        
+        Concurrent lookups of the same field share one pending batch, which is
+        flushed as a single ``$in`` query on the next event-loop turn.
+        """
+        scope = request_cache()
+        if scope is None:
+            if field == "_id":
+                return await self.model.get(value)
+            return await self.model.find_one({field: value})
+        
+        key = (IDENTITY_MAP_KEY, self.model.__name__, field, value)
+        future = scope.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            scope[key] = future
+            batch_key = (IDENTITY_BATCH_KEY, self.model.__name__, field)
+            pending = scope.setdefault(batch_key, {})
+            pending[value] = future
+            if len(pending) == 1:
+                task = loop.create_task(self._flush_batch(scope, field))
+                _flush_tasks.add(task)
+                task.add_done_callback(_flush_tasks.discard)
+        # 대기 중인 호출이 취소돼도 같은 배치의 다른 호출은 결과를 받아야 한다
+        return await asyncio.shield(future)
+    
+    async def _flush_batch(self, scope: Dict[Any, Any], field: str) -> None:
+        # 같은 턴에 들어온 다른 조회가 배치에 합류할 때까지 한 번 양보
+        await asyncio.sleep(0)
+        pending = scope.pop((IDENTITY_BATCH_KEY, self.model.__name__, field), {})
+        if not pending:
+            return
+        try:
+            # find_one과 같은 순서(정렬 없음, 자연 순서)로 읽는다
+            entities = await self.model.find({field: {"$in": list(pending)}}).to_list()
+        except Exception as e:
+            for value, future in pending.items():
+                # 실패한 조회는 map에 남기지 않아 다음 호출에서 다시 시도한다
+                scope.pop((IDENTITY_MAP_KEY, self.model.__name__, field, value), None)
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        attribute = "id" if field == "_id" else field
+        found: Dict[Any, T] = {}
+        for entity in entities:
+            # 같은 값의 문서가 여러 개면 find_one처럼 먼저 찾은 문서를 쓴다 (예: 중복 user_id)
+            found.setdefault(getattr(entity, attribute), entity)
+        for value, future in pending.items():
+            entity = found.get(value)
+            if not future.done():
+                future.set_result(entity)
+            if entity is not None:
+                self._remember(entity)
+    
+    def _remember(self, entity: Optional[T]) -> None:
+        """Put a loaded or written entity into the request-scoped identity map."""
+        scope = request_cache()
+        if scope is None or entity is None:
+            return
+        for field, attribute in self._identity_keys():
+            future = asyncio.get_running_loop().create_future()
+            future.set_result(entity)
+            scope[(IDENTITY_MAP_KEY, self.model.__name__, field, getattr(entity, attribute, None))] = future
+    
+    def _forget(self, entity: Optional[T]) -> None:
+        """Drop a deleted entity from the request-scoped identity map."""
+        scope = request_cache()
+        if scope is None or entity is None:
+            return
+        for field, attribute in self._identity_keys():
+            scope.pop((IDENTITY_MAP_KEY, self.model.__name__, field, getattr(entity, attribute, None)), None)
+    
+    def _identity_keys(self) -> List[Tuple[str, str]]:
+        return [("_id", "id")] + [(field, field) for field in self.identity_fields]
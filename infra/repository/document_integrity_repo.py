@@ -1,9 +1,14 @@
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime
 from beanie.operators import Eq
+from pymongo import UpdateOne
 
+from common.auth import DocumentStatus
 from domain.repository.document_integrity_repo import IDocumentIntegrityRepository
+from infra.db_models.approval_request import ApprovalRequest
 from infra.db_models.document_integrity import DocumentIntegrity
+from infra.db_models.integrity_sweep_report import IntegritySweepReport
+from infra.db_models.integrity_merkle_epoch import IntegrityMerkleEpoch
 
 
 class DocumentIntegrityRepository(IDocumentIntegrityRepository):
@@ -13,6 +18,12 @@ class DocumentIntegrityRepository(IDocumentIntegrityRepository):
         await integrity.save()
         return integrity
     
+    async def save_many(self, integrities: List[DocumentIntegrity]) -> None:
+        """무결성 기록 일괄 저장"""
+        if not integrities:
+            return
+        await DocumentIntegrity.insert_many(integrities)
+    
     async def find_by_id(self, integrity_id: str) -> Optional[DocumentIntegrity]:
         """ID로 무결성 기록 조회"""
         return await DocumentIntegrity.find_one(Eq(DocumentIntegrity.id, integrity_id))
@@ -30,6 +41,21 @@ class DocumentIntegrityRepository(IDocumentIntegrityRepository):
             sort=[("document_version", -1)]
         )
     
+    async def find_latest_by_request_ids(self, request_ids: List[str]) -> Dict[str, DocumentIntegrity]:
+        """여러 결재 요청의 최신 무결성 기록 조회 (request_id별)"""
+        if not request_ids:
+            return {}
+        
+        pipeline = [
+            {"$match": {"request_id": {"$in": request_ids}}},
+            {"$sort": {"request_id": 1, "document_version": -1}},
+            {"$group": {"_id": "$request_id", "latest": {"$first": "$$ROOT"}}},
+        ]
+        latest = {}
+        async for doc in DocumentIntegrity.get_motor_collection().aggregate(pipeline):
+            latest[doc["_id"]] = DocumentIntegrity(**doc["latest"])
+        return latest
+    
     async def find_by_version(self, request_id: str, version: int) -> Optional[DocumentIntegrity]:
         """특정 버전의 무결성 기록 조회"""
         return await DocumentIntegrity.find_one(
@@ -65,4 +91,108 @@ class DocumentIntegrityRepository(IDocumentIntegrityRepository):
         """결재 요청의 무결성 체인 조회 (버전 순서대로)"""
         return await DocumentIntegrity.find(
             Eq(DocumentIntegrity.request_id, request_id)
-        ).sort(DocumentIntegrity.document_version).to_list()
\ No newline at end of file
+        ).sort(DocumentIntegrity.document_version).to_list()
+    
+    async def find_verification_snapshots(
+        self, after_request_id: Optional[str] = None, limit: int = 200
+    ) -> List[Dict[str, Any]]:
+        """결재 완료 문서와 결재선/히스토리/무결성 체인을 한 번에 조회 (request_id 오름차순 커서)"""
+        match: Dict[str, Any] = {"status": DocumentStatus.APPROVED.value}
+        if after_request_id:
+            match["_id"] = {"$gt": after_request_id}
+        
+        pipeline = [
+            {"$match": match},
+            {"$sort": {"_id": 1}},
+            {"$limit": limit},
+            {"$lookup": {"from": "approval_lines", "localField": "_id", "foreignField": "request_id", "as": "approval_lines"}},
+            {"$lookup": {"from": "approval_histories", "localField": "_id", "foreignField": "request_id", "as": "histories"}},
+            {"$lookup": {"from": "document_integrity", "localField": "_id", "foreignField": "request_id", "as": "chain"}},
+        ]
+        
+        snapshots = []
+        async for doc in ApprovalRequest.get_motor_collection().aggregate(pipeline):
+            approval_lines = doc.pop("approval_lines")
+            histories = doc.pop("histories")
+            chain = doc.pop("chain")
+            doc["id"] = doc.pop("_id")
+            snapshots.append({
+                "request": doc,
+                "approval_lines": approval_lines,
+                "histories": histories,
+                "chain": chain,
+            })
+        return snapshots
+    
+    async def bulk_update_verification_info(
+        self, results: List[Tuple[str, bool]], verified_at: datetime
+    ) -> None:
+        """(무결성 기록 ID, 위변조 여부) 목록의 검증 정보를 한 번에 업데이트"""
+        if not results:
+            return
+        
+        operations = [
+            UpdateOne(
+                {"_id": integrity_id},
+                {
+                    "$inc": {"verification_count": 1},
+                    "$set": {"last_verified_at": verified_at, "is_tampered": is_tampered},
+                },
+            )
+            for integrity_id, is_tampered in results
+        ]
+        await DocumentIntegrity.get_motor_collection().bulk_write(operations, ordered=False)
+    
+    async def save_sweep_report(self, report: IntegritySweepReport) -> IntegritySweepReport:
+        """일괄 검증 리포트 저장"""
+        await report.save()
+        return report
+    
+    async def find_latest_sweep_report(self) -> Optional[IntegritySweepReport]:
+        """가장 최근 일괄 검증 리포트 조회"""
+        return await IntegritySweepReport.find_one(sort=[("started_at", -1)])
+
+    
+    async def find_unsealed_before(self, cutoff_at: datetime, epoch_id: str) -> List[DocumentIntegrity]:
+        """cutoff_at 이전에 생성되어 아직 봉인되지 않은 기록 (생성순). 중단된 epoch_id 봉인분 포함"""
+        return await DocumentIntegrity.find(
+            {
+                "created_at": {"$lt": cutoff_at},
+                "merkle_epoch_id": {"$in": [None, epoch_id]},
+            }
+        ).sort(DocumentIntegrity.created_at, DocumentIntegrity.id).to_list()
+    
+    async def bulk_set_merkle_proofs(
+        self, epoch_id: str, proofs: List[Tuple[str, int, List[Dict[str, Any]]]]
+    ) -> None:
+        """(무결성 기록 ID, 리프 위치, 포함 증명) 목록을 한 번에 저장"""
+        if not proofs:
+            return
+        
+        operations = [
+            UpdateOne(
+                {"_id": integrity_id},
+                {"$set": {"merkle_epoch_id": epoch_id, "merkle_leaf_index": leaf_index, "merkle_proof": proof}},
+            )
+            for integrity_id, leaf_index, proof in proofs
+        ]
+        await DocumentIntegrity.get_motor_collection().bulk_write(operations, ordered=False)
+    
+    async def find_by_merkle_epoch(self, epoch_id: str) -> List[DocumentIntegrity]:
+        """에폭에 봉인된 기록 (리프 순서)"""
+        return await DocumentIntegrity.find(
+            Eq(DocumentIntegrity.merkle_epoch_id, epoch_id)
+        ).sort(DocumentIntegrity.merkle_leaf_index).to_list()
+    
+    async def save_merkle_epoch(self, epoch: IntegrityMerkleEpoch) -> IntegrityMerkleEpoch:
+        """Merkle 에폭 저장"""
+        await epoch.save()
+        return epoch
+    
+    async def find_merkle_epoch(self, epoch_id: str) -> Optional[IntegrityMerkleEpoch]:
+        """Merkle 에폭 조회"""
+        return await IntegrityMerkleEpoch.get(epoch_id)
+    
+    async def find_latest_merkle_epoch(self) -> Optional[IntegrityMerkleEpoch]:
+        """가장 최근 Merkle 에폭 조회"""
+        return await IntegrityMerkleEpoch.find_one(sort=[("cutoff_at", -1)])
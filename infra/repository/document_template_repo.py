@@ -1,14 +1,24 @@
 from typing import List, Optional
 
+from application.cache_service import CacheService
 from domain.repository.document_template_repo import IDocumentTemplateRepository
 from domain.document_template import DocumentTemplate as DocumentTemplateVo
 from infra.db_models.document_template import DocumentTemplate
 from infra.repository.base_repo import BaseRepository
 
 
+TEMPLATE_CACHE = "document_template"
+
+
 class DocumentTemplateRepository(BaseRepository[DocumentTemplate], IDocumentTemplateRepository):
-    def __init__(self):
+    """양식은 거의 바뀌지 않으므로 조회 결과를 2단계 캐시(메모리 → Redis)에 둔다.
+    
+    저장/수정/삭제 시 양식 캐시 전체를 무효화한다 (목록과 단건이 함께 바뀌므로).
+    """
+
+    def __init__(self, cache_service: Optional[CacheService] = None):
         super().__init__(DocumentTemplate)
+        self.cache_service = cache_service
 
     async def save(self, template: DocumentTemplateVo) -> None:
         new_template = DocumentTemplate(
@@ -24,24 +34,47 @@ class DocumentTemplateRepository(BaseRepository[DocumentTemplate], IDocumentTemp
             updated_at=template.updated_at,
         )
         await new_template.insert()
+        await self._invalidate_cache()
+
+    async def find_by_id(self, template_id: str, for_update: bool = False) -> Optional[DocumentTemplate]:
+        if for_update or not self.cache_service:
+            return await super().find_by_id(template_id, for_update=for_update)
+        cached = await self.cache_service.get_tiered(TEMPLATE_CACHE, f"id:{template_id}")
+        if cached:
+            return DocumentTemplate.model_validate(cached)
+        template = await super().find_by_id(template_id)
+        if template:
+            await self.cache_service.set_tiered(TEMPLATE_CACHE, f"id:{template_id}", template.model_dump(mode="json"))
+        return template
 
-    async def find_by_id(self, template_id: str) -> Optional[DocumentTemplate]:
-        return await DocumentTemplate.get(template_id)
-    
     async def find_all(self) -> List[DocumentTemplate]:
-        templates = await DocumentTemplate.find().to_list()
-        return templates or []
+        return await self._find_cached("all")
     
     async def find_by_category(self, category: str) -> List[DocumentTemplate]:
-        templates = await DocumentTemplate.find(DocumentTemplate.category == category).to_list()
-        return templates or []
+        return await self._find_cached(f"category:{category}", DocumentTemplate.category == category)
     
     async def find_active_templates(self) -> List[DocumentTemplate]:
-        templates = await DocumentTemplate.find(DocumentTemplate.is_active == True).to_list()
-        return templates or []
+        return await self._find_cached("active", DocumentTemplate.is_active == True)
+    
+    async def _find_cached(self, cache_key: str, *filters) -> List[DocumentTemplate]:
+        # 캐시에서 꺼낸 값은 매번 새 문서로 만들어 호출하는 쪽이 수정해도 캐시에 영향이 없다
+        if self.cache_service:
+            cached = await self.cache_service.get_tiered(TEMPLATE_CACHE, cache_key)
+            if cached is not None:
+                return [DocumentTemplate.model_validate(data) for data in cached]
+        templates = await DocumentTemplate.find(*filters).to_list() or []
+        if self.cache_service:
+            await self.cache_service.set_tiered(
+                TEMPLATE_CACHE, cache_key, [template.model_dump(mode="json") for template in templates]
+            )
+        return templates
+    
+    async def _invalidate_cache(self) -> None:
+        if self.cache_service:
+            await self.cache_service.invalidate_tiered(TEMPLATE_CACHE)
     
     async def update(self, template: DocumentTemplateVo) -> DocumentTemplate:
-        db_template = await self.find_by_id_or_raise(template.id, "DocumentTemplate")
+        db_template = await self.find_by_id_or_raise(template.id, "DocumentTemplate", for_update=True)
         db_template.name = template.name
         db_template.description = template.description
         db_template.category = template.category
@@ -51,8 +84,11 @@ class DocumentTemplateRepository(BaseRepository[DocumentTemplate], IDocumentTemp
         db_template.is_active = template.is_active
         db_template.updated_at = template.updated_at
         
-        return await db_template.save()
+        updated_template = await super().update(db_template)
+        await self._invalidate_cache()
+        return updated_template
     
     async def delete(self, template_id: str) -> None:
-        entity = await self.find_by_id_or_raise(template_id)
-        await super().delete(entity)
\ No newline at end of file
+        entity = await self.find_by_id_or_raise(template_id, for_update=True)
+        await super().delete(entity)
+        await self._invalidate_cache()
\ No newline at end of file
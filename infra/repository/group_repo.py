@@ -1,17 +1,29 @@
 from dataclasses import asdict
 from datetime import datetime
-from typing import Any
+from typing import Any, Optional
 
+from application.cache_service import CacheService
 from domain.group import Group as GroupVo
 from common.exceptions import NotFoundError
 from domain.repository.group_repo import IGroupRepository
 from infra.db_models.group import Group
 from infra.repository.base_repo import BaseRepository
+from beanie.operators import In
+
+
+GROUP_CACHE = "group"
 
 
 class GroupRepository(BaseRepository[Group], IGroupRepository):
-    def __init__(self):
+    """폴더(그룹)와 권한자 목록은 요청마다 확인하므로 2단계 캐시(메모리 → Redis)에 둔다.
+
+    그룹이 바뀌면 그룹 캐시 전체를 무효화한다 (권한자별 목록이 여러 그룹에 걸쳐 있으므로).
+    """
+
+    def __init__(self, cache_service: Optional[CacheService] = None):
         super().__init__(Group)
+        self.cache_service = cache_service
+
     async def save(self, group: GroupVo):
         new_group = Group(
             id=group.id,
@@ -21,15 +33,31 @@ class GroupRepository(BaseRepository[Group], IGroupRepository):
         )
 
         saved_group = await Group.insert(new_group)
+        await self._invalidate_cache()
 
         return saved_group
 
     async def find_by_id(self, id: str) -> Group:
+        cached = await self._get_cached(f"id:{id}")
+        if cached:
+            return Group.model_validate(cached)
+
         group = await Group.get(id)
         if not group:
             raise NotFoundError("Group not found")
+        await self._set_cached(f"id:{id}", group.model_dump(mode="json"))
         return group
 
+    async def find_by_auth_user(self, user_id: str) -> list[Group]:
+        """user_id가 권한자로 등록된 그룹 목록"""
+        cached = await self._get_cached(f"member:{user_id}")
+        if cached is not None:
+            return [Group.model_validate(data) for data in cached]
+
+        groups = await Group.find(In(Group.auth_users, [user_id])).to_list()
+        await self._set_cached(f"member:{user_id}", [group.model_dump(mode="json") for group in groups])
+        return groups
+
     async def find(self, *filters: Any) -> list[Group]:
         groups = await Group.find(*filters).to_list()
 
@@ -50,6 +78,7 @@ class GroupRepository(BaseRepository[Group], IGroupRepository):
         if not group:
             raise NotFoundError("Group not found")
         await group.delete(session=session)
+        await self._invalidate_cache()
 
     async def update(self, update_group: GroupVo):
         db_group = await Group.get(update_group.id)
@@ -64,8 +93,15 @@ class GroupRepository(BaseRepository[Group], IGroupRepository):
                 setattr(db_group, field, value)
 
         updated_group = await db_group.save()
+        await self._invalidate_cache()
         return updated_group
 
+    async def save_document(self, group: Group) -> Group:
+        """서비스에서 직접 수정한 그룹 문서 저장"""
+        saved_group = await group.save()
+        await self._invalidate_cache()
+        return saved_group
+
     async def touch_file_activity(self, group_id: str, changed_at: datetime) -> None:
         group = await Group.get(group_id)
         if not group:
@@ -74,3 +110,21 @@ class GroupRepository(BaseRepository[Group], IGroupRepository):
         if group.last_file_changed_at is None or group.last_file_changed_at < changed_at:
             group.last_file_changed_at = changed_at
             await group.save()
+            await self._invalidate_cache()
+
+    async def _get_cached(self, key: str):
+        if not self.cache_service:
+            return None
+        return await self.cache_service.get_tiered(GROUP_CACHE, key)
+
+    async def _set_cached(self, key: str, value) -> None:
+        if self.cache_service:
+            await self.cache_service.set_tiered(GROUP_CACHE, key, value)
+
+    async def invalidate_cache(self) -> None:
+        """그룹 캐시 전체 무효화 (트랜잭션 커밋 후 호출용)"""
+        await self._invalidate_cache()
+
+    async def _invalidate_cache(self) -> None:
+        if self.cache_service:
+            await self.cache_service.invalidate_tiered(GROUP_CACHE)
@@ -1,6 +1,7 @@
-from typing import List
+from typing import List, Optional
 from fastapi import HTTPException
 
+from application.cache_service import CacheService
 from common.auth import ApprovalStatus
 from common.exceptions import NotFoundError
 from domain.repository.user_repo import IUserRepository
@@ -11,8 +12,12 @@ from beanie.operators import In
 
 
 class UserRepository(BaseRepository[User], IUserRepository):
-    def __init__(self):
+    identity_fields = ("user_id",)
+
+    def __init__(self, cache_service: Optional[CacheService] = None):
         super().__init__(User)
+        self.cache_service = cache_service
+
     async def save(self, user: UserVo):
         new_user = User(
             id=user.id,
@@ -26,17 +31,31 @@ class UserRepository(BaseRepository[User], IUserRepository):
         )
 
         await new_user.insert()
+        await self._invalidate_cache(user.user_id)
 
-    async def find_by_user_id(self, user_id) -> User:
-        user = await User.find_one(User.user_id == user_id)
-        if not user:
-            return None
-        return user
+    async def find_by_user_id(self, user_id, for_update: bool = False) -> User | UserVo:
+        """user_id로 사용자 조회
+        
+        캐시(Redis)에는 비밀번호 해시가 없으므로 캐시 적중 시에는 Document가 아닌 읽기 전용
+        domain User(password는 빈 문자열)를 돌려준다. 빈 해시로 save()되는 일을 막기 위해서다.
+        로그인/수정/삭제처럼 문서를 검증하거나 저장하는 경로는 for_update=True로 DB를 직접 읽는다.
+        """
+        if for_update:
+            user = await User.find_one(User.user_id == user_id)
+            self._remember(user)
+            return user
 
-    async def find_by_id(self, id: str) -> User:
-        user = await User.get(id)
+        if self.cache_service:
+            cached = await self.cache_service.get_user_by_id(user_id)
+            if cached:
+                return CacheService.deserialize_user(cached)
+
+        # 같은 요청 안에서는 identity map으로 한 번만 조회
+        user = await self._load_by("user_id", user_id)
         if not user:
             return None
+        if self.cache_service:
+            await self.cache_service.set_user_cache(user_id, CacheService.serialize_user(user))
         return user
 
     async def find_all_by_user_id(self, user_id: str) -> list[User]:
@@ -50,14 +69,15 @@ class UserRepository(BaseRepository[User], IUserRepository):
         return users
     
     async def update(self, user: UserVo):
-        db_user = await User.get(user.id)
+        db_user = await self.find_by_id(user.id, for_update=True)
         if not db_user:
             raise NotFoundError("User not found")
         db_user.name = user.name
         db_user.password = user.password
         db_user.roles = user.roles
         db_user.updated_at = user.updated_at
-        updated_user = await db_user.save()
+        updated_user = await super().update(db_user)
+        await self._invalidate_cache(db_user.user_id)
         
         return updated_user
 
@@ -78,8 +98,13 @@ class UserRepository(BaseRepository[User], IUserRepository):
         return users or []
 
     async def delete_by_user_id(self, user_id: str) -> None:
-        user = await self.find_by_user_id(user_id)
+        user = await self.find_by_user_id(user_id, for_update=True)
         if not user:
             raise NotFoundError("User not found")
 
-        await user.delete()
+        await self.delete(user)
+        await self._invalidate_cache(user_id)
+
+    async def _invalidate_cache(self, user_id: str) -> None:
+        if self.cache_service:
+            await self.cache_service.invalidate_user_cache(user_id)
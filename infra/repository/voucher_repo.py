@@ -188,3 +188,14 @@ class VoucherRepository(BaseRepository[Voucher], IVoucherRepository):
         ).to_list()
 
         return db_vouchers
+
+    async def find_by_company_year_and_months(self, company: Company, year: int, months: list[int]) -> list[Voucher]:
+        db_vouchers = await Voucher.find(
+            And(
+                Voucher.company == company,
+                Voucher.year == str(year),
+                In(Voucher.month, [f"{month:02d}" for month in months]),
+            )
+        ).to_list()
+
+        return db_vouchers
@@ -6,6 +6,7 @@ from typing import Optional
 
 from application.websocket_manager import WebSocketManager
 from application.approval_notification_service import ApprovalNotificationService
+from application.notification_bus import UserNotificationBus
 from containers import Container
 from common.auth import decode_token
 from utils.logger import logger
@@ -19,12 +20,19 @@ router = APIRouter()
 async def approval_notifications_websocket(
     websocket: WebSocket,
     token: Optional[str] = Query(None),
+    last_event_id: Optional[str] = Query(None),
+    client_id: Optional[str] = Query(None),
     ws_manager: WebSocketManager = Depends(Provide[Container.websocket_manager]),
-    notification_service: ApprovalNotificationService = Depends(Provide[Container.approval_notification_service])
+    notification_service: ApprovalNotificationService = Depends(Provide[Container.approval_notification_service]),
+    notification_bus: UserNotificationBus = Depends(Provide[Container.notification_bus]),
 ):
     """
     전자결재 실시간 알림 웹소켓
-    URL: ws://localhost:8000/api/ws/approval-notifications?token=your_jwt_token
+    URL: ws://localhost:8000/api/ws/approval-notifications?token=your_jwt_token[&last_event_id=...][&client_id=...]
+
+    연결 직후 놓친 알림(inbox)을 replayed=true로 다시 보낸다. 알림의 event_id를
+    last_event_id로 넘기면 그 이후 알림만 받는다. 여러 기기에서 접속하면 기기마다
+    client_id를 넘겨야 기기별로 마지막으로 받은 알림을 기억한다.
     """
     user_id = None
     
@@ -42,7 +50,10 @@ async def approval_notifications_websocket(
         await websocket.close(code=4001, reason="Token required")
         return
     
-    await ws_manager.connect(websocket, user_id)
+    await ws_manager.connect(websocket, user_id, client_id=client_id)
+
+    # 연결이 끊긴 동안 쌓인 알림 전송
+    await notification_bus.replay(user_id, websocket, last_event_id)
     
     # 연결 즉시 현재 대기 결재 건수 전송
     await notification_service.notify_pending_count(user_id)
@@ -54,7 +65,7 @@ async def approval_notifications_websocket(
             
             # ping/pong 처리
             if data == "ping":
-                await websocket.send_text("pong")
+                ws_manager.send(websocket, "pong")
             elif data == "get_pending_count":
                 # 대기 건수 새로고침 요청
                 await notification_service.notify_pending_count(user_id)
@@ -73,8 +84,10 @@ async def approval_websocket_status(
     """전자결재 웹소켓 연결 상태 확인"""
     return {
         "total_connections": len(ws_manager.active_connections),
-        "user_connections": {
-            user_id: len(connections) 
-            for user_id, connections in ws_manager.user_connections.items()
-        }
+        "user_connections": ws_manager.get_user_connection_counts(),
+        "topics": {
+            topic: len(connections)
+            for topic, connections in ws_manager.topic_connections.items()
+        },
+        "metrics": ws_manager.get_metrics(),
     }
@@ -0,0 +1,24 @@
+from typing import Annotated
+
+from dependency_injector.wiring import Provide, inject
+from fastapi import APIRouter, Depends
+
+from application.cache_service import CacheService
+from common.auth import CurrentUser, Role, get_current_user
+from common.exceptions import PermissionError
+from containers import Container
+
+
+router = APIRouter(prefix="/cache", tags=["cache"])
+
+
+@router.get("/metrics")
+@inject
+async def get_cache_metrics(
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+    cache_service: CacheService = Depends(Provide[Container.cache_service]),
+) -> dict:
+    """캐시 종류별, 계층(local/redis)별 hit/miss 통계 (이 프로세스 기준, 관리자 전용)"""
+    if Role.ADMIN not in current_user.roles:
+        raise PermissionError("Only admin can view cache metrics")
+    return cache_service.get_metrics()
@@ -0,0 +1,29 @@
+from typing import Annotated
+
+from dependency_injector.wiring import Provide, inject
+from fastapi import APIRouter, Depends
+
+from application.job_queue_service import JobQueueService
+from application.user_service import UserService
+from common.auth import CurrentUser, get_current_user
+from containers import Container
+from domain.background_job import BackgroundJob
+
+
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+
+@router.get("/{job_id}")
+@inject
+async def get_job(
+    job_id: str,
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+    job_queue_service: JobQueueService = Depends(Provide[Container.job_queue_service]),
+    user_service: UserService = Depends(Provide[Container.user_service]),
+) -> BackgroundJob:
+    """백그라운드 작업 상태 조회 (등록한 사용자 또는 관리자)"""
+    job = await job_queue_service.get_job(job_id)
+    if job.created_by != current_user.id:
+        # payload/result에 다른 사용자의 작업 내용이 들어 있다
+        await user_service.validate_user_is_admin(current_user.id)
+    return job
@@ -1,19 +1,35 @@
-from typing import Annotated
+from typing import Annotated, List
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, HTTPException, status, Depends, Response
+from fastapi import APIRouter, HTTPException, status, Depends, Response, Query
 from fastapi.responses import StreamingResponse
 import io
 
 from application.integrity_service import IntegrityService
 from application.legal_archive_service import LegalArchiveService
+from application.request_access_service import RequestAccessService
+from application.job_queue_service import (
+    JobQueueService,
+    DOCUMENT_INTEGRITY_JOB,
+    LEGAL_ARCHIVE_JOB,
+    LEGAL_ARCHIVE_BACKFILL_JOB,
+    INTEGRITY_SWEEP_JOB,
+    INTEGRITY_MERKLE_SEAL_JOB,
+    job_key,
+)
 from common.auth import CurrentUser, get_current_user
 from containers import Container
 from domain.document_integrity import (
     DocumentIntegrityResponse, 
     DocumentIntegrityChainResponse, 
-    IntegrityVerificationResponse
+    IntegrityVerificationResponse,
+    IntegritySweepReport,
+    IntegrityInclusionProofResponse,
+    IntegrityMerkleEpochResponse,
+    MerkleEpochVerificationResponse,
 )
 from domain.responses.paginated_response import PaginatedResponse
+from domain.background_job import BackgroundJob
+from utils.settings import settings
 
 router = APIRouter(prefix="/legal", tags=["legal"])
 
@@ -53,6 +69,91 @@ async def get_tampered_documents(
     return PaginatedResponse.create(items, total, page, page_size)
 
 
+@router.post("/integrity/sweep")
+@inject
+async def run_integrity_sweep(
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+    integrity_service: IntegrityService = Depends(Provide[Container.integrity_service]),
+    job_queue_service: JobQueueService = Depends(Provide[Container.job_queue_service]),
+) -> BackgroundJob:
+    """무결성 일괄 검증 작업 등록 (관리자 전용)"""
+    await integrity_service.validate_user_is_admin(current_user.id)
+    return await job_queue_service.enqueue(INTEGRITY_SWEEP_JOB, {}, created_by=current_user.id)
+
+
+@router.get("/integrity/sweep/latest")
+@inject
+async def get_latest_integrity_sweep(
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+    integrity_service: IntegrityService = Depends(Provide[Container.integrity_service]),
+) -> IntegritySweepReport:
+    """최근 무결성 일괄 검증 리포트 조회 (관리자 전용)"""
+    return await integrity_service.get_latest_sweep_report(current_user.id)
+
+
+@router.get("/integrity/{request_id}/proof")
+@inject
+async def get_integrity_inclusion_proof(
+    request_id: str,
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+    integrity_service: IntegrityService = Depends(Provide[Container.integrity_service]),
+) -> IntegrityInclusionProofResponse:
+    """무결성 기록의 Merkle 포함 증명 조회"""
+    return await integrity_service.get_inclusion_proof(request_id, current_user.id)
+
+
+@router.get("/integrity/merkle/latest")
+@inject
+async def get_latest_merkle_epoch(
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+    integrity_service: IntegrityService = Depends(Provide[Container.integrity_service]),
+) -> IntegrityMerkleEpochResponse:
+    """최신 Merkle 에폭 루트 조회 (관리자 전용)"""
+    return await integrity_service.get_latest_merkle_epoch(current_user.id)
+
+
+@router.post("/integrity/merkle/seal")
+@inject
+async def seal_merkle_epoch(
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+    epoch_id: str | None = None,
+    integrity_service: IntegrityService = Depends(Provide[Container.integrity_service]),
+    job_queue_service: JobQueueService = Depends(Provide[Container.job_queue_service]),
+) -> BackgroundJob:
+    """Merkle 에폭 봉인 작업 등록 (관리자 전용, 기본: 전날)"""
+    await integrity_service.validate_user_is_admin(current_user.id)
+    payload = {"epoch_id": epoch_id} if epoch_id else {}
+    return await job_queue_service.enqueue(
+        INTEGRITY_MERKLE_SEAL_JOB,
+        payload,
+        idempotency_key=job_key(INTEGRITY_MERKLE_SEAL_JOB, epoch_id) if epoch_id else None,
+        created_by=current_user.id,
+    )
+
+
+@router.get("/integrity/merkle/{epoch_id}/verify")
+@inject
+async def verify_merkle_epoch(
+    epoch_id: str,
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+    integrity_service: IntegrityService = Depends(Provide[Container.integrity_service]),
+) -> MerkleEpochVerificationResponse:
+    """Merkle 에폭 재계산 검증 (관리자 전용)"""
+    return await integrity_service.verify_merkle_epoch(epoch_id, current_user.id)
+
+
+@router.post("/integrity/bulk-create")
+@inject
+async def create_document_integrities(
+    request_ids: List[str],
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+    integrity_service: IntegrityService = Depends(Provide[Container.integrity_service]),
+) -> list[DocumentIntegrityResponse]:
+    """여러 결재 문서의 무결성 기록 일괄 생성 (관리자 전용)"""
+    await integrity_service.validate_user_is_admin(current_user.id)
+    return await integrity_service.create_many(request_ids, current_user.id)
+
+
 @router.post("/integrity/{request_id}/create")
 @inject
 async def create_document_integrity(
@@ -96,6 +197,17 @@ async def download_legal_document(
         )
 
 
+@router.get("/archive/exists")
+@inject
+async def check_legal_documents_exist(
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+    request_ids: List[str] = Query(...),
+    legal_archive_service: LegalArchiveService = Depends(Provide[Container.legal_archive_service]),
+) -> dict[str, bool]:
+    """여러 결재 문서의 법적 문서 존재 여부 일괄 확인 (목록 화면용, 조회 권한이 있는 문서만)"""
+    return await legal_archive_service.verify_accessible_legal_documents_exist(request_ids, current_user.id)
+
+
 @router.get("/archive/{request_id}/exists")
 @inject
 async def check_legal_document_exists(
@@ -108,6 +220,52 @@ async def check_legal_document_exists(
     return {"request_id": request_id, "exists": exists}
 
 
+@router.get("/archive/{request_id}/jobs")
+@inject
+async def get_legal_archive_jobs(
+    request_id: str,
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+    job_queue_service: JobQueueService = Depends(Provide[Container.job_queue_service]),
+    request_access_service: RequestAccessService = Depends(Provide[Container.request_access_service]),
+) -> list[BackgroundJob]:
+    """결재 완료 후 등록된 무결성/법적 문서 생성 작업 상태 조회 (기안자, 결재자, 관리자)"""
+    await request_access_service.ensure_access(request_id, current_user.id, "No permission to access these jobs")
+    return await job_queue_service.get_jobs_by_keys([
+        job_key(DOCUMENT_INTEGRITY_JOB, request_id),
+        job_key(LEGAL_ARCHIVE_JOB, request_id),
+    ])
+
+
+@router.post("/archive/backfill")
+@inject
+async def backfill_legal_documents(
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+    regenerate: bool = False,
+    reset: bool = False,
+    batch_size: int | None = None,
+    max_requests: int | None = None,
+    legal_archive_service: LegalArchiveService = Depends(Provide[Container.legal_archive_service]),
+    job_queue_service: JobQueueService = Depends(Provide[Container.job_queue_service]),
+) -> BackgroundJob:
+    """결재 완료 문서 법적 PDF 일괄 생성 작업 등록 (관리자 전용)
+
+    작업 1건은 max_requests건까지만 처리하고 체크포인트를 남긴다.
+    결과의 completed가 false면 다시 호출해 이어서 처리한다.
+    """
+    await legal_archive_service.validate_user_is_admin(current_user.id)
+    return await job_queue_service.enqueue(
+        LEGAL_ARCHIVE_BACKFILL_JOB,
+        {
+            "created_by": current_user.id,
+            "regenerate": regenerate,
+            "reset": reset,
+            "batch_size": batch_size,
+            "max_requests": max_requests or settings.legal_backfill_job_max_requests,
+        },
+        created_by=current_user.id,
+    )
+
+
 @router.post("/archive/{request_id}/create")
 @inject
 async def create_legal_document(
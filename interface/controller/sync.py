@@ -1,9 +1,6 @@
-import json
-import asyncio
-from fastapi import APIRouter, WebSocket, Depends, WebSocketDisconnect, HTTPException, Query
+from fastapi import APIRouter, WebSocket, Depends, WebSocketDisconnect
 from dependency_injector.wiring import inject, Provide
-from redis.asyncio import Redis
-from application.websocket_manager import WebSocketManager
+from application.websocket_manager import PENDING_USERS_TOPIC, SYNC_STATUS_TOPIC, WebSocketManager
 from containers import Container
 from application.sync_service import SyncService
 from application.user_service import UserService
@@ -12,6 +9,9 @@ from utils.logger import logger
 
 router = APIRouter()
 
+# Redis 메시지는 lifespan의 RedisPubSubService가 프로세스당 한 번 구독해서
+# 주제별로 등록된 소켓에 전달한다. 여기서는 연결 등록과 최초 상태 전송만 한다.
+
 
 @router.websocket("/api/ws/sync-status")
 @inject
@@ -19,36 +19,14 @@ async def sync_status_websocket(
     websocket: WebSocket,
     ws_manager: WebSocketManager = Depends(Provide[Container.websocket_manager]),
     sync_service: SyncService = Depends(Provide[Container.sync_service]),
-    redis: Redis = Depends(Provide[Container.redis]),
 ):
-    await ws_manager.connect(websocket)
-
-    # ✅ 최초 상태 전송
-    current = await sync_service.get_current_status()
-    await websocket.send_json({"syncing": current})
-
-    # ✅ Redis 구독 준비
-    pubsub = redis.pubsub()
-    await pubsub.subscribe("sync_status_channel")
-
-    # ✅ Redis 메시지 처리 백그라운드 작업
-    async def redis_listener():
-        try:
-            while True:
-                message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
-                if message and message["type"] == "message":
-                    data = json.loads(message["data"])
-                    logger.debug(f"Redis PubSub received: {data}")
-                    await ws_manager.broadcast(data)
-        except Exception as e:
-            logger.error(f"Redis listener error: {e}")
-        finally:
-            await pubsub.unsubscribe("sync_status_channel")
-            await pubsub.close()
-
-    redis_task = asyncio.create_task(redis_listener())
+    await ws_manager.connect(websocket, topics=[SYNC_STATUS_TOPIC])
 
     try:
+        # ✅ 최초 상태 전송
+        current = await sync_service.get_current_status()
+        ws_manager.send(websocket, {"syncing": current}, coalesce_key=SYNC_STATUS_TOPIC)
+
         # ✅ WebSocket 종료 감지를 위한 main receive 루프
         while True:
             await websocket.receive_text()  # ← 여기서 끊기면 WebSocketDisconnect 발생
@@ -56,7 +34,6 @@ async def sync_status_websocket(
         logger.info("WebSocket disconnected")
     finally:
         await ws_manager.disconnect(websocket)
-        redis_task.cancel()
 
 
 @router.websocket("/api/ws/pending-users")
@@ -65,7 +42,6 @@ async def pending_users_websocket(
     websocket: WebSocket,
     ws_manager: WebSocketManager = Depends(Provide[Container.websocket_manager]),
     user_service: UserService = Depends(Provide[Container.user_service]),
-    redis: Redis = Depends(Provide[Container.redis]),
 ):
     # 웹소켓 인증 처리
     token = websocket.query_params.get("token")
@@ -93,39 +69,16 @@ async def pending_users_websocket(
         await websocket.close(code=4001, reason="Invalid token")
         return
     
-    await ws_manager.connect(websocket)
-
-    # 최초 pending 유저 수 전송
-    pending_count = await user_service.get_pending_users_count()
-    await websocket.send_json({"pending_users_count": pending_count})
-
-    # Redis 구독 준비
-    pubsub = redis.pubsub()
-    await pubsub.subscribe("pending_users_channel")
-
-    # Redis 메시지 처리 백그라운드 작업
-    async def redis_listener():
-        try:
-            while True:
-                message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
-                if message and message["type"] == "message":
-                    data = json.loads(message["data"])
-                    logger.debug(f"Pending users Redis PubSub received: {data}")
-                    await ws_manager.broadcast(data)
-        except Exception as e:
-            logger.error(f"Pending users Redis listener error: {e}")
-        finally:
-            await pubsub.unsubscribe("pending_users_channel")
-            await pubsub.close()
-
-    redis_task = asyncio.create_task(redis_listener())
+    await ws_manager.connect(websocket, topics=[PENDING_USERS_TOPIC])
 
     try:
+        # 최초 pending 유저 수 전송
+        pending_count = await user_service.get_pending_users_count()
+        ws_manager.send(websocket, {"pending_users_count": pending_count}, coalesce_key=PENDING_USERS_TOPIC)
+
         while True:
             await websocket.receive_text()
     except WebSocketDisconnect:
         logger.info("Pending users WebSocket disconnected")
     finally:
         await ws_manager.disconnect(websocket)
-        redis_task.cancel()
-
@@ -1,23 +1,22 @@
-import json
 from datetime import datetime
 from itertools import zip_longest
 from typing import Annotated
 from typing import Optional, List
 
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Body, Depends, HTTPException, Response
+from fastapi import APIRouter, Body, Depends, Response
 from fastapi import File
 from fastapi import Form
 from fastapi import UploadFile
 from pydantic import BaseModel, Field
-from redis.asyncio import Redis
 
-from application.sync_service import SyncService
 from application.voucher_service import VoucherService
+from application.voucher_sync_service import VoucherSyncService
 from common.auth import CurrentUser
 from common.auth import get_current_user
-from common.exceptions import InternalServerError, ValidationError
+from common.exceptions import ValidationError
 from containers import Container
+from domain.background_job import BackgroundJob
 from domain.responses.voucher_response import VoucherResponse
 from domain.voucher import Company
 
@@ -40,45 +39,36 @@ class SyncRequest(BaseModel):
     companies: list[Company] = Field(default_factory=list)
 
 
-@router.post("/sync")
+@router.post("/sync", status_code=202)
 @inject
 async def sync_whg(
     current_user: Annotated[CurrentUser, Depends(get_current_user)],
     sync_request: SyncRequest,
-    sync_service: SyncService = Depends(Provide[Container.sync_service]),
-    voucher_service: VoucherService = Depends(Provide[Container.voucher_service]),
-    redis: Redis = Depends(Provide[Container.redis]),
-):
-    # ✅ 상태 업데이트 + Redis Pub/Sub 전파만 수행
-    await sync_service.set_sync_status(True)
-    await redis.publish("sync_status_channel", json.dumps({"syncing": True}))
-
-    try:
-        companies = sync_request.companies
-        if companies:
-            await voucher_service.sync_many(
-                companies=companies,
-                year=sync_request.year,
-                month=sync_request.month,
-                wehago_id=sync_request.wehago_id,
-                wehago_password=sync_request.wehago_password,
-            )
-        else:
-            await voucher_service.sync(
-                company=sync_request.company,
-                year=sync_request.year,
-                month=sync_request.month,
-                wehago_id=sync_request.wehago_id,
-                wehago_password=sync_request.wehago_password,
-            )
-        return {"message": "Sync completed successfully", "companies": companies or [sync_request.company]}
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise InternalServerError(f"동기화 오류: {e}")
-    finally:
-        await sync_service.set_sync_status(False)
-        await redis.publish("sync_status_channel", json.dumps({"syncing": False}))
+    voucher_sync_service: VoucherSyncService = Depends(Provide[Container.voucher_sync_service]),
+) -> BackgroundJob:
+    """전표 동기화 작업 등록 (진행 상황은 /api/ws/sync-status, 결과는 GET /jobs/{job_id})
+
+    같은 조건의 동기화가 대기/실행 중이면 그 작업을 반환한다.
+    """
+    return await voucher_sync_service.submit(
+        companies=sync_request.companies or [sync_request.company],
+        year=sync_request.year,
+        month=sync_request.month,
+        wehago_id=sync_request.wehago_id,
+        wehago_password=sync_request.wehago_password,
+        requested_by=current_user.id,
+    )
+
+
+@router.post("/sync/{job_id}/cancel")
+@inject
+async def cancel_sync_whg(
+    job_id: str,
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+    voucher_sync_service: VoucherSyncService = Depends(Provide[Container.voucher_sync_service]),
+) -> BackgroundJob:
+    """전표 동기화 취소 (등록한 사용자 또는 관리자. 크롤링 중이면 멈추고, 저장을 시작했으면 저장까지 마친다)"""
+    return await voucher_sync_service.cancel(job_id, current_user.id)
 
 
 @router.post("/files/download")
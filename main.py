@@ -1,8 +1,7 @@
+import asyncio
 from contextlib import asynccontextmanager
-from datetime import datetime
 import json
 
-from beanie import init_beanie
 from fastapi import FastAPI, APIRouter, Depends
 from fastapi.exceptions import RequestValidationError
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
@@ -28,25 +27,15 @@ from interface.controller.approval_websocket_controller import (
 from interface.controller.legal_controller import router as legal_router
 from interface.controller.wiki_controller import router as wiki_router
 from interface.controller.payment_task_controller import router as payment_task_router
-from middleware import add_cors
-from infra.db_models.voucher import Voucher
-from infra.db_models.user import User
-from infra.db_models.file import File
-from infra.db_models.group import Group
-from infra.db_models.folder_read_state import FolderReadState
-from infra.db_models.document_template import DocumentTemplate
-from infra.db_models.approval_request import ApprovalRequest
-from infra.db_models.approval_line import ApprovalLine
-from infra.db_models.approval_favorite_group import ApprovalFavoriteGroup
-from infra.db_models.approval_history import ApprovalHistory
-from infra.db_models.attached_file import AttachedFile
-from infra.db_models.document_integrity import DocumentIntegrity
-from infra.db_models.wiki import WikiPage, WikiImage
-from infra.db_models.payment_task import PaymentTask
-from common.db import client
+from interface.controller.job_controller import router as job_router
+from interface.controller.cache_controller import router as cache_router
+from middleware import add_cors, add_request_scope
+from common.db import client, init_db
 from utils.settings import settings
-from utils.scheduler import start_scheduler, shutdown_scheduler
+from worker import run_background_workers
 from common.exceptions import AuthenticationError
+from common.responses import FastJSONResponse
+from utils.json_codec import custom_json_encoder  # 커스텀 JSON 인코더
 
 
 async def remove_legacy_payment_task_indexes() -> None:
@@ -60,45 +49,41 @@ async def remove_legacy_payment_task_indexes() -> None:
             await collection.drop_index(name)
 
 
+async def ensure_legal_archive_indexes() -> None:
+    """법적 문서 조회/존재 확인을 request_id 인덱스 한 번으로 처리하기 위한 인덱스"""
+    await client.dup["legal_documents.files"].create_index(
+        [("metadata.request_id", 1), ("uploadDate", -1)],
+        name="metadata_request_id_upload_date",
+    )
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     await remove_legacy_payment_task_indexes()
-    await init_beanie(
-        database=client.dup,
-        document_models=[
-            File,
-            User,
-            Voucher,
-            Group,
-            FolderReadState,
-            DocumentTemplate,
-            ApprovalRequest,
-            ApprovalLine,
-            ApprovalFavoriteGroup,
-            ApprovalHistory,
-            AttachedFile,
-            DocumentIntegrity,
-            WikiPage,
-            WikiImage,
-            PaymentTask,
-        ],
-    )
-    start_scheduler()
+    await ensure_legal_archive_indexes()
+    await init_db()
+
+    stop_event = asyncio.Event()
+    tasks = [
+        # 다른 프로세스에서 보낸 캐시 무효화를 메모리 캐시에 반영
+        asyncio.create_task(app.container.cache_service().run_invalidation_listener(stop_event)),
+        # sync/pending-users 채널 구독 (웹소켓 연결 수와 상관없이 프로세스당 하나)
+        asyncio.create_task(app.container.redis_pubsub_service().listen_and_broadcast(stop_event)),
+    ]
+    # 스케줄러와 백그라운드 작업 워커 (별도 워커 프로세스(python -m worker)를 쓰면 끈다)
+    if settings.run_background_workers:
+        tasks.append(asyncio.create_task(run_background_workers(app.container, stop_event)))
     yield
+    stop_event.set()
+    await asyncio.gather(*tasks)
+    # 모아 둔 결재 알림 전송
+    await app.container.notification_aggregator().flush()
     client.close()
-    shutdown_scheduler()
-
-
-# 커스텀 JSON 인코더
-def custom_json_encoder(obj):
-    if isinstance(obj, datetime):
-        # 타임존 정보 없이 KST 시간을 그대로 직렬화
-        return obj.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3]
-    raise TypeError(f"Object {obj} is not JSON serializable")
-
 
 app = FastAPI(
     lifespan=lifespan,
+    # JSON 응답은 utils.json_codec(custom_json_encoder, orjson이 있으면 orjson)으로 직렬화
+    default_response_class=FastJSONResponse,
     docs_url=None,
     redoc_url=None,
     openapi_url=None,  # 기본 스펙 경로 끄기
@@ -106,6 +91,7 @@ app = FastAPI(
 
 app.container = Container()
 add_cors(app)
+add_request_scope(app)
 
 api_router = APIRouter(prefix="/api")
 
@@ -120,6 +106,8 @@ api_router.include_router(file_attachment_router)
 api_router.include_router(legal_router)
 api_router.include_router(wiki_router)
 api_router.include_router(payment_task_router)
+api_router.include_router(job_router)
+api_router.include_router(cache_router)
 
 app.include_router(api_router)
 app.include_router(sync_router)
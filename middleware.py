@@ -1,6 +1,8 @@
 # cors.py
 from fastapi.middleware.cors import CORSMiddleware
 
+from common.request_scope import RequestScopeMiddleware
+
 
 def add_cors(app):
     app.add_middleware(
@@ -13,3 +15,8 @@ def add_cors(app):
         allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS", "PATCH"],
         allow_headers=["Authorization", "Content-Type", "X-Requested-With"],
     )
+
+
+def add_request_scope(app):
+    # 요청 단위 캐시 (권한 등 같은 요청 안의 반복 조회 방지)
+    app.add_middleware(RequestScopeMiddleware)
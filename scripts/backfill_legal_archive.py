@@ -0,0 +1,69 @@
+"""Backfill (or regenerate) legal archive PDFs for approved requests.
+
+Usage: python -m scripts.backfill_legal_archive [--batch-size 50] [--regenerate] [--reset]
+                                                [--checkpoint NAME] [--max-requests N]
+
+Progress is checkpointed per batch in legal_archive_backfill_checkpoints, so an
+interrupted run continues where it stopped. --reset starts over from the first request.
+"""
+
+import argparse
+import asyncio
+
+from beanie import init_beanie
+
+from common.auth import SYSTEM_USER_ID
+from common.db import client
+from containers import Container
+from infra.db_models.approval_history import ApprovalHistory
+from infra.db_models.approval_line import ApprovalLine
+from infra.db_models.approval_request import ApprovalRequest
+from infra.db_models.attached_file import AttachedFile
+from infra.db_models.user import User
+from utils import legal_pdf
+
+
+async def run(args: argparse.Namespace) -> dict:
+    await init_beanie(
+        database=client.dup,
+        document_models=[ApprovalRequest, ApprovalLine, ApprovalHistory, AttachedFile, User],
+    )
+    service = Container().legal_archive_service()
+    return await service.backfill_legal_documents(
+        created_by=args.created_by,
+        batch_size=args.batch_size,
+        regenerate=args.regenerate,
+        checkpoint_name=args.checkpoint,
+        reset=args.reset,
+        max_requests=args.max_requests,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--batch-size", type=int, default=None)
+    parser.add_argument("--regenerate", action="store_true")
+    parser.add_argument("--reset", action="store_true")
+    parser.add_argument("--checkpoint", default=None)
+    parser.add_argument("--max-requests", type=int, default=None)
+    parser.add_argument("--created-by", default=SYSTEM_USER_ID)
+    args = parser.parse_args()
+
+    legal_pdf.start_pdf_render_pool()
+    try:
+        result = asyncio.run(run(args))
+    finally:
+        legal_pdf.shutdown_pdf_render_pool()
+        client.close()
+
+    print(
+        f"processed={result['processed']} created={result['created']} "
+        f"skipped={result['skipped']} failed={result['failed']} "
+        f"completed={result['completed']} last_request_id={result['last_request_id']}"
+    )
+    for request_id in result["failed_request_ids"]:
+        print(f"failed: {request_id}")
+
+
+if __name__ == "__main__":
+    main()
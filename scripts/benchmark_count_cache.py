@@ -0,0 +1,82 @@
+"""Measure pending-count cache invalidation latency on a large Redis keyspace.
+
+Usage: python -m scripts.benchmark_count_cache [--keys 1000000] [--users 100] [--db 15]
+
+Fills the selected Redis DB with --keys filler keys, then invalidates the count
+cache of --users users. "before" reproduces the old SCAN MATCH count:*:{user_id}
+invalidation, "after" uses CacheService.invalidate_count_cache (one DEL of the
+per-user hash). The selected DB is flushed before and after the run.
+"""
+
+import argparse
+import asyncio
+import time
+
+from redis.asyncio import Redis
+
+from application.cache_service import CacheService
+from utils.settings import settings
+
+
+async def fill_keyspace(redis: Redis, keys: int, batch: int = 10000) -> None:
+    for start in range(0, keys, batch):
+        pipeline = redis.pipeline(transaction=False)
+        for i in range(start, min(start + batch, keys)):
+            pipeline.set(f"filler:{i}", "x")
+        await pipeline.execute()
+
+
+async def scan_invalidate(redis: Redis, user_id: str, chunk_size: int = 1000) -> None:
+    # 이전 CacheService.invalidate_count_cache 구현
+    keys = []
+    async for key in redis.scan_iter(match=f"count:*:{user_id}"):
+        keys.append(key)
+        if len(keys) >= chunk_size:
+            await redis.delete(*keys)
+            keys.clear()
+    if keys:
+        await redis.delete(*keys)
+
+
+async def run(args: argparse.Namespace) -> None:
+    redis = Redis(host=settings.redis_host, port=settings.redis_port, password=settings.redis_password, db=args.db)
+    cache = CacheService(redis)
+    user_ids = [f"bench-user-{i}" for i in range(args.users)]
+    try:
+        await redis.flushdb()
+        await fill_keyspace(redis, args.keys)
+
+        for user_id in user_ids:
+            await redis.setex(f"count:approval_pending:{user_id}", 600, "3")
+        started = time.perf_counter()
+        for user_id in user_ids:
+            await scan_invalidate(redis, user_id)
+        before = (time.perf_counter() - started) / args.users
+
+        for user_id in user_ids:
+            await cache.set_count_cache("approval_pending", user_id, 3)
+        started = time.perf_counter()
+        for user_id in user_ids:
+            await cache.invalidate_count_cache(user_id)
+        after = (time.perf_counter() - started) / args.users
+
+        size = await redis.dbsize()
+        print(f"keyspace: {size} keys")
+        print(f"before (SCAN MATCH):   {before * 1000:.3f} ms/invalidation")
+        print(f"after  (per-user DEL): {after * 1000:.3f} ms/invalidation ({before / after:.0f}x)")
+    finally:
+        await redis.flushdb()
+        await redis.aclose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--keys", type=int, default=1_000_000)
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--db", type=int, default=15, help="benchmark용 Redis DB (실행 전후로 비운다)")
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Measure legal PDF rendering throughput (PDFs/sec).
+
+Usage: python -m scripts.benchmark_legal_pdf [--count 30] [--font fonts/malgun.ttf]
+
+"before" re-parses the TTF and rebuilds every style per document, as
+LegalArchiveService did before the module-level registry was introduced.
+"pool" renders the same documents concurrently in the process pool.
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import datetime, timedelta
+
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
+
+from utils import legal_pdf
+
+
+def build_document(now: datetime = datetime(2026, 1, 1, 9, 0)) -> dict:
+    return {
+        "request_id": "bench",
+        "document_number": "일반결재-2026-0101-BENCH",
+        "title": "벤치마크 결재 문서",
+        "requester_name": "기안자",
+        "created_at": now,
+        "completed_at": now + timedelta(hours=3),
+        "status": "APPROVED",
+        "content": "<p>" + "결재 요청 본문입니다. " * 200 + "</p>",
+        "approval_lines": [
+            {"step_order": i, "approver_name": f"결재자{i}", "status": "APPROVED",
+             "approved_at": now + timedelta(minutes=i), "comment": "승인합니다"}
+            for i in range(1, 6)
+        ],
+        "histories": [
+            {"created_at": now + timedelta(minutes=i), "approver_name": f"결재자{i}",
+             "action": "APPROVE", "ip_address": "10.0.0.1", "comment": "확인"}
+            for i in range(1, 6)
+        ],
+        "attached_files": [
+            {"file_name": f"첨부{i}.pdf", "file_size": 1024 * 300 * i,
+             "uploaded_at": now, "uploaded_by": "u0"}
+            for i in range(1, 4)
+        ],
+    }
+
+
+def run_inline(document: dict, count: int, font_path: str, cached: bool) -> float:
+    started = time.perf_counter()
+    for _ in range(count):
+        if not cached:
+            pdfmetrics.registerFont(TTFont(legal_pdf.KOREAN_FONT_NAME, font_path))
+            legal_pdf.get_legal_pdf_styles.cache_clear()
+        legal_pdf.render_legal_pdf(document)
+    return count / (time.perf_counter() - started)
+
+
+async def run_pool(document: dict, count: int) -> float:
+    started = time.perf_counter()
+    await asyncio.gather(*(legal_pdf.render_legal_pdf_async(document) for _ in range(count)))
+    return count / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=30)
+    parser.add_argument("--font", default=legal_pdf.KOREAN_FONT_PATH)
+    args = parser.parse_args()
+
+    legal_pdf.register_korean_font(args.font)
+    document = build_document()
+
+    before = run_inline(document, args.count, args.font, cached=False)
+    after = run_inline(document, args.count, args.font, cached=True)
+    print(f"before (font/styles per call): {before:.2f} PDFs/sec")
+    print(f"after  (cached registry):      {after:.2f} PDFs/sec ({after / before:.2f}x)")
+
+    if args.font == legal_pdf.KOREAN_FONT_PATH:
+        # 풀 워커는 기본 폰트 경로로 폰트를 등록하므로 기본 폰트일 때만 측정
+        legal_pdf.start_pdf_render_pool()
+        try:
+            asyncio.run(run_pool(document, legal_pdf.settings.pdf_render_workers))  # 워커 기동 대기
+            pooled = asyncio.run(run_pool(document, args.count))
+            print(f"pool   (process pool):         {pooled:.2f} PDFs/sec")
+        finally:
+            legal_pdf.shutdown_pdf_render_pool()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+from datetime import date, datetime
+from enum import Enum, StrEnum
+import hashlib
+import json
+import unittest
+
+from utils.canonical import canonical_sha256, canonical_text
+from utils.integrity_hash import compute_content_hash, compute_metadata_hash
+
+
+class Status(StrEnum):
+    APPROVED = "APPROVED"
+    APPROVE = "APPROVE"
+
+
+class Priority(Enum):
+    HIGH = 1
+
+
+# 기존 구현(json.dumps(sort_keys=True, ensure_ascii=False) + SHA-256)으로 계산해 둔 값
+GOLDEN_CONTENT_HASH = "fc22470001579e23fbb74be70c37424f40954f587631a136fcde43641d08e9bf"
+GOLDEN_METADATA_HASH = "a4abb02f26bcbe83dd7839cbf3abfbc8bb1e04bdffd79edd3e23b49a84bcc856"
+GOLDEN_EMPTY_CONTENT_HASH = "a429625754cf138e51d164ed89749aabd68b83b262e57078d5bc9cf0cc342269"
+GOLDEN_EMPTY_METADATA_HASH = "1b954b7865831a23baa52f5d0777405af3599587b0000001c8712ca1fc8366e8"
+
+REQUEST = {
+    "id": "01JABCDEF0000000000000000",
+    "title": "2026년 1월 법인카드 사용 내역 \"정산\"",
+    "content": "<p>결재 본문</p>\n<table><tr><td>₩12,000</td></tr></table>\t끝",
+    "form_data": {
+        "금액": 12000,
+        "items": [{"name": "커피", "price": 4500.5}, {"name": "택시", "price": 7500}],
+        "memo": None,
+        "flags": {"urgent": True, "b": False},
+        "10": "x",
+        "2": "y",
+    },
+    "template_id": "tmpl-expense",
+    "document_number": "지출결의-2026-0101-0001",
+    "requester_id": "user01",
+    "department_id": None,
+    "status": Status.APPROVED,
+    "completed_at": datetime(2026, 1, 2, 3, 4, 5, 678000),
+}
+
+APPROVAL_LINES = [
+    {
+        "approver_id": "boss", "approver_name": "팀장", "step_order": 2, "status": Status.APPROVED,
+        "is_required": True, "is_parallel": False,
+        "approved_at": datetime(2026, 1, 2, 3, 4, 5, 678000), "comment": "승인",
+    },
+    {
+        "approver_id": "lead", "approver_name": "파트장", "step_order": 1, "status": "APPROVED",
+        "is_required": True, "is_parallel": True,
+        "approved_at": datetime(2026, 1, 2, 1, 0, 0), "comment": None,
+    },
+]
+
+HISTORIES = [
+    {
+        "approver_id": "boss", "approver_name": "팀장", "action": Status.APPROVE,
+        "created_at": datetime(2026, 1, 2, 3, 4, 5, 678000), "ip_address": "10.0.0.2", "comment": "승인",
+    },
+    {
+        "approver_id": "lead", "approver_name": "파트장", "action": "APPROVE",
+        "created_at": datetime(2026, 1, 2, 1, 0, 0), "ip_address": None, "comment": None,
+    },
+]
+
+
+class IntegrityHashGoldenTest(unittest.TestCase):
+    def test_content_hash_matches_previous_implementation(self):
+        self.assertEqual(compute_content_hash(REQUEST), GOLDEN_CONTENT_HASH)
+
+    def test_metadata_hash_matches_previous_implementation(self):
+        self.assertEqual(compute_metadata_hash(APPROVAL_LINES, HISTORIES), GOLDEN_METADATA_HASH)
+
+    def test_empty_values_match_previous_implementation(self):
+        request = {**REQUEST, "form_data": {}, "completed_at": None, "content": ""}
+        self.assertEqual(compute_content_hash(request), GOLDEN_EMPTY_CONTENT_HASH)
+        self.assertEqual(compute_metadata_hash([], []), GOLDEN_EMPTY_METADATA_HASH)
+
+
+class CanonicalSerializationTest(unittest.TestCase):
+    def test_json_native_values_encode_exactly_like_json_dumps(self):
+        values = [
+            REQUEST["form_data"],
+            {"b": [1, 2.5, -0.0, 1e100, True, None], "a": {"z": "\"따옴표\"\n", "y": []}, "": {}},
+            {3: "c", 1: "a", 20: "b"},
+            ["x" * 200_000, {"nested": ["<p>" * 1000]}],
+            "단일 문자열",
+            [],
+        ]
+        for value in values:
+            expected = json.dumps(value, sort_keys=True, ensure_ascii=False)
+            self.assertEqual(canonical_text(value), expected)
+
+    def test_extended_types_are_deterministic(self):
+        form_data = {
+            "due": date(2026, 1, 31),
+            "at": datetime(2026, 1, 2, 3, 4, 5),
+            "priority": Priority.HIGH,
+            "tags": {"b", "a", "c"},
+            "pair": ("x", 1),
+            1: "mixed key types",
+        }
+        self.assertEqual(
+            canonical_text(form_data),
+            '{"1": "mixed key types", "at": "2026-01-02T03:04:05", "due": "2026-01-31", '
+            '"pair": ["x", 1], "priority": 1, "tags": ["a", "b", "c"]}',
+        )
+        reordered = dict(reversed(list(form_data.items())))
+        self.assertEqual(canonical_sha256(reordered), canonical_sha256(form_data))
+
+    def test_large_content_streams_to_same_hash(self):
+        document = {"content": "<p>본문</p>" * 50_000, "form_data": {"k": [1, 2, 3]}}
+        expected = hashlib.sha256(
+            json.dumps(document, sort_keys=True, ensure_ascii=False).encode("utf-8")
+        ).hexdigest()
+        self.assertEqual(canonical_sha256(document), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
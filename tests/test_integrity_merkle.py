@@ -0,0 +1,54 @@
+from datetime import datetime
+import unittest
+
+from utils.merkle import (
+    build_merkle_levels,
+    chain_epoch_root,
+    integrity_leaf_hash,
+    merkle_proof,
+    merkle_root,
+    verify_merkle_proof,
+)
+
+
+def make_record(index: int) -> dict:
+    return {
+        "id": f"integrity-{index}",
+        "request_id": f"request-{index}",
+        "document_version": 1,
+        "content_hash": f"{index:064x}",
+        "metadata_hash": f"{index + 1:064x}",
+        "previous_hash": None,
+        "created_at": datetime(2026, 1, 1, 9, 0, index),
+        "created_by": "system",
+    }
+
+
+class MerkleTest(unittest.TestCase):
+    def test_every_leaf_proof_verifies_for_odd_and_even_sizes(self):
+        for size in (1, 2, 5, 8, 13):
+            leaves = [integrity_leaf_hash(make_record(i)) for i in range(size)]
+            levels = build_merkle_levels(leaves)
+            root = merkle_root(levels)
+            for index, leaf in enumerate(leaves):
+                self.assertTrue(verify_merkle_proof(leaf, merkle_proof(levels, index), root))
+
+    def test_tampered_record_fails_proof_and_changes_root(self):
+        records = [make_record(i) for i in range(6)]
+        levels = build_merkle_levels([integrity_leaf_hash(record) for record in records])
+        root = merkle_root(levels)
+
+        records[3]["content_hash"] = "f" * 64
+        tampered_leaves = [integrity_leaf_hash(record) for record in records]
+
+        self.assertFalse(verify_merkle_proof(tampered_leaves[3], merkle_proof(levels, 3), root))
+        self.assertNotEqual(merkle_root(build_merkle_levels(tampered_leaves)), root)
+
+    def test_epoch_root_commits_to_previous_epoch(self):
+        tree_root = merkle_root(build_merkle_levels([integrity_leaf_hash(make_record(0))]))
+        self.assertNotEqual(chain_epoch_root("a" * 64, tree_root), chain_epoch_root("b" * 64, tree_root))
+        self.assertIsNone(merkle_root(build_merkle_levels([])))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from application.job_queue_service import JobDeferred, JobQueueService
+from domain.background_job import JobStatus
+from utils.settings import settings
+
+
+class FakeJobRepo:
+    """claim_next/heartbeat/mark_*의 소유권(locked_by) 조건만 흉내 낸다"""
+
+    def __init__(self):
+        self.jobs = {}
+
+    async def save_if_absent(self, job):
+        return self.jobs.setdefault(job.idempotency_key, job)
+
+    async def claim_next(self, worker_id, job_types, now, stale_before):
+        for job in self.jobs.values():
+            stale = job.status == JobStatus.RUNNING and job.locked_at < stale_before
+            if job.status == JobStatus.PENDING or stale:
+                job.status, job.locked_by, job.locked_at = JobStatus.RUNNING, worker_id, now
+                job.attempts += 1
+                return job
+        return None
+
+    def _claimed(self, job_id, worker_id):
+        job = next(job for job in self.jobs.values() if job.id == job_id)
+        return job if job.status == JobStatus.RUNNING and job.locked_by == worker_id else None
+
+    async def heartbeat(self, job_id, worker_id, now):
+        job = self._claimed(job_id, worker_id)
+        if job:
+            job.locked_at = now
+        return job is not None
+
+    async def mark_succeeded(self, job_id, worker_id, result, now):
+        job = self._claimed(job_id, worker_id)
+        if job:
+            job.status, job.result, job.locked_by = JobStatus.SUCCEEDED, result, None
+        return job is not None
+
+    async def mark_retry(self, job_id, worker_id, error, run_at, now):
+        job = self._claimed(job_id, worker_id)
+        if job:
+            job.status, job.last_error, job.locked_by = JobStatus.PENDING, error, None
+        return job is not None
+
+    async def defer(self, job_id, worker_id, run_at, now):
+        job = self._claimed(job_id, worker_id)
+        if job:
+            job.status, job.run_at, job.locked_by = JobStatus.PENDING, run_at, None
+            job.attempts -= 1
+        return job is not None
+
+
+class JobQueueClaimTest(unittest.IsolatedAsyncioTestCase):
+    async def test_heartbeat_keeps_long_job_from_being_reclaimed(self):
+        release = asyncio.Event()
+
+        async def slow(payload):
+            await release.wait()
+            return {"done": True}
+
+        queue = JobQueueService(FakeJobRepo(), handlers={"slow": slow})
+        await queue.enqueue("slow", {})
+        with patch.object(settings, "job_lock_timeout_seconds", 0.03):
+            first = asyncio.create_task(queue.run_one())
+            await asyncio.sleep(0.1)  # 잠금 시간의 세 배 넘게 실행 중
+            self.assertFalse(await queue.run_one())
+            release.set()
+            await first
+
+        job = next(iter(queue.job_repo.jobs.values()))
+        self.assertEqual((job.status, job.attempts), (JobStatus.SUCCEEDED, 1))
+
+    async def test_stale_worker_does_not_overwrite_new_owner(self):
+        calls = []
+
+        async def flaky(payload):
+            calls.append(len(calls))
+            if len(calls) == 1:
+                # 첫 실행이 멈춘 사이 다른 워커가 다시 가져가서 성공시켰다
+                job.status, job.locked_by = JobStatus.SUCCEEDED, None
+                raise RuntimeError("stale failure")
+            return {}
+
+        queue = JobQueueService(FakeJobRepo(), handlers={"flaky": flaky})
+        await queue.enqueue("flaky", {})
+        job = next(iter(queue.job_repo.jobs.values()))
+        await queue.run_one()
+
+        self.assertEqual(job.status, JobStatus.SUCCEEDED)
+
+    async def test_deferred_job_does_not_use_an_attempt(self):
+        async def busy(payload):
+            raise JobDeferred(30, "lock busy")
+
+        queue = JobQueueService(FakeJobRepo(), handlers={"busy": busy})
+        await queue.enqueue("busy", {}, max_attempts=1)
+        job = next(iter(queue.job_repo.jobs.values()))
+        # 잠금이 계속 사용 중이어도 max_attempts를 다 써서 FAILED가 되지 않는다
+        for _ in range(3):
+            await queue.run_one()
+
+        self.assertEqual((job.status, job.attempts), (JobStatus.PENDING, 0))
+        self.assertGreater(job.run_at, job.created_at)
+
+
+if __name__ == "__main__":
+    unittest.main()
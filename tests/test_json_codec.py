@@ -0,0 +1,26 @@
+from datetime import datetime
+import json
+import unittest
+
+from utils.json_codec import custom_json_encoder, dumps, dumps_text
+
+
+class JsonCodecTest(unittest.TestCase):
+    def test_matches_starlette_compact_output(self):
+        data = {"type": "approval_pending_count", "data": {"count": 3, "name": "결재자"}}
+        expected = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+        self.assertEqual(dumps_text(data), expected)
+        self.assertEqual(dumps(data), expected.encode("utf-8"))
+
+    def test_formats_datetime_with_custom_encoder(self):
+        created_at = datetime(2026, 1, 2, 9, 30, 15, 123456)
+        self.assertEqual(dumps_text({"created_at": created_at}), '{"created_at":"2026-01-02T09:30:15.123"}')
+        self.assertEqual(custom_json_encoder(created_at), "2026-01-02T09:30:15.123")
+
+    def test_rejects_unknown_types(self):
+        with self.assertRaises(TypeError):
+            dumps_text({"value": object()})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+
+from utils.local_cache import LocalCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class LocalCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.cache = LocalCache(max_entries=2, ttl_seconds=10, clock=self.clock)
+
+    def test_get_returns_hit_flag(self):
+        self.cache.set("user", "u1", None)
+        self.assertEqual(self.cache.get("user", "u1"), (True, None))
+        self.assertEqual(self.cache.get("user", "u2"), (False, None))
+
+    def test_entries_expire(self):
+        self.cache.set("user", "u1", {"name": "a"})
+        self.clock.now = 9.9
+        self.assertTrue(self.cache.get("user", "u1")[0])
+        self.clock.now = 10
+        self.assertFalse(self.cache.get("user", "u1")[0])
+        self.assertEqual(len(self.cache), 0)
+
+    def test_ttl_is_capped_by_cache_ttl(self):
+        self.cache.set("user", "u1", 1, ttl_seconds=1800)
+        self.cache.set("user", "u2", 2, ttl_seconds=1)
+        self.clock.now = 5
+        self.assertEqual(self.cache.get("user", "u1"), (True, 1))
+        self.assertFalse(self.cache.get("user", "u2")[0])
+        self.clock.now = 10
+        self.assertFalse(self.cache.get("user", "u1")[0])
+
+    def test_least_recently_used_entry_is_evicted(self):
+        self.cache.set("user", "u1", 1)
+        self.cache.set("user", "u2", 2)
+        self.cache.get("user", "u1")
+        self.cache.set("user", "u3", 3)
+        self.assertTrue(self.cache.get("user", "u1")[0])
+        self.assertFalse(self.cache.get("user", "u2")[0])
+        self.assertTrue(self.cache.get("user", "u3")[0])
+
+    def test_clear_namespace_keeps_other_namespaces(self):
+        self.cache.set("group", "id:1", 1)
+        self.cache.set("user", "id:1", 2)
+        self.cache.clear_namespace("group")
+        self.assertFalse(self.cache.get("group", "id:1")[0])
+        self.assertEqual(self.cache.get("user", "id:1"), (True, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import asyncio
+import unittest
+
+from application.lock_service import DistributedLock, LeaderElection, LockService
+
+
+class FakeRedis:
+    """SET NX PX와 락 스크립트(token 비교 후 DEL/PEXPIRE)만 흉내 낸다"""
+
+    def __init__(self):
+        self.values = {}
+
+    async def set(self, key, value, nx=False, px=None):
+        if nx and key in self.values:
+            return None
+        self.values[key] = value
+        return True
+
+    async def eval(self, script, numkeys, key, token, *args):
+        if self.values.get(key) != token:
+            return 0
+        if "DEL" in script:
+            del self.values[key]
+        return 1
+
+
+class LockServiceTest(unittest.IsolatedAsyncioTestCase):
+    async def test_hold_is_exclusive_and_released(self):
+        service = LockService(FakeRedis())
+        async with service.hold("voucher_sync") as first:
+            async with service.hold("voucher_sync") as second:
+                self.assertTrue(first)
+                self.assertFalse(second)
+        async with service.hold("voucher_sync") as again:
+            self.assertTrue(again)
+
+    async def test_does_not_release_lock_taken_by_someone_else(self):
+        redis = FakeRedis()
+        expired = DistributedLock(redis, "job", ttl_seconds=1)
+        await expired.acquire()
+        redis.values.clear()  # TTL 만료
+        current = DistributedLock(redis, "job", ttl_seconds=1)
+        await current.acquire()
+
+        self.assertFalse(await expired.extend())
+        self.assertFalse(await expired.release())
+        self.assertEqual(redis.values["lock:job"], current.token)
+
+    async def test_only_one_leader_and_lock_released_on_stop(self):
+        redis = FakeRedis()
+        stop_event = asyncio.Event()
+        first, second = LeaderElection(redis, ttl_seconds=3), LeaderElection(redis, ttl_seconds=3)
+        tasks = [asyncio.create_task(first.run(stop_event)), asyncio.create_task(second.run(stop_event))]
+        await asyncio.sleep(0.01)
+
+        self.assertEqual([first.is_leader, second.is_leader].count(True), 1)
+        stop_event.set()
+        await asyncio.gather(*tasks)
+        self.assertEqual(redis.values, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+
+from application.notification_aggregator import NotificationAggregator
+
+
+class FakeBus:
+    def __init__(self):
+        self.published = []
+
+    async def publish(self, user_id, message, persist=True, coalesce_key=None):
+        self.published.append((user_id, message["type"], persist))
+
+
+class FakeApprovalLineRepo:
+    def __init__(self):
+        self.calls = 0
+
+    async def find_pending_counts_by_approvers(self, user_ids):
+        self.calls += 1
+        return {user_id: 3 for user_id in user_ids}
+
+
+class NotificationAggregatorTest(unittest.IsolatedAsyncioTestCase):
+    async def test_keeps_event_types_and_sends_one_pending_count(self):
+        bus, repo = FakeBus(), FakeApprovalLineRepo()
+        aggregator = NotificationAggregator(bus, repo, window_seconds=60)
+        for message_type in ("approval_completed", "approval_rejected"):
+            aggregator.add("u1", {"type": message_type}, refresh_pending_count=True)
+
+        await aggregator.flush()
+
+        # 클라이언트가 아는 메시지 타입 그대로, 대기 건수는 한 번만 계산해서 마지막에 보낸다
+        self.assertEqual(bus.published, [
+            ("u1", "approval_completed", True),
+            ("u1", "approval_rejected", True),
+            ("u1", "approval_pending_count", False),
+        ])
+        self.assertEqual(repo.calls, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
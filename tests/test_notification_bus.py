@@ -0,0 +1,106 @@
+import asyncio
+import json
+import unittest
+
+from application.notification_bus import UserNotificationBus
+from application.websocket_manager import WebSocketManager
+
+
+class FakeWebSocket:
+    def __init__(self, blocked: bool = False):
+        self.sent = []
+        self.unblock = asyncio.Event()
+        if not blocked:
+            self.unblock.set()
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, message):
+        await self.unblock.wait()
+        self.sent.append(json.loads(message))
+
+    async def close(self, code=1000, reason=None):
+        pass
+
+
+class FakeRedis:
+    """inbox stream(XADD/XRANGE)과 cursor(GET/SET)만 흉내 낸다"""
+
+    def __init__(self):
+        self.streams = {}
+        self.values = {}
+        self.next_id = 0
+
+    async def xadd(self, key, fields, maxlen=None, approximate=True):
+        self.next_id += 1
+        event_id = f"{self.next_id}-0"
+        self.streams.setdefault(key, []).append((event_id, fields))
+        return event_id
+
+    async def expire(self, key, ttl):
+        pass
+
+    async def xrange(self, key, min="-", max="+", count=None):
+        entries = self.streams.get(key, [])
+        if min.startswith("("):
+            after = int(min[1:].split("-")[0])
+            entries = [entry for entry in entries if int(entry[0].split("-")[0]) > after]
+        return entries[:count]
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.values[key] = value
+
+    async def publish(self, channel, data):
+        pass
+
+
+async def wait_until(condition, timeout: float = 1.0):
+    async def poll():
+        while not condition():
+            await asyncio.sleep(0.001)
+
+    await asyncio.wait_for(poll(), timeout=timeout)
+
+
+class NotificationReplayTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.manager = WebSocketManager()
+        self.bus = UserNotificationBus(FakeRedis(), self.manager)
+        await self.bus.publish("u1", {"type": "approval_completed"})
+        await self.bus.publish("u1", {"type": "approval_cancelled"})
+
+    async def connect(self, client_id, blocked=False):
+        socket = FakeWebSocket(blocked=blocked)
+        await self.manager.connect(socket, user_id="u1", client_id=client_id)
+        await self.bus.replay("u1", socket)
+        return socket
+
+    async def test_cursor_moves_only_after_frames_are_sent(self):
+        socket = await self.connect("laptop", blocked=True)
+        # 대기열에 넣었지만 보내기 전에 끊겼다
+        await self.manager.disconnect(socket)
+
+        socket = await self.connect("laptop")
+        await wait_until(lambda: len(socket.sent) == 2)
+        self.assertEqual([message["type"] for message in socket.sent], ["approval_completed", "approval_cancelled"])
+
+    async def test_each_client_keeps_its_own_cursor(self):
+        phone = await self.connect("phone")
+        await wait_until(lambda: len(phone.sent) == 2)
+        await self.manager.disconnect(phone)
+
+        # 휴대폰이 받은 알림도 노트북에는 다시 보낸다
+        laptop = await self.connect("laptop")
+        await wait_until(lambda: len(laptop.sent) == 2)
+
+        phone = await self.connect("phone")
+        await asyncio.sleep(0.01)
+        self.assertEqual(phone.sent, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
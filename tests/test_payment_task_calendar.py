@@ -0,0 +1,74 @@
+import asyncio
+import unittest
+
+from application.lock_service import LockService
+from application.payment_task_calendar_service import PaymentTaskCalendarService
+from common.exceptions import ConflictError
+
+
+class FakeRedis:
+    def __init__(self):
+        self.values = {}
+
+    async def set(self, key, value, nx=False, px=None):
+        if nx and key in self.values:
+            return None
+        self.values[key] = value
+        return True
+
+    async def eval(self, script, numkeys, key, token, *args):
+        if self.values.get(key) != token:
+            return 0
+        if "DEL" in script:
+            del self.values[key]
+        return 1
+
+
+class FakeTask:
+    def __init__(self, id):
+        self.id = id
+        self.calendar_sync_needed = True
+        self.google_calendar_event_id = None
+
+
+class FakeTaskRepo:
+    def __init__(self, task):
+        self.task = task
+
+    async def find_by_id(self, task_id):
+        return self.task if task_id == self.task.id else None
+
+
+class SlowCalendarService(PaymentTaskCalendarService):
+    """구글 호출 대신 일정 생성 횟수만 센다"""
+
+    def __init__(self, task):
+        super().__init__(FakeTaskRepo(task), LockService(FakeRedis()))
+        self.created = 0
+        self.release = asyncio.Event()
+
+    async def sync_task(self, task):
+        await self.release.wait()
+        self.created += 1
+        task.google_calendar_event_id = "event"
+        task.calendar_sync_needed = False
+
+
+class CalendarSyncJobTest(unittest.IsolatedAsyncioTestCase):
+    async def test_concurrent_jobs_for_same_task_create_one_event(self):
+        service = SlowCalendarService(FakeTask("task1"))
+        first = asyncio.create_task(service.handle_sync_job({"task_id": "task1"}))
+        await asyncio.sleep(0)
+
+        with self.assertRaises(ConflictError):
+            await service.handle_sync_job({"task_id": "task1"})
+        service.release.set()
+        self.assertEqual(await first, {"synced": True, "event_id": "event"})
+
+        # 작업 큐가 재시도하면 이미 반영된 업무는 건너뛴다
+        self.assertEqual(await service.handle_sync_job({"task_id": "task1"}), {"synced": False})
+        self.assertEqual(service.created, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import asyncio
+import contextvars
+import unittest
+from datetime import datetime
+from types import SimpleNamespace
+
+from application.user_loader import UserLoader
+from common.request_scope import request_scope
+
+
+class FlakyUserRepo:
+    """첫 조회만 실패하는 사용자 저장소"""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def find_by_user_ids(self, user_ids):
+        self.calls += 1
+        if self.calls == 1:
+            raise RuntimeError("db down")
+        now = datetime(2026, 1, 1)
+        return [
+            SimpleNamespace(id=user_id, user_id=user_id, created_at=now, updated_at=now, roles=[], name=user_id,
+                            approval_status=None)
+            for user_id in user_ids
+        ]
+
+
+class UserLoaderTest(unittest.IsolatedAsyncioTestCase):
+    async def test_failed_batch_is_not_cached_in_any_request_scope(self):
+        loader = UserLoader(FlakyUserRepo())
+
+        async def request():
+            # 요청마다 scope를 열고, 같은 배치 실패 뒤 다시 조회한다
+            with request_scope():
+                with self.assertRaises(RuntimeError):
+                    await loader.load("u1")
+                return await loader.load("u1")
+
+        # 두 요청이 같은 배치에 합류한다
+        users = await asyncio.gather(
+            asyncio.create_task(request(), context=contextvars.copy_context()),
+            asyncio.create_task(request(), context=contextvars.copy_context()),
+        )
+
+        self.assertEqual([user.user_id for user in users], ["u1", "u1"])
+        self.assertEqual(loader.user_repo.calls, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,189 @@
+import json
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from application.job_queue_service import JobQueueService, VOUCHER_SYNC_JOB
+from application.voucher_service import VoucherService
+from application.voucher_sync_service import VoucherSyncRunner, VoucherSyncService
+from common.auth import Role
+from common.exceptions import PermissionError
+from domain.background_job import JobStatus
+from domain.voucher import Company, CrawlResult, CrawlUnitStatus, MonthCrawlResult, Voucher
+from utils.settings import settings
+from utils.whg import Whg
+
+
+def voucher(id: str, month: int) -> Voucher:
+    return Voucher(id=id, year="2026", month=f"{month:02d}", company=Company.BAEKSUNG)
+
+
+class FlakyWhg(Whg):
+    """(회사, 월)별로 정해진 횟수만큼 실패하는 수집기"""
+
+    def __init__(self, failures):
+        super().__init__()
+        self.failures = dict(failures)
+        self.calls = []
+
+    async def _crawl_company_months(self, context, company, units):
+        self.calls.append([(company, unit.month) for unit in units])
+        for unit in units:
+            key = (company, unit.month)
+            if self.failures.get(key, 0) > 0:
+                self.failures[key] -= 1
+                await self._mark_failed(unit, "timeout")
+            else:
+                unit.attempts += 1
+                unit.status = CrawlUnitStatus.FETCHED
+
+
+class CrawlRetryTest(unittest.IsolatedAsyncioTestCase):
+    async def test_retries_only_failed_units(self):
+        whg = FlakyWhg({(Company.BAEKSUNG, 2): 1, (Company.PARAN, 1): 99})
+        result = CrawlResult(units=[
+            MonthCrawlResult(company=company, year=2026, month=month)
+            for company in (Company.BAEKSUNG, Company.PARAN)
+            for month in (1, 2)
+        ])
+
+        with patch.object(settings, "whg_max_attempts", 3), patch.object(settings, "whg_retry_base_seconds", 0):
+            await whg._crawl_with_retries(None, result)
+
+        # 첫 시도는 회사별 전체 월, 재시도는 실패한 월만
+        self.assertEqual(whg.calls[2:], [[(Company.BAEKSUNG, 2)], [(Company.PARAN, 1)], [(Company.PARAN, 1)]])
+        self.assertEqual(result.fetched_months(Company.BAEKSUNG), [1, 2])
+        self.assertEqual(result.failed_months(Company.PARAN), [1])
+        self.assertEqual(result.failed_units[0].attempts, 3)
+
+
+class FakeVoucherRepo:
+    def __init__(self, vouchers):
+        self.vouchers = {v.id: v for v in vouchers}
+
+    async def find_by_company_year_and_months(self, company, year, months):
+        return [v for v in self.vouchers.values() if int(v.month) in months]
+
+    async def delete_by_ids(self, ids):
+        for id in ids:
+            del self.vouchers[id]
+
+    async def save(self, vouchers):
+        self.vouchers.update({v.id: v for v in vouchers})
+
+
+class SaveSyncedVouchersTest(unittest.IsolatedAsyncioTestCase):
+    async def test_keeps_vouchers_of_months_that_failed(self):
+        repo = FakeVoucherRepo([voucher("a", 1), voucher("b", 1), voucher("c", 2), voucher("d", 3)])
+        result = CrawlResult(units=[
+            MonthCrawlResult(company=Company.BAEKSUNG, year=2026, month=1,
+                             status=CrawlUnitStatus.FETCHED, vouchers=[voucher("a", 1), voucher("e", 1)]),
+            MonthCrawlResult(company=Company.BAEKSUNG, year=2026, month=2, error="timeout"),
+            MonthCrawlResult(company=Company.BAEKSUNG, year=2026, month=3, status=CrawlUnitStatus.FETCHED),
+        ])
+
+        await VoucherService(repo)._save_synced_vouchers(Company.BAEKSUNG, 2026, result)
+
+        # 1월: b 삭제, e 추가 / 2월(실패): c 유지 / 3월(수집 성공, 0건): d 삭제
+        self.assertEqual(sorted(repo.vouchers), ["a", "c", "e"])
+
+    async def test_does_nothing_when_no_month_was_fetched(self):
+        repo = FakeVoucherRepo([voucher("a", 1)])
+        result = CrawlResult(units=[MonthCrawlResult(company=Company.BAEKSUNG, year=2026, month=1, error="timeout")])
+
+        await VoucherService(repo)._save_synced_vouchers(Company.BAEKSUNG, 2026, result)
+
+        self.assertEqual(sorted(repo.vouchers), ["a"])
+
+
+class FakeRedis:
+    def __init__(self):
+        self.values = {}
+
+    async def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.values:
+            return None
+        self.values[key] = value
+        return True
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.values.pop(key, None)
+
+
+class FakeJobRepo:
+    def __init__(self):
+        self.jobs = {}
+
+    async def save_if_absent(self, job):
+        return self.jobs.setdefault(job.id, job)
+
+    async def find_by_id(self, job_id):
+        return self.jobs.get(job_id)
+
+    async def claim_next(self, worker_id, job_types, now, stale_before):
+        for job in self.jobs.values():
+            if job.status == JobStatus.PENDING:
+                job.status, job.attempts, job.locked_by = JobStatus.RUNNING, job.attempts + 1, worker_id
+                return job
+        return None
+
+    async def mark_failed(self, job_id, worker_id, error, now):
+        self.jobs[job_id].status = JobStatus.FAILED
+        return True
+
+
+class FakeUserRepo:
+    async def find_by_user_id(self, user_id, for_update=False):
+        roles = [Role.ADMIN] if user_id == "admin" else [Role.USER]
+        return SimpleNamespace(user_id=user_id, roles=roles)
+
+
+class VoucherSyncJobTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.redis = FakeRedis()
+        self.runner = VoucherSyncRunner(self.redis, None, None, None)
+
+        async def crash(payload):
+            raise RuntimeError("wehago down")
+
+        self.queue = JobQueueService(
+            FakeJobRepo(),
+            handlers={VOUCHER_SYNC_JOB: crash},
+            failure_handlers={VOUCHER_SYNC_JOB: self.runner.handle_sync_failure},
+        )
+        self.service = VoucherSyncService(self.redis, self.queue, FakeUserRepo())
+
+    async def test_credentials_removed_when_job_fails_permanently(self):
+        with patch.object(settings, "voucher_sync_max_attempts", 1):
+            job = await self.service.submit([Company.BAEKSUNG], 2026, None, "id", "pw", "u1")
+        self.assertIn("pw", json.dumps(self.redis.values))
+
+        await self.queue.run_one()
+
+        self.assertEqual(self.queue.job_repo.jobs[job.id].status, JobStatus.FAILED)
+        self.assertEqual(self.redis.values, {})
+
+    async def test_only_creator_or_admin_can_cancel(self):
+        job = await self.service.submit([Company.BAEKSUNG], 2026, None, "id", "pw", "u1")
+
+        with self.assertRaises(PermissionError):
+            await self.service.cancel(job.id, "u2")
+        await self.service.cancel(job.id, "u1")
+        await self.service.cancel(job.id, "admin")
+
+    async def test_same_sync_from_another_user_gets_its_own_job(self):
+        first = await self.service.submit([Company.BAEKSUNG], 2026, None, "id", "pw", "u1")
+        again = await self.service.submit([Company.BAEKSUNG], 2026, None, "id", "pw", "u1")
+        other = await self.service.submit([Company.BAEKSUNG], 2026, None, "id2", "pw2", "u2")
+
+        self.assertEqual(again.id, first.id)
+        self.assertNotEqual(other.id, first.id)
+        await self.service.cancel(other.id, "u2")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+import asyncio
+import json
+import unittest
+
+from application.websocket_manager import SLOW_CLIENT_CLOSE_CODE, WebSocketManager, approvals_topic
+
+
+class FakeWebSocket:
+    def __init__(self, blocked: bool = False):
+        self.sent = []
+        self.closed_with = None
+        self.unblock = asyncio.Event()
+        if not blocked:
+            self.unblock.set()
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, message):
+        await self.unblock.wait()
+        self.sent.append(json.loads(message) if message.startswith("{") else message)
+
+    async def close(self, code=1000, reason=None):
+        self.closed_with = code
+
+
+async def wait_until(condition, timeout: float = 1.0):
+    """writer task가 condition을 만족시킬 때까지 기다린다 (틱 수에 기대지 않는다)"""
+    async def poll():
+        while not condition():
+            await asyncio.sleep(0.001)
+
+    await asyncio.wait_for(poll(), timeout=timeout)
+
+
+def queued(manager):
+    return manager.get_metrics()["queued"]
+
+
+class WebSocketManagerTest(unittest.IsolatedAsyncioTestCase):
+    async def test_publish_reaches_only_topic_subscribers(self):
+        manager = WebSocketManager()
+        sync_socket, approval_socket = FakeWebSocket(), FakeWebSocket()
+        await manager.connect(sync_socket, topics=["sync_status"])
+        await manager.connect(approval_socket, user_id="u1")
+
+        self.assertEqual(await manager.publish("sync_status", {"syncing": True}), 1)
+        self.assertTrue(await manager.send_to_user("u1", {"type": "x"}))
+        self.assertFalse(await manager.send_to_user("u2", {"type": "x"}))
+        await wait_until(lambda: sync_socket.sent and approval_socket.sent)
+
+        self.assertEqual(sync_socket.sent, [{"syncing": True}])
+        self.assertEqual(approval_socket.sent, [{"type": "x"}])
+
+    async def test_slow_client_does_not_block_others(self):
+        manager = WebSocketManager()
+        slow, fast = FakeWebSocket(blocked=True), FakeWebSocket()
+        await manager.connect(slow, topics=["sync_status"])
+        await manager.connect(fast, topics=["sync_status"])
+
+        await manager.publish("sync_status", {"n": 1})
+        await manager.publish("sync_status", {"n": 2})
+        await wait_until(lambda: len(fast.sent) == 2)
+
+        self.assertEqual(fast.sent, [{"n": 1}, {"n": 2}])
+        self.assertEqual(slow.sent, [])
+
+    async def test_coalesces_pending_messages_with_same_key(self):
+        manager = WebSocketManager()
+        socket = FakeWebSocket(blocked=True)
+        await manager.connect(socket, user_id="u1")
+
+        await manager.send_to_user("u1", {"count": 1}, coalesce_key="approval_pending_count")
+        await wait_until(lambda: queued(manager) == 0)  # 첫 메시지는 writer가 꺼내서 전송 대기 중
+        for count in (2, 3, 4):
+            await manager.send_to_user("u1", {"count": count}, coalesce_key="approval_pending_count")
+        await manager.send_to_user("u1", {"type": "other"})
+        socket.unblock.set()
+        await wait_until(lambda: len(socket.sent) == 3)
+
+        self.assertEqual(socket.sent, [{"count": 1}, {"count": 4}, {"type": "other"}])
+        self.assertEqual(manager.get_metrics()["coalesced"], 2)
+
+    async def test_evicts_client_when_queue_overflows(self):
+        manager = WebSocketManager(send_queue_size=2)
+        socket = FakeWebSocket(blocked=True)
+        await manager.connect(socket, user_id="u1")
+
+        results = [await manager.send_to_user("u1", {"n": 0})]
+        await wait_until(lambda: queued(manager) == 0)  # 첫 메시지는 writer가 꺼내서 전송 대기 중
+        results += [await manager.send_to_user("u1", {"n": n}) for n in range(1, 4)]
+        await wait_until(lambda: socket.closed_with is not None)
+
+        self.assertEqual(results, [True, True, True, False])
+        self.assertNotIn(socket, manager.active_connections)
+        self.assertNotIn(approvals_topic("u1"), manager.topic_connections)
+        self.assertEqual(socket.closed_with, SLOW_CLIENT_CLOSE_CODE)
+        self.assertEqual(manager.get_metrics()["evicted"], 1)
+
+    async def test_evicts_client_when_send_times_out(self):
+        manager = WebSocketManager(send_timeout_seconds=0.01)
+        socket = FakeWebSocket(blocked=True)
+        await manager.connect(socket, topics=["pending_users"])
+
+        await manager.publish("pending_users", {"pending_users_count": 1})
+        await wait_until(lambda: socket not in manager.active_connections)
+
+        self.assertNotIn(socket, manager.active_connections)
+        self.assertEqual(manager.get_metrics()["evicted"], 1)
+
+    async def test_disconnect_cleans_reverse_maps(self):
+        manager = WebSocketManager()
+        socket = FakeWebSocket()
+        await manager.connect(socket, user_id="u1", topics=["sync_status"])
+        await manager.disconnect(socket)
+        await manager.disconnect(socket)
+
+        self.assertEqual(manager.topic_connections, {})
+        self.assertEqual(manager.get_user_connection_counts(), {})
+        self.assertFalse(await manager.is_user_connected("u1"))
+
+    async def test_disconnect_stops_writer_even_if_send_finishes_during_cancel(self):
+        manager = WebSocketManager()
+        socket = FakeWebSocket(blocked=True)
+        await manager.connect(socket, user_id="u1")
+        writer = manager._connections[socket].writer
+
+        await manager.send_to_user("u1", {"n": 1})
+        await wait_until(lambda: queued(manager) == 0)
+        # 취소와 같은 틱에 전송이 끝나면 wait_for가 취소를 삼킬 수 있다
+        socket.unblock.set()
+        await asyncio.wait_for(manager.disconnect(socket), timeout=1.0)
+
+        self.assertTrue(writer.done())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,152 @@
+"""무결성 해시용 정규(canonical) 직렬화와 스트리밍 SHA-256
+
+기존 해시(json.dumps(sort_keys=True, ensure_ascii=False) 후 SHA-256)와 같은 바이트를
+만들어야 이미 저장된 무결성 기록이 그대로 검증된다. 그래서 JSON 기본 타입은
+json.dumps와 완전히 같은 텍스트로 인코딩하고, JSON이 거부하던 타입만 결정적으로 확장한다.
+
+- datetime/date/time: isoformat() 문자열
+- Enum: value
+- tuple: 리스트, set/frozenset: 인코딩 결과로 정렬한 리스트
+- dict 키: json과 같은 규칙으로 정렬/문자열 변환 (키 타입이 섞이면 변환한 문자열로 정렬)
+
+전체 JSON 문자열을 만들지 않고 조각 단위로 해시에 넣는다.
+"""
+import hashlib
+from datetime import date, datetime, time
+from enum import Enum
+from json.encoder import JSONEncoder, encode_basestring
+from typing import Any, Iterator
+
+# 작은 조각은 모아서 한 번에 update (해시 호출 횟수 감소)
+_FLUSH_SIZE = 64 * 1024
+
+# JSON 기본 타입만 있는 하위 구조는 C 인코더로 한 번에 인코딩 (결과는 동일)
+_native_encoder = JSONEncoder(sort_keys=True, ensure_ascii=False)
+
+
+def _float_text(value: float) -> str:
+    # json.dumps와 같은 표현 (NaN/Infinity 포함)
+    if value != value:
+        return "NaN"
+    if value == float("inf"):
+        return "Infinity"
+    if value == float("-inf"):
+        return "-Infinity"
+    return float.__repr__(value)
+
+
+def _key_text(key: Any) -> str:
+    # json.dumps의 dict 키 변환 규칙
+    if isinstance(key, str):
+        return key
+    if isinstance(key, Enum):
+        return _key_text(key.value)
+    if key is True:
+        return "true"
+    if key is False:
+        return "false"
+    if key is None:
+        return "null"
+    if isinstance(key, float):
+        return _float_text(key)
+    if isinstance(key, int):
+        return int.__repr__(key)
+    if isinstance(key, (datetime, date, time)):
+        return key.isoformat()
+    raise TypeError(f"keys must be str, int, float, bool or None, not {type(key).__name__}")
+
+
+def iter_canonical(value: Any, _nested: bool = False) -> Iterator[str]:
+    """value의 정규 JSON 텍스트를 조각 단위로 생성
+
+    최상위 컨테이너는 필드 단위로 흘려보내 큰 본문 문자열과 합쳐지지 않게 하고,
+    중첩된 컨테이너는 먼저 C 인코더를 시도한 뒤 확장 타입이 있으면 직접 인코딩한다.
+    """
+    if _nested and isinstance(value, (dict, list, tuple)):
+        try:
+            yield _native_encoder.encode(value)
+            return
+        except (TypeError, ValueError):
+            pass
+
+    if isinstance(value, str):
+        yield encode_basestring(value)
+    elif value is None:
+        yield "null"
+    elif value is True:
+        yield "true"
+    elif value is False:
+        yield "false"
+    elif isinstance(value, Enum):
+        yield from iter_canonical(value.value)
+    elif isinstance(value, int):
+        yield int.__repr__(value)
+    elif isinstance(value, float):
+        yield _float_text(value)
+    elif isinstance(value, dict):
+        if not value:
+            yield "{}"
+            return
+        yield "{"
+        for index, (key, item) in enumerate(_sorted_items(value)):
+            yield (", " if index else "") + encode_basestring(_key_text(key)) + ": "
+            yield from iter_canonical(item, True)
+        yield "}"
+    elif isinstance(value, (list, tuple)):
+        yield from _iter_sequence(value)
+    elif isinstance(value, (set, frozenset)):
+        yield from _iter_sequence(sorted(value, key=canonical_text))
+    elif isinstance(value, (datetime, date, time)):
+        yield encode_basestring(value.isoformat())
+    else:
+        raise TypeError(f"Object of type {type(value).__name__} is not canonically serializable")
+
+
+def _sorted_items(value: dict) -> list:
+    # json.dumps(sort_keys=True)처럼 원래 키로 정렬하고, 키 타입이 섞여 비교할 수 없으면 문자열 키로 정렬
+    try:
+        return sorted(value.items(), key=lambda pair: pair[0])
+    except TypeError:
+        return sorted(value.items(), key=lambda pair: _key_text(pair[0]))
+
+
+def _iter_sequence(values) -> Iterator[str]:
+    if not values:
+        yield "[]"
+        return
+    yield "["
+    for index, item in enumerate(values):
+        if index:
+            yield ", "
+        yield from iter_canonical(item, True)
+    yield "]"
+
+
+def canonical_text(value: Any) -> str:
+    """정규 JSON 텍스트 (테스트/정렬용. 해시 계산에는 canonical_sha256 사용)"""
+    return "".join(iter_canonical(value))
+
+
+def canonical_sha256(value: Any) -> str:
+    """정규 JSON 텍스트의 UTF-8 바이트 SHA-256 (hex)"""
+    hasher = hashlib.sha256()
+    buffer = []
+    buffered = 0
+    for chunk in iter_canonical(value):
+        if len(chunk) >= _FLUSH_SIZE:
+            # 큰 본문은 버퍼와 합치지 않고 바로 넣는다
+            if buffer:
+                hasher.update("".join(buffer).encode("utf-8"))
+                buffer.clear()
+                buffered = 0
+            hasher.update(chunk.encode("utf-8"))
+            continue
+        buffer.append(chunk)
+        buffered += len(chunk)
+        if buffered >= _FLUSH_SIZE:
+            hasher.update("".join(buffer).encode("utf-8"))
+            buffer.clear()
+            buffered = 0
+    if buffer:
+        hasher.update("".join(buffer).encode("utf-8"))
+    return hasher.hexdigest()
@@ -0,0 +1,130 @@
+"""문서 무결성 해시 계산 (순수 함수)
+
+IntegrityService의 단건 검증과 일괄 검증(프로세스 풀)이 같은 계산을 쓰도록
+DB 조회와 분리했다. 입력은 Beanie 모델의 model_dump() 또는 aggregation 결과 dict.
+"""
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from utils.canonical import canonical_sha256
+
+
+def _text(value: Any) -> str:
+    return value.value if hasattr(value, 'value') else str(value)
+
+
+def _isoformat(value: Any) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+def _sha256_json(data: Any) -> str:
+    # 정렬된 정규 JSON을 조각 단위로 해시 (기존 json.dumps(sort_keys=True) 해시와 동일)
+    return canonical_sha256(data)
+
+
+def compute_content_hash(request: Mapping[str, Any]) -> str:
+    """문서 내용 해시 생성"""
+    content_data = {
+        "id": request["id"],
+        "title": request["title"],
+        "content": request["content"],
+        "form_data": request.get("form_data") or {},
+        "template_id": request["template_id"],
+        "document_number": request["document_number"],
+        "requester_id": request["requester_id"],
+        "department_id": request.get("department_id"),
+        "status": _text(request["status"]),
+        "completed_at": _isoformat(request.get("completed_at")),
+    }
+    return _sha256_json(content_data)
+
+
+def compute_metadata_hash(
+    approval_lines: Sequence[Mapping[str, Any]],
+    histories: Sequence[Mapping[str, Any]],
+) -> str:
+    """메타데이터 해시 생성 (결재선, 히스토리)"""
+    lines_data = [
+        {
+            "approver_id": line["approver_id"],
+            "approver_name": line["approver_name"],
+            "step_order": line["step_order"],
+            "status": _text(line["status"]),
+            "is_required": line["is_required"],
+            "is_parallel": line["is_parallel"],
+            "approved_at": _isoformat(line.get("approved_at")),
+            "comment": line.get("comment"),
+        }
+        for line in sorted(approval_lines, key=lambda x: x["step_order"])
+    ]
+    history_data = [
+        {
+            "approver_id": history["approver_id"],
+            "approver_name": history["approver_name"],
+            "action": _text(history["action"]),
+            "created_at": history["created_at"].isoformat(),
+            "ip_address": history.get("ip_address"),
+            "comment": history.get("comment"),
+        }
+        for history in sorted(histories, key=lambda x: x["created_at"])
+    ]
+    metadata = {
+        "approval_lines": lines_data,
+        "histories": history_data,
+        "lines_count": len(lines_data),
+        "histories_count": len(history_data),
+    }
+    return _sha256_json(metadata)
+
+
+def verify_chain(chain: Sequence[Mapping[str, Any]]) -> Tuple[bool, Optional[int]]:
+    """무결성 체인 검증. (유효 여부, 체인이 깨진 버전)을 반환한다.
+
+    chain은 document_version 오름차순이어야 한다.
+    """
+    for previous, current in zip(chain, chain[1:]):
+        # 이전 해시가 올바르게 연결되어 있는지, 버전 순서가 올바른지 확인
+        if current["previous_hash"] != previous["content_hash"]:
+            return False, current["document_version"]
+        if current["document_version"] != previous["document_version"] + 1:
+            return False, current["document_version"]
+    return True, None
+
+
+def evaluate_integrity_snapshot(snapshot: Mapping[str, Any]) -> Dict[str, Any]:
+    """결재 문서 1건의 현재 상태와 무결성 체인을 비교한다 (일괄 검증용)
+
+    snapshot: {"request": ..., "approval_lines": [...], "histories": [...], "chain": [...]}
+    """
+    request = snapshot["request"]
+    chain = sorted(snapshot["chain"], key=lambda x: x["document_version"])
+    if not chain:
+        return {
+            "request_id": request["id"],
+            "integrity_id": None,
+            "document_version": None,
+            "is_valid": False,
+            "tampered_fields": [],
+        }
+
+    latest = chain[-1]
+    chain_valid, _ = verify_chain(chain)
+    tampered_fields = []
+    if latest["content_hash"] != compute_content_hash(request):
+        tampered_fields.append("content")
+    if latest["metadata_hash"] != compute_metadata_hash(snapshot["approval_lines"], snapshot["histories"]):
+        tampered_fields.append("metadata")
+    if not chain_valid:
+        tampered_fields.append("chain")
+
+    return {
+        "request_id": request["id"],
+        "integrity_id": latest["_id"] if "_id" in latest else latest["id"],
+        "document_version": latest["document_version"],
+        "is_valid": not tampered_fields,
+        "tampered_fields": tampered_fields,
+    }
+
+
+def evaluate_integrity_snapshots(snapshots: List[Mapping[str, Any]]) -> List[Dict[str, Any]]:
+    """프로세스 풀 작업 단위 (배치 하나를 한 번에 넘겨 IPC 횟수를 줄인다)"""
+    return [evaluate_integrity_snapshot(snapshot) for snapshot in snapshots]
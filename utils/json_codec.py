@@ -0,0 +1,41 @@
+"""JSON 인코딩 (orjson이 있으면 사용, 없으면 표준 json)
+
+웹소켓 프레임과 API 응답이 같은 규칙으로 직렬화되도록 한 곳에 모았다.
+출력은 Starlette JSONResponse/send_json과 같은 compact 형식(ensure_ascii=False)이다.
+datetime은 두 경우 모두 custom_json_encoder 형식(밀리초까지, 타임존 없음)으로 쓴다.
+"""
+import json
+from datetime import datetime
+from typing import Any, Callable
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성
+    orjson = None
+
+
+def custom_json_encoder(obj):
+    if isinstance(obj, datetime):
+        # 타임존 정보 없이 KST 시간을 그대로 직렬화
+        return obj.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3]
+    raise TypeError(f"Object {obj} is not JSON serializable")
+
+
+if orjson is not None:
+    # datetime은 orjson 기본 형식 대신 default(custom_json_encoder)로 넘긴다
+    _ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+    def dumps(obj: Any, default: Callable[[Any], Any] = custom_json_encoder) -> bytes:
+        return orjson.dumps(obj, default=default, option=_ORJSON_OPTIONS)
+
+else:
+
+    def dumps(obj: Any, default: Callable[[Any], Any] = custom_json_encoder) -> bytes:
+        return json.dumps(
+            obj, default=default, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+        ).encode("utf-8")
+
+
+def dumps_text(obj: Any, default: Callable[[Any], Any] = custom_json_encoder) -> str:
+    """웹소켓 text 프레임용"""
+    return dumps(obj, default).decode("utf-8")
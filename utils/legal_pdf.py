@@ -0,0 +1,415 @@
+"""법적 문서 PDF 렌더링.
+
+한글 TTF 폰트 파싱과 ParagraphStyle/TableStyle 생성은 비용이 크므로
+프로세스당 한 번만 만들고 이후 PDF 생성에서 재사용한다.
+
+렌더링은 순수 CPU 작업이라 이벤트 루프를 막지 않도록 ProcessPoolExecutor에서
+실행한다. render_legal_pdf는 DB에 접근하지 않고 직렬화 가능한 dict만 받는다.
+"""
+import asyncio
+import io
+import multiprocessing
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+from reportlab.lib import colors
+from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_JUSTIFY
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.units import inch, mm
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
+
+from utils.logger import logger
+from utils.settings import settings
+from utils.time import get_utc_now_naive, utc_to_kst_naive
+
+KOREAN_FONT_NAME = "맑은고딕"
+KOREAN_FONT_PATH = os.path.join(os.path.dirname(__file__), "..", "fonts", "malgun.ttf")
+
+_render_pool: Optional[ProcessPoolExecutor] = None
+
+
+@dataclass(frozen=True)
+class LegalPdfStyles:
+    font_name: str
+    document_title: ParagraphStyle
+    section_title: ParagraphStyle
+    subsection: ParagraphStyle
+    content: ParagraphStyle
+    table_header: ParagraphStyle
+    table_content: ParagraphStyle
+    footer: ParagraphStyle
+    basic_info_table: TableStyle
+    approval_table: TableStyle
+    history_table: TableStyle
+    file_table: TableStyle
+    # 상태/처리내용 색상별 표 내용 스타일 (행마다 새로 만들지 않도록 미리 생성)
+    colored_contents: Dict[str, ParagraphStyle] = field(default_factory=dict)
+
+    def status_style(self, text: str) -> ParagraphStyle:
+        """APPROVED/APPROVE는 초록, REJECTED/REJECT는 빨강, 나머지는 주황"""
+        if text in ("APPROVED", "APPROVE"):
+            return self.colored_contents["green"]
+        if text in ("REJECTED", "REJECT"):
+            return self.colored_contents["red"]
+        return self.colored_contents["orange"]
+
+
+def register_korean_font(font_path: str = KOREAN_FONT_PATH) -> str:
+    """한글 폰트를 등록한다. 이미 등록되어 있으면 다시 파싱하지 않는다."""
+    if KOREAN_FONT_NAME not in pdfmetrics.getRegisteredFontNames():
+        if not os.path.exists(font_path):
+            # 폰트 파일은 저장소에 넣지 않는다 (README의 '법적 문서 PDF 폰트' 참고)
+            raise RuntimeError(f"법적 문서 PDF용 한글 폰트가 없습니다: {os.path.abspath(font_path)}")
+        pdfmetrics.registerFont(TTFont(KOREAN_FONT_NAME, font_path))
+    return KOREAN_FONT_NAME
+
+
+def _grid_table_style(font_name: str, font_size: int, header_background) -> TableStyle:
+    """결재선/이력/첨부파일 표 공통 스타일 (헤더 행 제외 줄무늬)"""
+    return TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), header_background),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('FONTNAME', (0, 0), (-1, -1), font_name),
+        ('FONTSIZE', (0, 0), (-1, -1), font_size),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
+    ])
+
+
+@lru_cache(maxsize=1)
+def get_legal_pdf_styles() -> LegalPdfStyles:
+    """폰트 등록과 스타일 생성을 처음 호출할 때 한 번만 수행한다."""
+    font_name = register_korean_font()
+    styles = getSampleStyleSheet()
+
+    table_content = ParagraphStyle(
+        'TableContent',
+        parent=styles['Normal'],
+        fontName=font_name,
+        fontSize=9,
+        alignment=TA_LEFT
+    )
+
+    return LegalPdfStyles(
+        font_name=font_name,
+        document_title=ParagraphStyle(
+            'DocumentTitle',
+            parent=styles['Title'],
+            fontName=font_name,
+            fontSize=20,
+            alignment=TA_CENTER,
+            spaceAfter=30,
+            textColor=colors.black,
+            borderWidth=2,
+            borderColor=colors.black,
+            borderPadding=10,
+            backColor=colors.lightgrey
+        ),
+        section_title=ParagraphStyle(
+            'SectionTitle',
+            parent=styles['Heading1'],
+            fontName=font_name,
+            fontSize=14,
+            alignment=TA_LEFT,
+            spaceAfter=12,
+            spaceBefore=20,
+            textColor=colors.darkblue,
+            borderWidth=1,
+            borderColor=colors.darkblue,
+            borderPadding=8,
+            leftIndent=0
+        ),
+        subsection=ParagraphStyle(
+            'SubSection',
+            parent=styles['Heading2'],
+            fontName=font_name,
+            fontSize=12,
+            alignment=TA_LEFT,
+            spaceAfter=6,
+            spaceBefore=12,
+            textColor=colors.darkred,
+            leftIndent=10
+        ),
+        content=ParagraphStyle(
+            'Content',
+            parent=styles['Normal'],
+            fontName=font_name,
+            fontSize=10,
+            alignment=TA_JUSTIFY,
+            spaceAfter=6,
+            spaceBefore=3,
+            leftIndent=15,
+            rightIndent=15
+        ),
+        table_header=ParagraphStyle(
+            'TableHeader',
+            parent=styles['Normal'],
+            fontName=font_name,
+            fontSize=9,
+            alignment=TA_CENTER,
+            textColor=colors.black
+        ),
+        table_content=table_content,
+        footer=ParagraphStyle(
+            'Footer',
+            parent=styles['Normal'],
+            fontName=font_name,
+            fontSize=8,
+            alignment=TA_CENTER,
+            textColor=colors.grey
+        ),
+        basic_info_table=TableStyle([
+            ('BACKGROUND', (0, 0), (0, -1), colors.darkblue),
+            ('TEXTCOLOR', (0, 0), (0, -1), colors.white),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('FONTNAME', (0, 0), (-1, -1), font_name),
+            ('FONTSIZE', (0, 0), (-1, -1), 9),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('GRID', (0, 0), (-1, -1), 1, colors.black),
+            ('ROWBACKGROUNDS', (0, 0), (-1, -1), [colors.white, colors.lightgrey]),
+        ]),
+        approval_table=_grid_table_style(font_name, 9, colors.white),
+        history_table=_grid_table_style(font_name, 8, colors.white),
+        file_table=_grid_table_style(font_name, 8, colors.darkgreen),
+        colored_contents={
+            name: ParagraphStyle(f'TableContent_{name}', parent=table_content, textColor=color)
+            for name, color in (("green", colors.green), ("red", colors.red), ("orange", colors.orange))
+        },
+    )
+
+
+def html_to_plain_text(html_content: str) -> str:
+    """HTML을 일반 텍스트로 변환 (간단한 처리)"""
+    # HTML 태그 제거
+    text = re.sub(r'<[^>]+>', '', html_content)
+    
+    # HTML 엔티티 변환
+    text = text.replace('&nbsp;', ' ')
+    text = text.replace('&lt;', '<')
+    text = text.replace('&gt;', '>')
+    text = text.replace('&amp;', '&')
+    
+    # 연속된 공백 정리
+    text = re.sub(r'\s+', ' ', text)
+    
+    return text.strip()
+
+
+def render_legal_pdf(data: Dict[str, Any]) -> bytes:
+    """결재 문서 데이터를 법적 문서 PDF로 렌더링 (reportlab 사용)
+
+    data는 LegalArchiveService._build_pdf_data가 만든 dict이며
+    approval_lines는 단계순, histories는 시간순으로 정렬되어 있어야 한다.
+    """
+    # PDF 문서 생성 (전문적인 여백과 설정)
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(
+        buffer, 
+        pagesize=A4,
+        rightMargin=20*mm,
+        leftMargin=20*mm,
+        topMargin=25*mm,
+        bottomMargin=25*mm
+    )
+    
+    # 폰트/스타일은 프로세스당 한 번만 생성해 재사용
+    pdf_styles = get_legal_pdf_styles()
+    document_title_style = pdf_styles.document_title
+    section_title_style = pdf_styles.section_title
+    subsection_style = pdf_styles.subsection
+    content_style = pdf_styles.content
+    table_header_style = pdf_styles.table_header
+    table_content_style = pdf_styles.table_content
+    footer_style = pdf_styles.footer
+    
+    # PDF 내용 구성
+    story = []
+    
+    # 문서 헤더 (공식 문서 스타일)
+    story.append(Paragraph("전자결재 법적문서", document_title_style))
+    story.append(Spacer(1, 0.3*inch))
+    
+    # 문서 기본 정보 테이블
+    story.append(Paragraph("I. 문서 기본 정보", section_title_style))
+    
+    basic_info_data = [
+        [Paragraph("문서번호", table_header_style), Paragraph(str(data["document_number"]), table_content_style)],
+        [Paragraph("제목", table_header_style), Paragraph(str(data["title"]), table_content_style)],
+        [Paragraph("기안자", table_header_style), Paragraph(str(data["requester_name"]), table_content_style)],
+        [Paragraph("기안일시", table_header_style), Paragraph(utc_to_kst_naive(data["created_at"]).strftime('%Y년 %m월 %d일 %H시 %M분'), table_content_style)],
+        [Paragraph("완료일시", table_header_style), Paragraph(utc_to_kst_naive(data["completed_at"]).strftime('%Y년 %m월 %d일 %H시 %M분') if data["completed_at"] else '처리중', table_content_style)],
+        [Paragraph("문서상태", table_header_style), Paragraph(data["status"], table_content_style)]
+    ]
+    
+    basic_info_table = Table(basic_info_data, colWidths=[40*mm, 120*mm])
+    basic_info_table.setStyle(pdf_styles.basic_info_table)
+    story.append(basic_info_table)
+    story.append(Spacer(1, 0.3*inch))
+    
+    # 문서 내용
+    story.append(Paragraph("II. 결재 요청 내용", section_title_style))
+    content_text = html_to_plain_text(data["content"])
+    story.append(Paragraph(content_text, content_style))
+    story.append(Spacer(1, 0.3*inch))
+    
+    # 결재선 정보 테이블
+    story.append(Paragraph("III. 결재선 및 승인 현황", section_title_style))
+    
+    approval_data = [
+        [Paragraph("단계", table_header_style), 
+         Paragraph("결재자", table_header_style), 
+         Paragraph("상태", table_header_style), 
+         Paragraph("승인일시", table_header_style), 
+         Paragraph("의견", table_header_style)]
+    ]
+    
+    for line in data["approval_lines"]:
+        status_text = line["status"]
+        approved_text = utc_to_kst_naive(line["approved_at"]).strftime('%Y-%m-%d %H:%M') if line["approved_at"] else '-'
+        comment = line["comment"] or '-'
+        
+        approval_data.append([
+            Paragraph(str(line["step_order"]), table_content_style),
+            Paragraph(str(line["approver_name"]), table_content_style),
+            Paragraph(status_text, pdf_styles.status_style(status_text)),
+            Paragraph(approved_text, table_content_style),
+            Paragraph(comment[:50] + ('...' if len(comment) > 50 else ''), table_content_style)
+        ])
+    
+    approval_table = Table(approval_data, colWidths=[20*mm, 35*mm, 25*mm, 35*mm, 55*mm])
+    approval_table.setStyle(pdf_styles.approval_table)
+    story.append(approval_table)
+    story.append(Spacer(1, 0.3*inch))
+    
+    # 결재 이력
+    story.append(Paragraph("IV. 상세 결재 이력", section_title_style))
+    
+    history_data = [
+        [Paragraph("일시", table_header_style),
+         Paragraph("결재자", table_header_style),
+         Paragraph("처리내용", table_header_style),
+         Paragraph("접속IP", table_header_style),
+         Paragraph("의견", table_header_style)]
+    ]
+    
+    for history in data["histories"]:
+        action_text = history["action"]
+        
+        history_data.append([
+            Paragraph(utc_to_kst_naive(history["created_at"]).strftime('%Y-%m-%d<br/>%H:%M:%S'), table_content_style),
+            Paragraph(str(history["approver_name"]), table_content_style),
+            Paragraph(action_text, pdf_styles.status_style(action_text)),
+            Paragraph(history["ip_address"] or '-', table_content_style),
+            Paragraph((history["comment"] or '-')[:40] + ('...' if history["comment"] and len(history["comment"]) > 40 else ''), table_content_style)
+        ])
+    
+    history_table = Table(history_data, colWidths=[35*mm, 35*mm, 25*mm, 30*mm, 45*mm])
+    history_table.setStyle(pdf_styles.history_table)
+    story.append(history_table)
+    
+    # 첨부파일 정보
+    if data["attached_files"]:
+        story.append(Spacer(1, 0.3*inch))
+        story.append(Paragraph("V. 첨부파일 목록", section_title_style))
+        
+        file_data = [
+            [Paragraph("파일명", table_header_style),
+             Paragraph("크기", table_header_style),
+             Paragraph("업로드일시", table_header_style),
+             Paragraph("업로드자", table_header_style)]
+        ]
+        
+        for file in data["attached_files"]:
+            file_size = f"{file['file_size']:,} bytes" if file["file_size"] < 1024*1024 else f"{file['file_size']/(1024*1024):.1f} MB"
+            file_data.append([
+                Paragraph(str(file["file_name"]), table_content_style),
+                Paragraph(file_size, table_content_style),
+                Paragraph(utc_to_kst_naive(file["uploaded_at"]).strftime('%Y-%m-%d %H:%M'), table_content_style),
+                Paragraph(str(file["uploaded_by"]), table_content_style)
+            ])
+        
+        file_table = Table(file_data, colWidths=[60*mm, 30*mm, 40*mm, 40*mm])
+        file_table.setStyle(pdf_styles.file_table)
+        story.append(file_table)
+    
+    # 법적 효력 안내 (새 페이지)
+    story.append(PageBreak())
+    story.append(Paragraph("법적 효력 및 보안 안내", document_title_style))
+    story.append(Spacer(1, 0.2*inch))
+    
+    legal_notice = [
+        "■ 법적 효력 제한 사항",
+        "1. 본 문서는 전자결재 시스템을 통해 생성된 전자문서입니다.",
+        "2. 완전한 법적 효력을 위해서는 다음 요건이 추가로 필요합니다:",
+        "   - 전자서명법에 따른 공인인증서 기반 전자서명",
+        "   - 공인된 타임스탬프 기관(TSA)의 시각 인증",
+        "   - 문서 무결성 보장을 위한 해시체인 구현",
+        "3. 현재 문서는 내부 업무용 전자결재 기록으로 활용 가능합니다.",
+        "4. 대외적 법적 효력이 필요한 경우 별도 법적 검토가 필요합니다.",
+        "5. 본 시스템은 전자문서 보관 및 이력 관리 기능을 제공합니다."
+    ]
+    
+    for notice in legal_notice:
+        story.append(Paragraph(notice, content_style))
+        story.append(Spacer(1, 0.1*inch))
+    
+    # 문서 생성 정보
+    story.append(Spacer(1, 0.3*inch))
+    story.append(Paragraph("■ 문서 생성 정보", subsection_style))
+    story.append(Paragraph(f"생성일시: {utc_to_kst_naive(get_utc_now_naive()).strftime('%Y년 %m월 %d일 %H시 %M분 %S초')}", footer_style))
+    story.append(Paragraph(f"생성시스템: 전자결재시스템 v2.0", footer_style))
+    story.append(Paragraph(f"문서ID: {data['request_id']}", footer_style))
+    
+    # PDF 빌드
+    doc.build(story)
+    
+    # PDF 바이트 반환
+    pdf_bytes = buffer.getvalue()
+    buffer.close()
+    return pdf_bytes
+
+
+def _warm_render_worker() -> None:
+    """워커 프로세스 시작 시 폰트 등록과 스타일 생성을 미리 수행"""
+    get_legal_pdf_styles()
+
+
+def start_pdf_render_pool(max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """PDF 렌더링 프로세스 풀 시작 (워커마다 폰트를 미리 등록)"""
+    global _render_pool
+    if _render_pool is None:
+        workers = max_workers or settings.pdf_render_workers
+        # 이벤트 루프/Mongo 클라이언트 스레드를 가진 프로세스를 fork하지 않도록 spawn 사용
+        _render_pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_warm_render_worker,
+        )
+        # 첫 요청에서 워커 기동/폰트 파싱 비용을 치르지 않도록 모든 워커를 미리 띄운다
+        for _ in range(workers):
+            _render_pool.submit(_warm_render_worker)
+        logger.info(f"PDF render pool started (workers={workers})")
+    return _render_pool
+
+
+def shutdown_pdf_render_pool() -> None:
+    global _render_pool
+    if _render_pool is not None:
+        _render_pool.shutdown(wait=False, cancel_futures=True)
+        _render_pool = None
+
+
+async def render_legal_pdf_async(data: Dict[str, Any]) -> bytes:
+    """프로세스 풀에서 PDF를 렌더링해 이벤트 루프를 막지 않는다"""
+    pool = start_pdf_render_pool()
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(pool, render_legal_pdf, data)
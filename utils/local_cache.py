@@ -0,0 +1,54 @@
+"""프로세스 내 LRU + TTL 캐시
+
+CacheService의 1단계 캐시(메모리 → Redis → Mongo)로 쓴다. asyncio 이벤트 루프
+한 스레드에서만 접근하므로 락을 두지 않는다. 저장한 값은 여러 요청이 공유하므로
+호출하는 쪽은 꺼낸 값을 수정하지 말고 새 객체를 만들어 써야 한다.
+"""
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+
+class LocalCache:
+    def __init__(self, max_entries: int, ttl_seconds: float, clock: Callable[[], float] = time.monotonic):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        # (namespace, key) -> (만료 시각, 값). 뒤쪽일수록 최근 사용
+        self._entries: "OrderedDict[Tuple[str, Hashable], Tuple[float, Any]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, namespace: str, key: Hashable) -> Tuple[bool, Any]:
+        """(hit 여부, 값). 만료된 항목은 지우고 miss로 본다."""
+        entry_key = (namespace, key)
+        entry = self._entries.get(entry_key)
+        if entry is None:
+            return False, None
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[entry_key]
+            return False, None
+        self._entries.move_to_end(entry_key)
+        return True, value
+
+    def set(self, namespace: str, key: Hashable, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        if self.max_entries <= 0:
+            return
+        entry_key = (namespace, key)
+        ttl = self.ttl_seconds if ttl_seconds is None else min(ttl_seconds, self.ttl_seconds)
+        self._entries[entry_key] = (self._clock() + ttl, value)
+        self._entries.move_to_end(entry_key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def delete(self, namespace: str, key: Hashable) -> None:
+        self._entries.pop((namespace, key), None)
+
+    def clear_namespace(self, namespace: str) -> None:
+        for entry_key in [entry_key for entry_key in self._entries if entry_key[0] == namespace]:
+            del self._entries[entry_key]
+
+    def clear(self) -> None:
+        self._entries.clear()
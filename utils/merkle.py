@@ -0,0 +1,77 @@
+"""무결성 기록 Merkle 트리 (순수 함수)
+
+리프와 내부 노드는 접두 바이트(0x00/0x01)로 구분해 두 번째 원상 공격을 막고,
+짝이 없는 마지막 노드는 복제하지 않고 그대로 다음 레벨로 올린다.
+"""
+import hashlib
+import json
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+LEAF_PREFIX = b"\x00"
+NODE_PREFIX = b"\x01"
+
+
+def integrity_leaf_hash(record: Mapping[str, Any]) -> str:
+    """무결성 기록의 변하지 않는 필드로 리프 해시 생성 (검증 횟수 등은 제외)"""
+    created_at = record["created_at"]
+    leaf = [
+        record["id"],
+        record["request_id"],
+        record["document_version"],
+        record["content_hash"],
+        record["metadata_hash"],
+        record.get("previous_hash"),
+        created_at.isoformat() if hasattr(created_at, "isoformat") else created_at,
+        record["created_by"],
+    ]
+    encoded = json.dumps(leaf, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(LEAF_PREFIX + encoded).hexdigest()
+
+
+def node_hash(left: str, right: str) -> str:
+    return hashlib.sha256(NODE_PREFIX + bytes.fromhex(left) + bytes.fromhex(right)).hexdigest()
+
+
+def build_merkle_levels(leaves: Sequence[str]) -> List[List[str]]:
+    """리프부터 루트까지 레벨별 해시 목록. 마지막 레벨이 [root]"""
+    if not leaves:
+        return [[]]
+    levels = [list(leaves)]
+    while len(levels[-1]) > 1:
+        current = levels[-1]
+        parent = [node_hash(current[i], current[i + 1]) for i in range(0, len(current) - 1, 2)]
+        if len(current) % 2 == 1:
+            parent.append(current[-1])
+        levels.append(parent)
+    return levels
+
+
+def merkle_root(levels: List[List[str]]) -> Optional[str]:
+    return levels[-1][0] if levels[-1] else None
+
+
+def merkle_proof(levels: List[List[str]], index: int) -> List[Dict[str, str]]:
+    """index번째 리프의 포함 증명 (형제 해시와 위치, 리프→루트 순서)"""
+    proof = []
+    for level in levels[:-1]:
+        sibling = index ^ 1
+        if sibling < len(level):
+            proof.append({"hash": level[sibling], "side": "left" if sibling < index else "right"})
+        index //= 2
+    return proof
+
+
+def verify_merkle_proof(leaf: str, proof: Sequence[Mapping[str, str]], root: str) -> bool:
+    current = leaf
+    for step in proof:
+        if step["side"] == "left":
+            current = node_hash(step["hash"], current)
+        else:
+            current = node_hash(current, step["hash"])
+    return current == root
+
+
+def chain_epoch_root(previous_root: Optional[str], tree_root: Optional[str]) -> str:
+    """이전 에폭 루트와 이번 트리 루트를 묶은 에폭 루트 (최신 루트가 전체 이력을 보증)"""
+    payload = (previous_root or "") + ":" + (tree_root or "")
+    return hashlib.sha256(NODE_PREFIX + payload.encode("utf-8")).hexdigest()
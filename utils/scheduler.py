@@ -1,4 +1,7 @@
 # utils/scheduler.py
+import asyncio
+import functools
+
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from domain.voucher import Company
@@ -7,14 +10,44 @@ from utils.settings import settings
 from utils.slack import send_slack_message
 from pytz import timezone
 from containers import Container
+from application.job_queue_service import INTEGRITY_SWEEP_JOB, INTEGRITY_MERKLE_SEAL_JOB, job_key
+from application.lock_service import VOUCHER_SYNC_LOCK
+from utils.logger import logger
 
 scheduler = AsyncIOScheduler(timezone="Asia/Seoul")
 
 container = Container()
 voucher_service = container.voucher_service()  # DI로 받은 서비스 인스턴스
 payment_task_calendar_service = container.payment_task_calendar_service()
+job_queue_service = container.job_queue_service()
+lock_service = container.lock_service()
+scheduler_leader = container.scheduler_leader()
+
+
+def leader_job(lock_name: str):
+    """스케줄은 모든 프로세스에 등록되지만 리더 프로세스만 실행한다.
+
+    리더가 바뀌는 순간에도 겹치지 않도록 작업마다 lock_name 락을 잡고 실행한다.
+    """
+    def decorator(job):
+        @functools.wraps(job)
+        async def wrapper():
+            if not scheduler_leader.is_leader:
+                return
+            async with lock_service.hold(lock_name) as acquired:
+                if not acquired:
+                    logger.warning(f"Scheduled job {job.__name__} skipped: {lock_name} is already running")
+                    return
+                await job()
+        return wrapper
+    return decorator
+
+
+async def run_leader_election(stop_event: asyncio.Event) -> None:
+    await scheduler_leader.run(stop_event)
 
 
+@leader_job(VOUCHER_SYNC_LOCK)  # 수동 /vouchers/sync와 같은 락
 async def crawl_and_save_job():
     now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     await send_slack_message(f"🌀 [{now}] 전표 스케줄 작업 시작")
@@ -24,7 +57,7 @@ async def crawl_and_save_job():
     wehago_password = settings.wehago_password
 
     try:
-        vouchers_by_company = await voucher_service.sync_many(
+        result = await voucher_service.sync_many(
             companies=list(Company),
             year=year,
             wehago_id=wehago_id,
@@ -34,17 +67,30 @@ async def crawl_and_save_job():
         await send_slack_message(f"❌ 전표 스케줄 작업 실패: {error}")
         return
 
-    total_voucher_count = sum(len(vouchers) for vouchers in vouchers_by_company.values())
-    for company, vouchers in vouchers_by_company.items():
-        await send_slack_message(f"✅ [{company.value}] 전표 수집 및 저장 성공 ({len(vouchers)}건)")
-
-    await send_slack_message(f"✅ 전표 스케줄 작업 완료 ({total_voucher_count}건)")
-
-
+    total_voucher_count = 0
+    for company in Company:
+        vouchers = result.vouchers(company)
+        total_voucher_count += len(vouchers)
+        failed_months = result.failed_months(company)
+        if failed_months:
+            # 실패한 월은 저장/삭제하지 않고 기존 전표를 유지한다
+            months = ", ".join(f"{month}월" for month in failed_months)
+            await send_slack_message(
+                f"⚠️ [{company.value}] 전표 일부 수집 실패 ({len(vouchers)}건 저장, 실패: {months})"
+            )
+        else:
+            await send_slack_message(f"✅ [{company.value}] 전표 수집 및 저장 성공 ({len(vouchers)}건)")
+
+    status = "⚠️ 전표 스케줄 작업 일부 실패" if result.failed_units else "✅ 전표 스케줄 작업 완료"
+    await send_slack_message(f"{status} ({total_voucher_count}건)")
+
+
+@leader_job("payment_task_calendar_retry")
 async def retry_payment_task_calendar_sync_job():
     await payment_task_calendar_service.retry_unsynced_tasks()
 
 
+@leader_job("payment_task_telegram_summary")
 async def send_payment_task_summary_job():
     try:
         await payment_task_calendar_service.send_daily_summary()
@@ -52,6 +98,24 @@ async def send_payment_task_summary_job():
         print(f"텔레그램 납부 요약 발송 실패: {error}")
 
 
+@leader_job("integrity_sweep_daily")
+async def enqueue_integrity_sweep_job():
+    # 날짜별 idempotency key로 여러 인스턴스에서 스케줄이 돌아도 하루 한 번만 등록된다
+    today = datetime.datetime.now(timezone("Asia/Seoul")).strftime("%Y-%m-%d")
+    await job_queue_service.enqueue(INTEGRITY_SWEEP_JOB, {}, idempotency_key=job_key(INTEGRITY_SWEEP_JOB, today))
+
+
+@leader_job("integrity_merkle_seal_daily")
+async def enqueue_integrity_merkle_seal_job():
+    # 전날(KST) 에폭을 봉인. 에폭 ID가 곧 idempotency key라 중복 등록되지 않는다
+    epoch_id = (datetime.datetime.now(timezone("Asia/Seoul")) - datetime.timedelta(days=1)).strftime("%Y-%m-%d")
+    await job_queue_service.enqueue(
+        INTEGRITY_MERKLE_SEAL_JOB,
+        {"epoch_id": epoch_id},
+        idempotency_key=job_key(INTEGRITY_MERKLE_SEAL_JOB, epoch_id),
+    )
+
+
 def start_scheduler():
     # 매일 오전 8시에 실행
     scheduler.add_job(
@@ -81,6 +145,22 @@ def start_scheduler():
         replace_existing=True,
     )
     
+    # 매일 새벽 결재 완료 문서 전체 무결성 검증
+    scheduler.add_job(
+        enqueue_integrity_sweep_job,
+        CronTrigger(hour=settings.integrity_sweep_hour, minute=0, timezone=timezone("Asia/Seoul")),
+        id="integrity_sweep_daily",
+        replace_existing=True,
+    )
+    
+    # 매일 0시 10분 전날 무결성 기록 Merkle 봉인
+    scheduler.add_job(
+        enqueue_integrity_merkle_seal_job,
+        CronTrigger(hour=0, minute=10, timezone=timezone("Asia/Seoul")),
+        id="integrity_merkle_seal_daily",
+        replace_existing=True,
+    )
+    
     # 매일 저녁 6시에 실행
     scheduler.add_job(
         crawl_and_save_job,
@@ -18,6 +18,48 @@ class Settings(BaseSettings):
     telegram_chat_id: Optional[str] = None
     payment_summary_hour: int = 8
     payment_summary_minute: int = 30
+    # API 서버 안에서 스케줄러/백그라운드 작업 워커 실행 여부 (python -m worker를 따로 띄우면 false)
+    run_background_workers: bool = True
+    # 백그라운드 작업 큐
+    job_worker_concurrency: int = 2
+    job_poll_interval_seconds: float = 2.0
+    job_max_attempts: int = 5
+    job_retry_base_seconds: int = 30
+    job_retry_max_seconds: int = 3600
+    job_lock_timeout_seconds: int = 900
+    # 법적 문서 PDF 렌더링 프로세스 수
+    pdf_render_workers: int = 2
+    # 법적 문서 일괄 생성(backfill) 배치 크기 / 작업 1건당 최대 처리 건수
+    legal_backfill_batch_size: int = 50
+    legal_backfill_job_max_requests: int = 1000
+    # 무결성 일괄 검증 (매일 integrity_sweep_hour시 실행)
+    integrity_sweep_batch_size: int = 200
+    integrity_sweep_workers: int = 2
+    integrity_sweep_hour: int = 3
+    # 결재 문서 접근 권한(ACL) Redis 캐시 유지 시간
+    acl_cache_ttl_seconds: int = 300
+    # Redis 읽기 캐시(사용자, 결재선, 대기 건수) 사용 여부
+    cache_enabled: bool = True
+    # 프로세스 메모리 캐시 (Redis 앞단) 최대 항목 수 / 유지 시간
+    local_cache_max_entries: int = 10000
+    local_cache_ttl_seconds: int = 60
+    # 웹소켓 연결별 전송 대기열 크기 / 전송 제한 시간 (넘으면 연결을 끊는다)
+    ws_send_queue_size: int = 100
+    ws_send_timeout_seconds: float = 10.0
+    # 사용자별 오프라인 알림 inbox (Redis stream) 보관 건수 / 기간
+    notification_inbox_max_len: int = 200
+    notification_inbox_ttl_seconds: int = 7 * 24 * 3600
+    # 결재 알림을 모아 보내는 시간 (초)
+    notification_batch_window_seconds: float = 0.2
+    # 분산 락 유지 시간 (잡고 있는 동안 1/3마다 연장) / 스케줄러 리더 락 유지 시간
+    distributed_lock_ttl_seconds: int = 60
+    scheduler_leader_ttl_seconds: int = 30
+    # 위하고 전표 수집: 실패한 (회사, 월)만 다시 수집하는 최대 시도 횟수 / 백오프 시작 간격(초)
+    whg_max_attempts: int = 3
+    whg_retry_base_seconds: float = 5.0
+    # 전표 동기화 작업 최대 시도 횟수 / 계정 정보와 중복 방지 키 유지 시간
+    voucher_sync_max_attempts: int = 3
+    voucher_sync_job_ttl_seconds: int = 6 * 3600
 
     class Config:
         env_file = ".env"  # .env 파일을 사용하도록 지정
@@ -3,13 +3,18 @@ import io
 import json
 import asyncio
 from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Optional
 
 from playwright.async_api import async_playwright, Page, Response, TimeoutError as PlaywrightTimeoutError
 
 from common.exceptions import CrawlingError, LoginError
-from domain.voucher import Company
+from domain.voucher import Company, CrawlResult, CrawlUnitStatus, MonthCrawlResult
 from domain.voucher import Voucher
 from utils.logger import logger
+from utils.settings import settings
+
+# 진행 상황 이벤트를 받는 콜백 (예: {"event": "month_fetched", "company": ..., "month": 3, "rows_parsed": 120})
+ProgressCallback = Callable[[Dict[str, Any]], Awaitable[None]]
 
 COMPANY_CONFIGS = {
     Company.BAEKSUNG: {
@@ -56,6 +61,9 @@ COMPANY_CONFIGS = {
 
 
 class Whg:
+    def __init__(self, on_progress: Optional[ProgressCallback] = None):
+        self.on_progress = on_progress
+
     def calculate_gisu(self, company: Company, year: int):
         """Calculate gisu (period) for the given company and year."""
         config = COMPANY_CONFIGS.get(company)
@@ -64,16 +72,25 @@ class Whg:
 
         return config["base_gisu"] - (config["base_year"] - year)
 
-    async def crawl_whg(self, company: Company, year: int, month: int, wehago_id: str, wehago_password: str):
-        vouchers_by_company = await self.crawl_companies(
-            [company], year, month, wehago_id, wehago_password
-        )
-        return vouchers_by_company[company]
+    async def crawl_whg(
+        self, company: Company, year: int, month: int, wehago_id: str, wehago_password: str
+    ) -> CrawlResult:
+        return await self.crawl_companies([company], year, month, wehago_id, wehago_password)
 
     async def crawl_companies(
         self, companies: list[Company], year: int, month: int, wehago_id: str, wehago_password: str
-    ) -> dict[Company, list[Voucher]]:
-        """한 번 로그인한 세션에서 회사별 탭을 병렬로 열어 전표를 수집한다."""
+    ) -> CrawlResult:
+        """한 번 로그인한 세션에서 회사별 탭을 병렬로 열어 전표를 수집한다.
+
+        (회사, 월) 단위로 결과를 남기고, 실패한 단위만 whg_max_attempts번까지 백오프 후 다시 수집한다.
+        일부가 끝내 실패해도 나머지 결과는 그대로 반환한다. 모두 실패하면 CrawlingError.
+        """
+        result = CrawlResult(units=[
+            MonthCrawlResult(company=company, year=year, month=target_month)
+            for company in companies
+            for target_month in self._target_months(year, month)
+        ])
+
         async with async_playwright() as p:
             browser = await p.chromium.launch(
                 headless=True,
@@ -108,26 +125,15 @@ class Whg:
                 await self._handle_duplicate_login(main_page)
                 await main_page.locator(".snbnext").wait_for(state="visible", timeout=10000)
                 logger.info("메인 페이지 로그인 완료 확인됨")
-                
-                results = await asyncio.gather(
-                    *(self._extract_company_data_parallel(context, company, year, month) for company in companies),
-                    return_exceptions=True,
-                )
-                failed_companies = [
-                    company.value
-                    for company, result in zip(companies, results)
-                    if isinstance(result, Exception)
-                ]
-                if failed_companies:
-                    raise CrawlingError(f"전표 수집 실패: {', '.join(failed_companies)}")
 
-                vouchers_by_company = {}
-                for company_vouchers, company_enum in results:
-                    for voucher in company_vouchers:
-                        voucher.company = company_enum.value
-                    vouchers_by_company[company_enum] = company_vouchers
+                await self._crawl_with_retries(context, result)
+
+                if result.units and not result.fetched_units:
+                    raise CrawlingError(f"전표 수집 실패: {', '.join(company.value for company in companies)}")
+                for unit in result.failed_units:
+                    logger.error(f"전표 수집 최종 실패: {unit.company.value} {year}년 {unit.month}월 ({unit.error})")
 
-                return vouchers_by_company
+                return result
 
             except (LoginError, CrawlingError):
                 raise
@@ -141,20 +147,52 @@ class Whg:
             finally:
                 await browser.close()
 
-    
-    async def _extract_company_data_parallel(self, context, company: Company, year: int, month: int):
-        """각 회사별 데이터를 별도 탭에서 처리"""
+    async def _crawl_with_retries(self, context, result: CrawlResult):
+        """실패한 (회사, 월)만 골라 whg_max_attempts번까지 백오프 후 다시 수집한다"""
+        for attempt in range(1, settings.whg_max_attempts + 1):
+            pending = result.failed_units
+            if not pending:
+                return
+            if attempt > 1:
+                delay = settings.whg_retry_base_seconds * (2 ** (attempt - 2))
+                logger.warning(
+                    f"전표 수집 재시도 {attempt}/{settings.whg_max_attempts}: "
+                    f"{len(pending)}개 (회사, 월), {delay}초 후"
+                )
+                await asyncio.sleep(delay)
+
+            units_by_company: dict[Company, list[MonthCrawlResult]] = {}
+            for unit in pending:
+                units_by_company.setdefault(unit.company, []).append(unit)
+            await asyncio.gather(
+                *(self._crawl_company_months(context, company, units) for company, units in units_by_company.items())
+            )
+
+    @staticmethod
+    def _target_months(year: int, month: int | None) -> list[int]:
+        """수집할 월 (올해는 이번 달까지)"""
+        now = datetime.now()
+        last_month = now.month if year == now.year else 12
+        months = range(1, 13) if month is None else [month]
+        return [target_month for target_month in months if target_month <= last_month]
+
+    async def _crawl_company_months(self, context, company: Company, units: list[MonthCrawlResult]):
+        """회사별 탭에서 units의 월을 차례로 수집한다. 실패는 예외 대신 unit에 남긴다."""
         page = await context.new_page()
         try:
             await page.route("**/*.{png,jpg,jpeg,gif,svg,woff,woff2}", lambda route: route.abort())
-            
-            # 바로 전표 데이터 추출 (로그인은 이미 메인 탭에서 완료됨)
-            vouchers = await self._extract_voucher_data(page, company, year, month)
-            return vouchers, company
-            
-        except Exception as e:
-            logger.error(f"{company.value} 처리 중 오류: {e}")
-            raise
+
+            # 바로 전표 페이지로 이동 (로그인은 이미 메인 탭에서 완료됨)
+            try:
+                await self._navigate_to_voucher_page(page, company, units[0].year)
+            except Exception as e:
+                logger.error(f"{company.value} 처리 중 오류: {e}")
+                for unit in units:
+                    await self._mark_failed(unit, getattr(e, "detail", None) or str(e))
+                return
+
+            for unit in units:
+                await self._extract_month(page, unit)
         finally:
             await page.close()
 
@@ -240,11 +278,6 @@ class Whg:
             return False
     
     
-    async def _extract_voucher_data(self, page: Page, company: Company, year: int, month: int) -> list:
-        """전표 데이터 추출 로직"""
-        await self._navigate_to_voucher_page(page, company, year)
-        return await self._extract_monthly_vouchers(page, year, month, company)
-    
     async def _navigate_to_voucher_page(self, page: Page, company: Company, year: int):
         """전표 페이지로 직접 URL 이동"""
         gisu = self.calculate_gisu(company, year)
@@ -274,39 +307,56 @@ class Whg:
         return url
     
 
-    async def _extract_monthly_vouchers(self, page: Page, year: int, month: int, company: Company) -> list:
-        """월별 데이터 추출"""
-        all_vouchers = []
-        months = [f"{i:02d}" for i in range(1, 13)] if month is None else [f"{month:02d}"]
-        current_month_str = datetime.now().strftime("%m")
-        current_year_str = datetime.now().strftime("%Y")
+    async def _extract_month(self, page: Page, unit: MonthCrawlResult):
+        """한 달치 전표 추출"""
+        year, month, company = unit.year, f"{unit.month:02d}", unit.company
+        logger.info(f"{company.value} {year}년 {month}월 데이터 추출을 시작합니다.")
 
-        for month in months:
-            if str(year) == current_year_str and month > current_month_str:
-                break
+        try:
+            async with page.expect_response(
+                lambda r: r.request.method == "GET" and f"start_date={year}{month}" in r.url and COMPANY_CONFIGS[company]["cno"] in r.url,
+                timeout=15000
+            ) as response_info:
+                await self._set_month_input(page, month)
 
-            logger.info(f"{year}년 {month}월 데이터 추출을 시작합니다.")
-            
-            try:
-                async with page.expect_response(
-                    lambda r: r.request.method == "GET" and f"start_date={year}{month}" in r.url and COMPANY_CONFIGS[company]["cno"] in r.url,
-                    timeout=15000
-                ) as response_info:
-                    await self._set_month_input(page, month)
-                
-                response = await response_info.value
-                vouchers = await self._parse_voucher_response(response, year, month, company)
-                all_vouchers.extend(vouchers)
+            response = await response_info.value
+            vouchers = await self._parse_voucher_response(response, year, month, company)
+        except PlaywrightTimeoutError:
+            logger.warning(f"전표 데이터 요청 시간 초과: {company.value} {year}년 {month}월")
+            await self._mark_failed(unit, "전표 데이터 요청 시간 초과")
+            return
+        except Exception as e:
+            logger.error(f"{company.value} {year}년 {month}월 처리 중 오류 발생: {e}")
+            await self._mark_failed(unit, getattr(e, "detail", None) or str(e))
+            return
 
-            except PlaywrightTimeoutError:
-                logger.warning(f"전표 데이터 요청 시간 초과: {year}년 {month}월, 해당 월 건너뛀")
-                continue
-            except Exception as e:
-                logger.error(f"{year}년 {month}월 처리 중 오류 발생: {e}")
-                continue
-        
-        logger.info(f"총 {len(all_vouchers)}개의 전표를 가져왔습니다.")
-        return all_vouchers
+        for voucher in vouchers:
+            voucher.company = company.value
+        unit.attempts += 1
+        unit.status = CrawlUnitStatus.FETCHED
+        unit.vouchers = vouchers
+        unit.error = None
+        if self.on_progress:
+            await self.on_progress({
+                "event": "month_fetched",
+                "company": company.value,
+                "year": year,
+                "month": unit.month,
+                "rows_parsed": len(vouchers),
+            })
+
+    async def _mark_failed(self, unit: MonthCrawlResult, error: str):
+        unit.attempts += 1
+        unit.error = error
+        if self.on_progress:
+            await self.on_progress({
+                "event": "month_failed",
+                "company": unit.company.value,
+                "year": unit.year,
+                "month": unit.month,
+                "attempt": unit.attempts,
+                "error": error,
+            })
     
     async def _set_month_input(self, page: Page, month: str):
         """월 선택기에서 월을 변경"""
@@ -333,36 +383,35 @@ class Whg:
 
     
     async def _parse_voucher_response(self, response: Response, year: int, month: str, company: Company) -> list:
-        """전표 데이터 파싱"""
+        """전표 데이터 파싱. 응답 오류나 파싱 실패는 CrawlingError (빈 목록은 그 달 전표가 없다는 뜻)"""
         if response.status != 200:
-            logger.warning(f"전표 데이터 요청 실패 ({year}년 {month}월): HTTP {response.status}")
-            return []
+            raise CrawlingError(f"전표 데이터 요청 실패 ({year}년 {month}월): HTTP {response.status}")
         
         try:
             body = self._decompress_response_body(await response.body())
             target_data = json.loads(body)
-            
-            voucher_list = target_data.get("list", [])
-            logger.info(f"{year}년 {month}월: {len(voucher_list)}개의 전표를 가져왔습니다.")
-            
-            if not voucher_list:
-                return []
-            
-            return self._convert_to_voucher_objects(voucher_list, company)
-            
         except Exception as e:
-            logger.warning(f"전표 데이터 파싱 실패 ({year}년 {month}월): {e}")
+            raise CrawlingError(f"전표 데이터 파싱 실패 ({year}년 {month}월): {e}")
+
+        voucher_list = target_data.get("list", [])
+        logger.info(f"{year}년 {month}월: {len(voucher_list)}개의 전표를 가져왔습니다.")
+
+        if not voucher_list:
             return []
+
+        return self._convert_to_voucher_objects(voucher_list, company)
     
     def _convert_to_voucher_objects(self, voucher_list: list, company: Company) -> list:
-        """Voucher 객체 변환 로직"""
+        """Voucher 객체 변환 로직
+
+        한 건이라도 변환에 실패하면 그 달을 실패로 처리한다 (빠진 전표가 DB에서 삭제되지 않도록).
+        """
         vouchers = []
         for entry in voucher_list:
+            entry_dict = dict(entry)
             try:
-                entry_dict = dict(entry)
                 entry_dict["id"] = str(entry_dict["sq_acttax2"]) + "_" + company.value
                 vouchers.append(Voucher(**entry_dict))
             except Exception as e:
-                logger.error(f"전표 객체 변환 실패: {entry_dict.get('sq_acttax2', 'N/A')} - {e}")
-                continue
+                raise CrawlingError(f"전표 객체 변환 실패: {entry_dict.get('sq_acttax2', 'N/A')} - {e}")
         return vouchers
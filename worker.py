@@ -0,0 +1,60 @@
+"""백그라운드 워커 프로세스
+
+    python -m worker
+
+HTTP를 띄우지 않고 스케줄러(전표 크롤링, 캘린더 재시도, 텔레그램 요약 등)와
+백그라운드 작업 큐(법적 문서 PDF, 무결성 기록, 캘린더 동기화)만 실행한다.
+API 서버는 작업을 등록만 하므로, API 파드는 RUN_BACKGROUND_WORKERS=false로 띄우고
+워커 파드를 따로 늘리거나 메모리를 제한할 수 있다. 스케줄 작업은 워커가 여러 개여도
+리더로 선출된 하나만 실행한다.
+"""
+import asyncio
+import signal
+
+from common.db import client, init_db
+from containers import Container
+from utils.legal_pdf import start_pdf_render_pool, shutdown_pdf_render_pool
+from utils.logger import logger
+from utils.scheduler import start_scheduler, shutdown_scheduler, run_leader_election
+
+
+async def run_background_workers(container: Container, stop_event: asyncio.Event) -> None:
+    """stop_event가 설정될 때까지 스케줄러와 작업 큐 워커를 실행한다 (API 서버 lifespan에서도 사용)"""
+    start_scheduler()
+    start_pdf_render_pool()
+    try:
+        await asyncio.gather(
+            container.job_queue_service().run_worker(stop_event),
+            # 스케줄러 작업은 리더로 선출된 프로세스만 실행한다
+            run_leader_election(stop_event),
+        )
+    finally:
+        shutdown_scheduler()
+        shutdown_pdf_render_pool()
+
+
+async def run() -> None:
+    await init_db()
+    container = Container()
+
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop_event.set)
+
+    logger.info("Background worker process started")
+    try:
+        await asyncio.gather(
+            run_background_workers(container, stop_event),
+            # 다른 프로세스에서 보낸 캐시 무효화를 메모리 캐시에 반영
+            container.cache_service().run_invalidation_listener(stop_event),
+        )
+        # 작업 중 모아 둔 결재 알림 전송
+        await container.notification_aggregator().flush()
+    finally:
+        client.close()
+        logger.info("Background worker process stopped")
+
+
+if __name__ == "__main__":
+    asyncio.run(run())